@@ -0,0 +1,122 @@
+import numpy as np
+
+
+def prefix_function(sequence):
+    """KMP failure function: pi[i] is the longest proper border of sequence[:i + 1]"""
+    pi = [0] * len(sequence)
+    k = 0
+    for i in range(1, len(sequence)):
+        while k and sequence[i] != sequence[k]:
+            k = pi[k - 1]
+        if sequence[i] == sequence[k]:
+            k += 1
+        pi[i] = k
+    return pi
+
+
+def periods(sequence):
+    """All periods p of sequence (sequence[i] == sequence[i + p]) in increasing order, in O(n)"""
+    n = len(sequence)
+    if not n:
+        return []
+    pi = prefix_function(sequence)
+    found = []
+    border = pi[-1]
+    while border:
+        found.append(n - border)
+        border = pi[border - 1]
+    found.append(n)
+    return found
+
+
+def minimal_period(sequence):
+    return periods(sequence)[0] if len(sequence) else 0
+
+
+class CycleDetector:
+    """Finds the repeating rotation in encoded shift sequences.
+
+    A period p is accepted if it lies in [min_period, min(max_period, n)],
+    the sequence is either an exact number of cycles or holds at least two
+    full cycles plus a partial trailing one, and at most max_mismatches
+    days disagree with the cycle. The cycle is the majority token of each
+    phase, and the smallest acceptable period wins. Exact detection walks
+    the KMP border chain; tolerant and batched detection compares every
+    candidate period for a whole group of equal-length rows with array
+    operations.
+    """
+
+    VOCAB = 6  # Padding plus the five shift tokens
+
+    def __init__(self, min_period=3, max_period=14, max_mismatches=0):
+        self.min_period = min_period
+        self.max_period = max_period
+        self.max_mismatches = max_mismatches
+        self.token_range = np.arange(1, self.VOCAB, dtype=np.uint8)
+
+    def accepts_length(self, p, n):
+        return self.min_period <= p <= min(self.max_period, n) and (n % p == 0 or n >= 2 * p)
+
+    def detect(self, sequence):
+        """The repeating cycle of one sequence as bytes, or None"""
+        if self.max_mismatches:
+            return self.detect_many([sequence])[0]
+        for p in periods(sequence):
+            if self.accepts_length(p, len(sequence)):
+                return bytes(sequence[:p])
+        return None
+
+    def detect_many(self, sequences):
+        """detect for a list of sequences, batched by length"""
+        results = [None] * len(sequences)
+        by_length = {}
+        for i, sequence in enumerate(sequences):
+            by_length.setdefault(len(sequence), []).append(i)
+
+        for n, rows in by_length.items():
+            tokens = np.frombuffer(b"".join(bytes(sequences[i]) for i in rows), dtype=np.uint8).reshape(len(rows), n)
+            for row, cycle in zip(rows, self._detect_block(tokens)):
+                results[row] = cycle
+        return results
+
+    def _detect_block(self, tokens):
+        """Cycles for a (rows, n) token matrix: smallest acceptable period per row"""
+        n_rows, n = tokens.shape
+        cycles = [None] * n_rows
+        pending = np.ones(n_rows, dtype=bool)
+        for p in range(self.min_period, min(self.max_period, n) + 1):
+            if not pending.any():
+                break
+            if not self.accepts_length(p, n):
+                continue
+            block = tokens[pending]
+            if self.max_mismatches:
+                majority, mismatches = self._phase_majority(block, p)
+            else:
+                # Exact: p is a period iff the sequence equals itself shifted by p
+                majority = block[:, :p]
+                mismatches = (block[:, p:] != block[:, :-p]).sum(axis=1)
+
+            accepted = mismatches <= self.max_mismatches
+            rows = np.flatnonzero(pending)[accepted]
+            for row, cycle in zip(rows, majority[accepted].astype(np.uint8)):
+                cycles[row] = cycle.tobytes()
+            pending[rows] = False
+        return cycles
+
+    def _phase_majority(self, block, p):
+        """Majority token of each of the p phases, and how many days disagree with it"""
+        n_rows, n = block.shape
+        # Fold the sequence into rows of p days (padding the partial last cycle with 0)
+        n_cycles = -(-n // p)
+        folded = np.zeros((n_rows, n_cycles * p), dtype=np.uint8)
+        folded[:, :n] = block
+        folded = folded.reshape(n_rows, n_cycles, p)
+
+        # Per phase, how often each token occurs across the cycles
+        counts = np.zeros((n_rows, p, self.VOCAB - 1), dtype=np.int32)
+        for cycle in range(n_cycles):
+            counts += folded[:, cycle, :, np.newaxis] == self.token_range
+        majority = counts.argmax(axis=2) + 1
+        mismatches = n - counts.max(axis=2).sum(axis=1)
+        return majority, mismatches
@@ -0,0 +1,108 @@
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+
+HeaderDate = namedtuple("HeaderDate", ["date", "weekday", "text"])
+
+
+class DateHeaderService:
+    """Parses roster date headers once and shares the result.
+
+    The dominant format of a header row is inferred once from all of its
+    headers and tried first for every header, so a row of "01/02/2025"-style
+    headers is read consistently as day/month or month/day instead of
+    header by header. Individual strptime results are cached, and so is the finished
+    column -> HeaderDate(date, weekday, text) map for each header row.
+    """
+
+    DATE_FORMATS = [
+        "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%b-%y", "%d %B %Y",
+        "%d-%m-%y", "%m-%d-%y", "%y-%m-%d", "%d/%m/%y", "%m/%d/%y",
+        "%d-%m-%Y"
+    ]
+    OUTPUT_FORMAT = "%d-%m-%Y"
+    NORMALIZE_VERSION = 2  # Bump when normalize() renames headers differently; keys cached imports
+
+    def __init__(self, formats=None, cache_size=64):
+        self.formats = list(formats or self.DATE_FORMATS)
+        self.cache_size = cache_size
+        self.parsed = {}            # (header text, format) -> datetime or None
+        self.maps = OrderedDict()   # Header row -> {column: HeaderDate}
+        self.lock = threading.Lock()  # Imports parse headers on worker threads
+
+    def _parse(self, text, fmt):
+        key = (text, fmt)
+        if key not in self.parsed:
+            if len(self.parsed) > 100000:
+                self.parsed.clear()
+            try:
+                self.parsed[key] = datetime.strptime(text, fmt)
+            except ValueError:
+                self.parsed[key] = None
+        return self.parsed[key]
+
+    @staticmethod
+    def _candidates(headers):
+        """Stripped text of the string headers that could be dates"""
+        return [header.strip() for header in headers
+                if isinstance(header, str) and any(char.isdigit() for char in header)]
+
+    def infer_format(self, headers):
+        """The format that parses the most headers (earlier formats win ties), or None"""
+        candidates = self._candidates(headers)
+        best, best_count = None, 0
+        for fmt in self.formats:
+            count = sum(self._parse(text, fmt) is not None for text in candidates)
+            if count > best_count:
+                best, best_count = fmt, count
+        return best
+
+    def date_map(self, columns):
+        """{column: HeaderDate} for the columns whose header is a date"""
+        key = tuple(columns)
+        with self.lock:
+            dates = self.maps.get(key)
+            if dates is None:
+                dates = self._build_map(key)
+                self.maps[key] = dates
+                if len(self.maps) > self.cache_size:
+                    self.maps.popitem(last=False)
+            else:
+                self.maps.move_to_end(key)
+        return dates
+
+    def _build_map(self, key):
+        dominant = self.infer_format(key)
+        formats = self.formats if dominant is None else [dominant] + [f for f in self.formats if f != dominant]
+        dates = {}
+        for col in key:
+            dt = None
+            if isinstance(col, datetime):
+                dt = col
+            elif isinstance(col, str) and any(char.isdigit() for char in col):
+                text = col.strip()
+                for fmt in formats:
+                    dt = self._parse(text, fmt)
+                    if dt is not None:
+                        break
+            if dt is not None:
+                dates[col] = HeaderDate(dt, dt.weekday(), dt.strftime(self.OUTPUT_FORMAT))
+        return dates
+
+    def normalize(self, df):
+        """Rename date headers to OUTPUT_FORMAT and strip the other string headers"""
+        dates = self.date_map(df.columns)
+        new_columns = []
+        for col in df.columns:
+            if col in dates:
+                new_columns.append(dates[col].text)
+            elif isinstance(col, str):
+                new_columns.append(col.strip())
+            else:
+                new_columns.append(col)
+        df.columns = new_columns
+        return df
+
+
+# One instance shared by the processor and the data bots, so they share its caches
+date_headers = DateHeaderService()
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EditDistanceEngine:
+    """Bit-parallel Levenshtein distance (Myers / Hyyro) over token sequences.
+
+    Sequences can be strings, bytes, lists or NumPy arrays of small integer
+    tokens. The longer sequence is packed into per-token bit masks, so each
+    token of the other sequence costs a handful of big-integer operations
+    instead of a full row of the dynamic programming table. Passing
+    max_distance enables threshold mode: the scan stops as soon as the
+    distance can no longer come in at or under the threshold and
+    max_distance + 1 is returned.
+    """
+
+    def __init__(self, cache_size=256):
+        self.cache_size = cache_size
+        self._mask_cache = OrderedDict()  # Packed bit masks of recently used sequences
+
+    def _tokens(self, sequence):
+        if isinstance(sequence, np.ndarray):
+            return sequence.tolist()
+        return sequence
+
+    def _masks(self, sequence):
+        """Per-token bit masks of the positions where each token occurs"""
+        key = sequence if isinstance(sequence, (str, bytes, tuple)) else tuple(sequence)
+        masks = self._mask_cache.get(key)
+        if masks is not None:
+            self._mask_cache.move_to_end(key)
+            return masks
+
+        masks = {}
+        bit = 1
+        for token in sequence:
+            masks[token] = masks.get(token, 0) | bit
+            bit <<= 1
+        self._mask_cache[key] = masks
+        if len(self._mask_cache) > self.cache_size:
+            self._mask_cache.popitem(last=False)
+        return masks
+
+    def _scan(self, masks, length, other, max_distance):
+        """Run the other sequence against the packed one and return the distance"""
+        other_len = len(other)
+        if length == 0:
+            return other_len
+        if max_distance is not None and abs(length - other_len) > max_distance:
+            return max_distance + 1
+
+        full = (1 << length) - 1
+        last = 1 << (length - 1)
+        positive, negative = full, 0
+        score = length
+        for remaining, token in zip(range(other_len - 1, -1, -1), other):
+            eq = masks.get(token, 0)
+            xv = eq | negative
+            xh = (((eq & positive) + positive) ^ positive) | eq
+            h_positive = negative | (~(xh | positive) & full)
+            h_negative = positive & xh
+            if h_positive & last:
+                score += 1
+            elif h_negative & last:
+                score -= 1
+            h_positive = ((h_positive << 1) | 1) & full
+            h_negative = (h_negative << 1) & full
+            positive = h_negative | (~(xv | h_positive) & full)
+            negative = h_positive & xv
+
+            # Each remaining token can lower the score by at most one
+            if max_distance is not None and score - remaining > max_distance:
+                return max_distance + 1
+        if max_distance is not None and score > max_distance:
+            return max_distance + 1
+        return score
+
+    def distance(self, s1, s2, max_distance=None):
+        """Levenshtein distance between two sequences"""
+        s1, s2 = self._tokens(s1), self._tokens(s2)
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+        return self._scan(self._masks(s1), len(s1), s2, max_distance)
+
+    def distance_many(self, pattern, candidates, max_distance=None):
+        """Distances from one pattern to many candidates, packing the pattern only once"""
+        pattern = self._tokens(pattern)
+        masks = self._masks(pattern)
+        distances = []
+        for candidate in candidates:
+            candidate = self._tokens(candidate)
+            if len(candidate) > len(pattern):
+                distances.append(self.distance(candidate, pattern, max_distance))
+            else:
+                distances.append(self._scan(masks, len(pattern), candidate, max_distance))
+        return distances
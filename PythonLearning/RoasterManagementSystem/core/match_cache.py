@@ -0,0 +1,78 @@
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+
+class MatchCache:
+    """detect_best_matches results keyed by the encoded shift sequence (ShiftPattern bytes).
+
+    Everything is dropped when the generation (pattern codes and model
+    version) changes. Results of the fallback stages also depend on the
+    pattern confidence counters, so they carry the confidence version they
+    were computed at and miss once it moves on. Entries that do not depend
+    on confidence can be saved and reloaded across sessions under a
+    signature of the codes and model weights; like the other stores, the
+    file defaults to the working directory.
+    """
+
+    def __init__(self, path="match_cache.pkl", max_size=100000):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.entries = OrderedDict()  # Sequence bytes -> (code, confidence, confidence version or None)
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+
+    def check_generation(self, generation):
+        """Drop every entry if the pattern codes or the model changed since the last call"""
+        if generation != self.generation:
+            self.entries.clear()
+            self.generation = generation
+
+    def get(self, key, confidence_version=None):
+        """(code, confidence) for a sequence, or None"""
+        entry = self.entries.get(key)
+        if entry is None or (entry[2] is not None and entry[2] != confidence_version):
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, key, code, confidence, confidence_version=None):
+        """Remember a result; pass confidence_version if it depended on the confidence counters"""
+        self.entries[key] = (code, float(confidence), confidence_version)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def save(self, signature):
+        """Write the confidence-independent entries, tagged with signature"""
+        entries = {key: entry for key, entry in self.entries.items() if entry[2] is None}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'signature': signature, 'entries': entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving match cache: {e}")
+
+    def load(self, signature):
+        """Merge saved entries if they were written under the same signature; returns how many"""
+        if not self.path.exists():
+            return 0
+        try:
+            with open(self.path, 'rb') as f:
+                saved = pickle.load(f)
+            entries = saved['entries'] if saved.get('signature') == signature else {}
+            loaded = {key: (code, float(confidence), None) for key, (code, confidence, _) in entries.items()}
+        except Exception as e:  # Truncated or foreign file: start empty, the next save replaces it
+            print(f"Error loading match cache: {e}")
+            return 0
+        for key, entry in loaded.items():
+            self.entries.setdefault(key, entry)
+        return len(loaded)
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+
+class PatternGroups:
+    """Rows of a pattern table grouped by their encoded shift sequence.
+
+    Most rows of a roster share one of a few dozen sequences, so expensive
+    per-pattern work is done once per group (weighted by counts where it
+    matters) and the results are broadcast back to the rows.
+    """
+
+    def __init__(self, pattern_table):
+        self.index = pattern_table.index
+        inverse, uniques = pd.factorize(pattern_table['Encoded'])
+        self.inverse = np.asarray(inverse, dtype=np.int64)  # Row position -> group
+        self.sequences = list(uniques)
+        first_rows = np.unique(self.inverse, return_index=True)[1]
+        self.patterns = list(pattern_table['Pattern'].to_numpy()[first_rows])
+        self.counts = np.bincount(self.inverse, minlength=len(uniques))
+
+    def __len__(self):
+        return len(self.sequences)
+
+    def rows(self, group):
+        """Row labels of one group"""
+        return self.index[self.inverse == group]
+
+    def row_labels(self):
+        """Row labels of every group, in group order"""
+        if not len(self):
+            return []
+        order = np.argsort(self.inverse, kind="stable")
+        bounds = np.cumsum(self.counts)[:-1]
+        return [self.index[positions] for positions in np.split(order, bounds)]
+
+    def broadcast(self, values):
+        """Per-group values -> per-row list"""
+        return [values[group] for group in self.inverse]
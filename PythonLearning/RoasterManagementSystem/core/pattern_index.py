@@ -0,0 +1,123 @@
+import heapq
+import math
+from collections import Counter, defaultdict
+
+
+class PatternCodeIndex:
+    """Precomputed index over PATTERN_CODES for nearest-code semantic search.
+
+    Codes are bucketed by length and carry cached features and character
+    profiles. A query walks buckets and codes best-first by an upper bound on
+    their score. When a bucket is expanded its edit distances are computed in
+    one banded batch that drops codes which can no longer reach the best
+    score, and the exact (expensive) similarity only runs for candidates that
+    can still beat the best score found so far, so it returns exactly what a
+    full scan over every code would.
+    """
+
+    # Slack for float rounding between the bound and the exact score
+    EPSILON = 1e-9
+
+    def __init__(self, codes, scorer):
+        self.codes = list(codes)
+        self.scorer = scorer
+        self.features = [scorer.get_pattern_features(code) for code in self.codes]
+        self.char_profiles = [Counter(code) for code in self.codes]
+
+        # Length buckets: code length -> code positions
+        self.buckets = defaultdict(list)
+        for idx, code in enumerate(self.codes):
+            self.buckets[len(code)].append(idx)
+
+    def _length_bound(self, pattern_len, code_len):
+        """Best possible similarity between strings of the given lengths"""
+        if pattern_len + code_len == 0:
+            return 0.2
+        shortest, longest = min(pattern_len, code_len), max(pattern_len, code_len)
+        return 0.5 * (2 * shortest / (pattern_len + code_len)) + 0.3 * (shortest / longest) + 0.2
+
+    def _max_distance(self, pattern_len, code_len, best_score, bonus):
+        """Largest edit distance that still lets a code of this length reach best_score"""
+        longest = max(pattern_len, code_len)
+        if best_score <= 0 or longest == 0:
+            return None
+        shortest = min(pattern_len, code_len)
+        needed = (best_score - bonus) / 100 - 0.5 * (2 * shortest / (pattern_len + code_len)) - 0.2
+        return math.floor(longest * (1 - needed / 0.3) + 1e-6)
+
+    def _code_bound(self, idx, pattern_len, char_profile, distance, pattern_features):
+        """Upper bound on semantic_similarity(pattern, code) given the exact edit distance"""
+        code_len = len(self.codes[idx])
+        longest = max(pattern_len, code_len)
+        if longest == 0:
+            return 0.0
+
+        # SequenceMatcher can match at most the shared characters (its quick_ratio)
+        shared_chars = sum((char_profile & self.char_profiles[idx]).values())
+        alignment_bound = 2 * shared_chars / (pattern_len + code_len)
+
+        edit_score = 1 - distance / longest
+        context_sim = self.scorer.feature_similarity(pattern_features, self.features[idx])
+        return 0.5 * alignment_bound + 0.3 * edit_score + 0.2 * context_sim
+
+    def best_match(self, pattern, confidence):
+        """Return (code, similarity) of the best scoring code, or (None, 0.0)"""
+        pattern_features = self.scorer.get_pattern_features(pattern)
+        pattern_str = str(pattern)  # Codes are free text, so compare the string form
+        pattern_len = len(pattern_str)
+        char_profile = Counter(pattern_str)
+        engine = self.scorer.edit_engine
+        max_confidence = max((confidence.get(code, 0) for code in self.codes), default=0)
+
+        def score_bound(similarity_bound, length_match):
+            return similarity_bound * 100 + max_confidence + (20 if length_match else 0)
+
+        # Best-first search over buckets, then codes, ordered by score upper bound
+        heap = []
+        for code_len, members in self.buckets.items():
+            bound = score_bound(self._length_bound(pattern_len, code_len), code_len == pattern_len)
+            heapq.heappush(heap, (-bound, 0, code_len, members))
+
+        best_idx = None
+        best_score = 0
+        best_similarity = 0.0
+        while heap:
+            neg_bound, kind, key, payload = heapq.heappop(heap)
+            if -neg_bound + self.EPSILON < best_score:
+                break
+
+            if kind == 0:
+                # Expand a length bucket: banded edit distances for all of its codes at once,
+                # dropping codes too far away to reach the current best score
+                bonus = max_confidence + (20 if key == pattern_len else 0)
+                max_distance = self._max_distance(pattern_len, key, best_score, bonus)
+                members = payload
+                distances = engine.distance_many(pattern_str, [self.codes[idx] for idx in members],
+                                                 max_distance)
+                for idx, distance in zip(members, distances):
+                    if max_distance is not None and distance > max_distance:
+                        continue
+                    bound = self._code_bound(idx, pattern_len, char_profile, distance,
+                                             pattern_features)
+                    bound = bound * 100 + confidence.get(self.codes[idx], 0) + \
+                        (20 if key == pattern_len else 0)
+                    heapq.heappush(heap, (-bound, 1, idx, distance))
+                continue
+
+            # Exact score, computed exactly as the full scan does
+            code = self.codes[key]
+            similarity = self.scorer.semantic_similarity(pattern_str, code, pattern_features,
+                                                         self.features[key], edit_distance=payload)
+            score = similarity * 100 + confidence.get(code, 0)
+            if pattern_len == len(code):
+                score += 20
+
+            # Ties go to the earlier code, as in an in-order scan
+            if score > best_score or (score == best_score and best_idx is not None and key < best_idx):
+                best_idx = key
+                best_score = score
+                best_similarity = similarity
+
+        if best_idx is None:
+            return None, 0.0
+        return self.codes[best_idx], best_similarity
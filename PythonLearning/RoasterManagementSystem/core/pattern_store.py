@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class PatternJournalStore:
+    """Write-behind persistence for the learned pattern -> code mapping.
+
+    The mapping lives in a JSON snapshot (learned_patterns.json) plus an
+    append-only journal of JSON lines. Learning a pattern only queues a
+    journal line; queued lines are written and fsynced together once
+    batch_size of them are waiting or flush_interval seconds after the
+    first one (group commit). Once the journal holds compact_after entries
+    it is folded into a new snapshot, written to a temporary file and
+    swapped in with os.replace, so a crash leaves either the old or the new
+    snapshot. Replaying the journal over the snapshot is idempotent, and a
+    torn last line is ignored.
+    """
+
+    def __init__(self, snapshot_path="learned_patterns.json", journal_path=None,
+                 batch_size=256, flush_interval=2.0, compact_after=5000):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path) if journal_path else self.snapshot_path.with_suffix(".journal")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compact_after = compact_after
+        self.mapping = {}
+        self.pending = []
+        self.journal_entries = 0
+        self.timer = None
+        self.lock = threading.RLock()
+
+    def load(self):
+        """Read the snapshot and replay the journal; returns the live mapping"""
+        with self.lock:
+            mapping = {}
+            if self.snapshot_path.exists():
+                try:
+                    with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                        mapping = json.load(f)
+                except Exception as e:
+                    print(f"Error loading patterns: {e}")
+
+            entries = 0
+            torn = False
+            if self.journal_path.exists():
+                with open(self.journal_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            torn = True  # Torn write at the end of the journal
+                            break
+                        mapping[entry['pattern']] = entry['code']
+                        entries += 1
+
+            self.mapping = mapping
+            self.pending = []
+            self.journal_entries = entries
+            if torn:
+                # Later appends would land behind the torn line, so fold the journal away first
+                self.compact()
+            return self.mapping
+
+    def set(self, pattern, code):
+        """Update the mapping and queue the change for the next group commit"""
+        with self.lock:
+            self.mapping[pattern] = code
+            self.pending.append((pattern, code))
+            if len(self.pending) >= self.batch_size:
+                self._flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.flush_interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Write queued changes to the journal now"""
+        with self.lock:
+            self._flush()
+
+    def compact(self):
+        """Fold everything into a fresh snapshot and empty the journal"""
+        with self.lock:
+            self._cancel_timer()
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.mapping, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            # The snapshot now covers every journal entry, so the journal can go
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+            self.pending = []
+            self.journal_entries = 0
+
+    def close(self):
+        self.compact()
+
+    def _cancel_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def _flush(self):
+        self._cancel_timer()
+        if not self.pending:
+            return
+        lines = "".join(json.dumps({'pattern': pattern, 'code': code}) + "\n" for pattern, code in self.pending)
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"Error saving patterns: {e}")
+            return  # Keep the batch queued for the next attempt
+        self.journal_entries += len(self.pending)
+        self.pending = []
+        if self.journal_entries >= self.compact_after:
+            try:
+                self.compact()
+            except OSError as e:
+                print(f"Error compacting patterns: {e}")
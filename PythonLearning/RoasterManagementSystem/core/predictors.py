@@ -0,0 +1,196 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+def pad_sequences(sequences, maxlen=42, value=0):
+    """Pad token sequences at the end to a fixed length, keeping the last maxlen tokens"""
+    padded = np.full((len(sequences), maxlen), value, dtype=np.int32)
+    for row, sequence in enumerate(sequences):
+        sequence = list(sequence)[-maxlen:]
+        padded[row, :len(sequence)] = sequence
+    return padded
+
+
+class PatternPredictor(ABC):
+    """Interface for the models behind predict_pattern/train_model.
+
+    Inputs are padded token matrices (one row per pattern, 0 = padding) and
+    labels are indices into PATTERN_CODES. predict_proba returns one row of
+    class probabilities per pattern. fit reports progress(done, total) if a
+    progress callback is given, and sample_weight lets one row stand for
+    several identical ones.
+    """
+
+    name = None
+    weights_file = None
+
+    def __init__(self, n_classes, seq_len=42):
+        self.n_classes = n_classes
+        self.seq_len = seq_len
+
+    def build(self):
+        """Do any expensive setup (imports, graph construction)"""
+
+    @abstractmethod
+    def fit(self, X, y, progress=None, sample_weight=None):
+        pass
+
+    @abstractmethod
+    def predict_proba(self, X, batch_size=256):
+        pass
+
+    @abstractmethod
+    def load(self, path):
+        pass
+
+    @abstractmethod
+    def save(self, path):
+        pass
+
+
+class NgramPatternPredictor(PatternPredictor):
+    """Multinomial naive Bayes over shift unigram, bigram and trigram counts.
+
+    Training is a single matrix product over the count features, so it runs
+    in milliseconds, and prediction is one more product plus a softmax.
+    """
+
+    name = "ngram"
+    weights_file = "pattern_model.ngram.npz"
+    VOCAB = 6  # Padding plus the five shift tokens
+
+    def __init__(self, n_classes, seq_len=42, alpha=0.5):
+        super().__init__(n_classes, seq_len)
+        self.alpha = alpha
+        self.n_features = self.VOCAB + self.VOCAB ** 2 + self.VOCAB ** 3
+        self.feature_counts = np.zeros((n_classes, self.n_features))
+        self.class_counts = np.zeros(n_classes)
+        self._update_log_probs()
+
+    def features(self, X):
+        """N-gram count matrix, ignoring n-grams that touch padding"""
+        X = np.clip(np.asarray(X, dtype=np.int64), 0, self.VOCAB - 1)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        n_rows = X.shape[0]
+        v = self.VOCAB
+
+        grams = [(X, X > 0, 0)]
+        if X.shape[1] > 1:
+            grams.append((X[:, :-1] * v + X[:, 1:], (X[:, :-1] > 0) & (X[:, 1:] > 0), v))
+        if X.shape[1] > 2:
+            grams.append((X[:, :-2] * v * v + X[:, 1:-1] * v + X[:, 2:],
+                          (X[:, :-2] > 0) & (X[:, 1:-1] > 0) & (X[:, 2:] > 0), v + v * v))
+
+        rows, ids = [], []
+        for gram_ids, valid, offset in grams:
+            row_idx = np.broadcast_to(np.arange(n_rows)[:, np.newaxis], gram_ids.shape)
+            rows.append(row_idx[valid])
+            ids.append(gram_ids[valid] + offset)
+        flat = np.concatenate(rows) * self.n_features + np.concatenate(ids)
+        counts = np.bincount(flat, minlength=n_rows * self.n_features)
+        return counts.reshape(n_rows, self.n_features).astype(np.float64)
+
+    def _update_log_probs(self):
+        smoothed = self.feature_counts + self.alpha
+        self.log_feature_probs = np.log(smoothed / smoothed.sum(axis=1, keepdims=True))
+        total = self.class_counts.sum()
+        with np.errstate(divide='ignore'):
+            if total > 0:
+                self.log_priors = np.log(self.class_counts / total)
+            else:
+                self.log_priors = np.zeros(self.n_classes)
+
+    def fit(self, X, y, progress=None, sample_weight=None):
+        features = self.features(X)
+        labels = np.zeros((features.shape[0], self.n_classes))
+        weights = 1 if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+        labels[np.arange(features.shape[0]), np.asarray(y, dtype=np.int64)] = weights
+        self.feature_counts = labels.T @ features
+        self.class_counts = labels.sum(axis=0)
+        self._update_log_probs()
+        if progress:
+            progress(1, 1)
+
+    def predict_proba(self, X, batch_size=256):
+        scores = self.features(X) @ self.log_feature_probs.T + self.log_priors
+        scores -= scores.max(axis=1, keepdims=True)
+        probs = np.exp(scores)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def load(self, path):
+        data = np.load(path)
+        if data['feature_counts'].shape != self.feature_counts.shape:
+            raise ValueError("saved model was trained for a different set of pattern codes")
+        self.feature_counts = data['feature_counts']
+        self.class_counts = data['class_counts']
+        self._update_log_probs()
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            np.savez(f, feature_counts=self.feature_counts, class_counts=self.class_counts)
+
+
+class KerasPatternPredictor(PatternPredictor):
+    """The original embedding + Bi-LSTM network, built with TensorFlow/Keras"""
+
+    name = "keras"
+    weights_file = "pattern_model.weights.h5"
+
+    def __init__(self, n_classes, seq_len=42):
+        super().__init__(n_classes, seq_len)
+        self.model = None
+
+    def build(self):
+        """Create a more robust LSTM neural network for pattern recognition"""
+        import tensorflow as tf
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense, Embedding, Bidirectional
+
+        model = Sequential([
+            Embedding(input_dim=1000, output_dim=64, input_length=self.seq_len),
+            Bidirectional(LSTM(128, return_sequences=True)),
+            Bidirectional(LSTM(64)),
+            Dense(256, activation='relu'),
+            Dense(128, activation='relu'),
+            Dense(self.n_classes, activation='softmax')
+        ])
+        model.compile(
+            optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
+            loss='sparse_categorical_crossentropy',
+            metrics=['accuracy']
+        )
+        self.model = model
+
+    def fit(self, X, y, progress=None, sample_weight=None, epochs=30):
+        import tensorflow as tf
+
+        callbacks = []
+        if progress:
+            callbacks.append(tf.keras.callbacks.LambdaCallback(
+                on_epoch_end=lambda epoch, logs: progress(epoch + 1, epochs)))
+        self.model.fit(
+            X,
+            np.asarray(y),
+            sample_weight=None if sample_weight is None else np.asarray(sample_weight, dtype=np.float32),
+            epochs=epochs,
+            batch_size=min(32, len(X)),  # Dynamic batch size
+            validation_split=min(0.2, 1 - 1/len(X)) if len(X) > 1 else 0,
+            callbacks=callbacks
+        )
+
+    def predict_proba(self, X, batch_size=256):
+        return self.model.predict(X, batch_size=batch_size, verbose=0)
+
+    def load(self, path):
+        self.model.load_weights(str(path))
+
+    def save(self, path):
+        self.model.save_weights(str(path))
+
+
+PREDICTOR_BACKENDS = {
+    NgramPatternPredictor.name: NgramPatternPredictor,
+    KerasPatternPredictor.name: KerasPatternPredictor,
+}
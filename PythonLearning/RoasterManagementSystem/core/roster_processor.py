@@ -1,26 +1,195 @@
 import pandas as pd
 import numpy as np
-import json
+import importlib.util
 import re
-from datetime import datetime
-from collections import defaultdict
+import sys
+import time
+import threading
+from collections import defaultdict, OrderedDict
+from types import MappingProxyType
+from functools import cached_property
 from difflib import SequenceMatcher
 from pathlib import Path
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Embedding, Bidirectional
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from sklearn.cluster import KMeans
+from core.pattern_index import PatternCodeIndex
+from core.edit_distance import EditDistanceEngine
+from core.predictors import PREDICTOR_BACKENDS, pad_sequences
+from core.date_headers import date_headers
+from core.cycle_detection import CycleDetector
+from core.pattern_store import PatternJournalStore
+from core.stats_store import PatternStatsStore
+from core.match_cache import MatchCache
+from core.pattern_groups import PatternGroups
+from core.parallel_matching import ParallelMatcher
 
-class RosterProcessor:
+# Token for each shift type; 0 is reserved for padding
+SHIFT_TOKENS = {"M": 1, "A": 2, "N": 3, "RD": 4, "?": 5}
+TOKEN_SHIFTS = {token: shift_type for shift_type, token in SHIFT_TOKENS.items()}
+
+
+class ShiftPattern(bytes):
+    """Compact shift pattern: one SHIFT_TOKENS byte per rostered day.
+
+    Hashable and cheap to slice or compare, so matching, features, the model
+    and clustering work on it directly. str() gives the "M-M-A-RD" form used
+    for display and for the learned pattern file.
+    """
+
+    @classmethod
+    def from_shifts(cls, shifts):
+        return cls(SHIFT_TOKENS.get(shift_type, 5) for shift_type in shifts)
+
+    @classmethod
+    def from_string(cls, pattern_str):
+        return cls.from_shifts(pattern_str.split('-')) if pattern_str else cls()
+
+    @cached_property
+    def text(self):
+        return "-".join(TOKEN_SHIFTS[token] for token in self)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"ShiftPattern('{self.text}')"
+
+    def shifts(self):
+        return [TOKEN_SHIFTS[token] for token in self]
+
+    def tokens(self):
+        return np.frombuffer(self, dtype=np.uint8)
+
+    def transitions(self):
+        tokens = self.tokens()
+        return int(np.count_nonzero(tokens[1:] != tokens[:-1]))
+
+
+class PatternScorer:
+    """Similarity scoring between shift patterns and pattern codes.
+
+    Holds no roster state, so a PatternCodeIndex built on it can be pickled
+    and shipped to worker processes.
+    """
+
+    def __init__(self):
+        self.sequence_matcher = SequenceMatcher()
+        self.edit_engine = EditDistanceEngine()
+
+    def _edit_distance(self, s1, s2, max_distance=None):
+        """Calculate edit distance between two sequences (Levenshtein distance)"""
+        return self.edit_engine.distance(s1, s2, max_distance)
+        
+    def semantic_similarity(self, pattern1, pattern2, features1=None, features2=None, edit_distance=None):
+        """Calculate semantic similarity between patterns"""
+        # Pattern codes are free text, so encoded patterns are compared in string form
+        if isinstance(pattern1, ShiftPattern):
+            features1 = features1 or self.get_pattern_features(pattern1)
+            pattern1 = str(pattern1)
+        if isinstance(pattern2, ShiftPattern):
+            features2 = features2 or self.get_pattern_features(pattern2)
+            pattern2 = str(pattern2)
+
+        # Sequence alignment similarity
+        self.sequence_matcher.set_seqs(pattern1, pattern2)
+        alignment_score = self.sequence_matcher.ratio()
+        
+        # Edit distance
+        if edit_distance is None:
+            edit_distance = self._edit_distance(pattern1, pattern2)
+        max_len = max(len(pattern1), len(pattern2))
+        normalized_edit = 1 - (edit_distance / max_len) if max_len > 0 else 0
+        
+        # Contextual similarity
+        context_sim = self.contextual_similarity(pattern1, pattern2, features1, features2)
+        
+        # Weighted combination
+        return 0.5 * alignment_score + 0.3 * normalized_edit + 0.2 * context_sim
+        
+    def contextual_similarity(self, pattern1, pattern2, features1=None, features2=None):
+        """Compare patterns based on contextual features"""
+        if features1 is None:
+            features1 = self.get_pattern_features(pattern1)
+        if features2 is None:
+            features2 = self.get_pattern_features(pattern2)
+        return self.feature_similarity(features1, features2)
+
+    def feature_similarity(self, features1, features2):
+        """Compare two pattern feature dicts"""
+        if not features1 or not features2:
+            return 0
+            
+        # Calculate feature similarity
+        feature_sim = 0
+        for key in features1:
+            if key in features2:
+                if isinstance(features1[key], (int, float)):
+                    # Normalize numerical differences
+                    max_val = max(features1[key], features2[key]) or 1
+                    diff = abs(features1[key] - features2[key])
+                    feature_sim += 1 - (diff / max_val)
+                else:
+                    # For categorical features
+                    feature_sim += 1 if features1[key] == features2[key] else 0
+                    
+        return feature_sim / len(features1) if features1 else 0
+        
+    def get_pattern_features(self, pattern_str):
+        """Extract features from pattern string or encoded pattern"""
+        if isinstance(pattern_str, ShiftPattern):
+            if pattern_str:
+                return {
+                    'length': len(pattern_str),
+                    'rd_count': pattern_str.count(SHIFT_TOKENS["RD"]),
+                    'm_count': pattern_str.count(SHIFT_TOKENS["M"]),
+                    'a_count': pattern_str.count(SHIFT_TOKENS["A"]),
+                    'n_count': pattern_str.count(SHIFT_TOKENS["N"]),
+                    'first': TOKEN_SHIFTS[pattern_str[0]],
+                    'last': TOKEN_SHIFTS[pattern_str[-1]],
+                    'transitions': pattern_str.transitions()
+                }
+            pattern_str = str(pattern_str)
+        parts = pattern_str.split('-')
+        return {
+            'length': len(parts),
+            'rd_count': parts.count("RD"),
+            'm_count': parts.count("M"),
+            'a_count': parts.count("A"),
+            'n_count': parts.count("N"),
+            'first': parts[0] if parts else "",
+            'last': parts[-1] if parts else "",
+            'transitions': self.count_transitions(parts)
+        }
+        
+    def count_transitions(self, pattern):
+        """Count shift type transitions in pattern"""
+        transitions = 0
+        for i in range(1, len(pattern)):
+            if pattern[i] != pattern[i-1]:
+                transitions += 1
+        return transitions
+
+
+class RosterProcessor(PatternScorer):
     def __init__(self):
+        super().__init__()
         self.df_original = None
         self.df_processed = None
+        self.df_patterns = None  # Derived pattern columns cached per df_processed row
+        self.df_shift_tokens = None  # Shift token grid of df_processed, kept in step with df_patterns
+        self.shift_generation = 0  # Bumped by every shift cell edit made through set_cell
+        self.patterns_key = None  # (frame, shift generation) df_patterns was computed for
+        self.shift_type_cache = OrderedDict()  # Bounded LRU cache of shift string -> shift type
+        self.date_headers = date_headers  # Shared header parsing and column -> date map
+        self.cycle_detector = CycleDetector()  # Repeating-rotation fallback; max_mismatches tolerates swapped days
+        self.shift_cache_size = 4096
+        self.shift_cache_hits = 0
+        self.shift_cache_misses = 0
         self.OFF_KEYWORDS = ['WOFF', 'W/OFF', 'RD', 'OFF', 'REST', 'RDO', 'LEAVE']
         self.SHIFT_TYPES = {
             "M": ["0600-1400", "0700-1500", "0800-1600", "0900-1700"],
             "A": ["1200-2000", "1300-2100", "1400-2200", "1500-2300"],
             "N": ["1800-0200", "1900-0300", "2000-0400", "2100-0500", "2200-0600"]
         }
+        self.SHIFT_CODES = list(SHIFT_TOKENS)
         self.PATTERN_CODES = [
             "CX-1E2N2E2RD", "CX-2E2N1E2RD", "PAX-GEN-2RD", "PAX-A-2RD", "EBT-3A2N2RD", "EY-1N4E2RD",
             "EY-31700N2RD", "EY-1E117001E1N1E2RD", "EY-217003E2RD", "EY-317002E2RD", "EY-2E217001E2RD",
@@ -39,14 +208,25 @@ class RosterProcessor:
             "MHB-1A4N2RD", "MHB-2A2E1N2RD", "EK-5M1A1RD", "EY-1E117001E2N2RD", "SQ-4M2E1RD", "SQ-5M1E1RD",
             "SV-2G2M1G1M1RD", "SV-1G4M1G1RD", "SV-5M1G1RD"
         ]
-        self.pattern_mapping = {}  # Dictionary to store learned patterns
-        self.pattern_confidence = defaultdict(int)  # Track pattern recognition confidence
+        self.pattern_store = PatternJournalStore()
+        self.pattern_mapping = self.pattern_store.mapping  # Learned patterns; change them through pattern_store.set
+        self.stats_store = PatternStatsStore()  # Persisted, decaying counters; change them through stats_store
+        self.pattern_confidence = self.stats_store.counter('confidence')  # Track pattern recognition confidence
         self.unknown_patterns = set()  # Track unrecognized patterns
-        self.pattern_statistics = defaultdict(int)  # Track pattern usage statistics
-        self.sequence_matcher = SequenceMatcher()
-        self.pattern_model = self.build_pattern_model()
+        self.pattern_statistics = self.stats_store.counter('usage')  # Track pattern usage statistics
+        self.code_index = None  # Nearest-code search index, rebuilt when PATTERN_CODES change
+        self.code_index_key = None
+        self.parallel_matcher = ParallelMatcher()  # Shards similarity matching of unknown patterns across processes
+        self.predictor_backend = self.default_predictor_backend()  # Key into PREDICTOR_BACKENDS
+        self._predictor = None  # Built on first use or by warm_up_model()
+        self.model_lock = threading.Lock()
+        self.ai_state = "cold"  # cold -> warming -> ready / unavailable
+        self.ai_error = None
+        self.model_load_seconds = None
+        self.model_version = 0  # Bumped whenever the predictor's weights change
+        self.match_cache = MatchCache()
+        self.match_cache_loaded = False
         self.load_patterns()  # Load patterns when initializing
-        self.load_trained_model()  # Load AI model if available
         
         # Predefined patterns for sequence matching
         self.predefined_patterns = {
@@ -58,50 +238,177 @@ class RosterProcessor:
             "Mixed Rotation": ["M", "A", "N", "RD", "M", "A", "N"],
             "Nights Rotation": ["N", "N", "N", "N", "RD", "RD", "RD"]
         }
+        self.predefined_sequences = {name: ShiftPattern.from_shifts(pattern_seq)
+                                     for name, pattern_seq in self.predefined_patterns.items()}
         
-    def build_pattern_model(self):
-        """Create a more robust LSTM neural network for pattern recognition"""
-        model = Sequential([
-            Embedding(input_dim=1000, output_dim=64, input_length=42),
-            Bidirectional(LSTM(128, return_sequences=True)),
-            Bidirectional(LSTM(64)),
-            Dense(256, activation='relu'),
-            Dense(128, activation='relu'),
-            Dense(len(self.PATTERN_CODES), activation='softmax')
-        ])
-        model.compile(
-            optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
-            loss='sparse_categorical_crossentropy',
-            metrics=['accuracy']
-        )
-        return model
-        
+    @property
+    def OFF_KEYWORDS(self):
+        return self._off_keywords
+
+    @OFF_KEYWORDS.setter
+    def OFF_KEYWORDS(self, keywords):
+        # Stored frozen so every change goes through here and drops stale cached types
+        self._off_keywords = tuple(keywords)
+        self.clear_shift_cache()
+
+    @property
+    def SHIFT_TYPES(self):
+        return self._shift_types
+
+    @SHIFT_TYPES.setter
+    def SHIFT_TYPES(self, shift_types):
+        self._shift_types = MappingProxyType(
+            {shift_type: tuple(timings) for shift_type, timings in shift_types.items()})
+        self.clear_shift_cache()
+
+    def clear_shift_cache(self):
+        """Forget all memoized shift classifications"""
+        self.shift_type_cache.clear()
+
+    def shift_cache_info(self):
+        """Return hit/miss counters and size of the shift type cache"""
+        return {
+            'hits': self.shift_cache_hits,
+            'misses': self.shift_cache_misses,
+            'size': len(self.shift_type_cache),
+            'max_size': self.shift_cache_size
+        }
+
+    def _lookup_shift_type(self, shift_str):
+        """Return the cached shift type for a shift string, or None on a miss"""
+        shift_type = self.shift_type_cache.get(shift_str)
+        if shift_type is None:
+            self.shift_cache_misses += 1
+        else:
+            self.shift_cache_hits += 1
+            self.shift_type_cache.move_to_end(shift_str)
+        return shift_type
+
+    def _remember_shift_type(self, shift_str, shift_type):
+        """Cache a classification, evicting the least recently used entry when full"""
+        self.shift_type_cache[sys.intern(shift_str)] = sys.intern(shift_type)
+        if len(self.shift_type_cache) > self.shift_cache_size:
+            self.shift_type_cache.popitem(last=False)
+
+    @property
+    def predictor(self):
+        """Pattern predictor of the selected backend, built and loaded on first use"""
+        if self._predictor is None:
+            with self.model_lock:
+                if self._predictor is None:
+                    self._load_predictor()
+        return self._predictor
+
+    def _load_predictor(self):
+        if self.ai_state == "unavailable":
+            raise RuntimeError(f"AI model unavailable: {self.ai_error}")
+        self.ai_state = "warming"
+        start = time.perf_counter()
+        try:
+            predictor = PREDICTOR_BACKENDS[self.predictor_backend](len(self.PATTERN_CODES))
+            predictor.build()
+            self._predictor = predictor
+            self.load_trained_model()  # Load AI model if available
+        except Exception as e:
+            self._predictor = None
+            self.ai_error = str(e)
+            self.ai_state = "unavailable"
+            raise
+        self.model_load_seconds = time.perf_counter() - start
+        self.ai_state = "ready"
+
+    def default_predictor_backend(self):
+        """Keras if a trained Keras model was saved and TensorFlow is installed, otherwise ngram"""
+        keras_weights = Path(PREDICTOR_BACKENDS["keras"].weights_file)
+        if keras_weights.exists() and importlib.util.find_spec("tensorflow") is not None:
+            return "keras"
+        return "ngram"
+
+    def set_predictor_backend(self, backend):
+        """Switch the model behind predict_pattern/train_model ("ngram" or "keras")"""
+        if backend not in PREDICTOR_BACKENDS:
+            raise ValueError(f"Unknown predictor backend: {backend}")
+        with self.model_lock:
+            if backend == self.predictor_backend and self.ai_state != "unavailable":
+                return
+            self.save_trained_model()
+            self.predictor_backend = backend
+            self._predictor = None
+            self.model_version += 1
+            self.match_cache_loaded = False
+            self.ai_state = "cold"
+            self.ai_error = None
+            self.model_load_seconds = None
+
+    def warm_up_model(self):
+        """Build the predictor (importing TensorFlow if needed) in a background thread"""
+        if self.ai_state != "cold":
+            return None
+        self.ai_state = "warming"
+        thread = threading.Thread(target=self._warm_up, name="model-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up(self):
+        try:
+            self.predictor
+        except Exception as e:
+            print(f"AI model warm-up failed: {e}")
+
     def load_trained_model(self):
         """Load pre-trained model weights if available"""
-        model_path = Path("pattern_model.weights.h5")
+        model_path = Path(self._predictor.weights_file)
         if model_path.exists():
             try:
-                self.pattern_model.load_weights(str(model_path))
+                self._predictor.load(model_path)
                 print("Loaded pre-trained pattern recognition model")
             except:
                 print("Could not load model weights")
                 
     def save_trained_model(self):
         """Save model weights for future use"""
-        self.pattern_model.save_weights("pattern_model.weights.h5")
+        if self._predictor is None:
+            return  # Never built this session, nothing new to save
+        self._predictor.save(self._predictor.weights_file)
         
+    def encode_pattern(self, pattern):
+        """Return pattern as a ShiftPattern, accepting a pattern string or list of shift types"""
+        if isinstance(pattern, ShiftPattern):
+            return pattern
+        if isinstance(pattern, str):
+            return ShiftPattern.from_string(pattern)
+        return ShiftPattern.from_shifts(pattern)
+
     def pattern_to_sequence(self, pattern_str):
         """Convert pattern string to numerical sequence"""
+        if isinstance(pattern_str, ShiftPattern) and pattern_str:
+            return list(pattern_str)
         mapping = {"M": 1, "A": 2, "N": 3, "RD": 4, "?": 5}
         sequence = []
         for char in pattern_str.split('-'):
             sequence.append(mapping.get(char, 5))  # Default to unknown
         return sequence
         
-    def train_model(self, X_train, y_train):
-        """Train the neural network model"""
+    def build_training_set(self):
+        """Distinct (sequence, pattern code) pairs of the labelled df_processed rows, with row counts"""
+        if self.df_processed is None or "Pattern Code" not in self.df_processed.columns:
+            return [], [], np.zeros(0)
+        labelled = pd.DataFrame({
+            'Encoded': self.get_pattern_table()['Encoded'],
+            'Code': self.df_processed["Pattern Code"]
+        })
+        labelled = labelled[labelled['Code'].isin(self.PATTERN_CODES)]
+        pairs = labelled.groupby(['Encoded', 'Code'], sort=False).size()
+        X_train = [list(encoded) for encoded, _ in pairs.index]
+        y_train = [code for _, code in pairs.index]
+        return X_train, y_train, pairs.to_numpy()
+
+    def train_model(self, X_train, y_train, progress=None, sample_weight=None):
+        """Train the pattern prediction model (sample_weight: how many rows each sample stands for)"""
+        predictor = self.predictor
+
         # Pad sequences to fixed length
-        X_padded = pad_sequences(X_train, maxlen=42, padding='post')
+        X_padded = pad_sequences(X_train, maxlen=42)
         
         # Convert labels to indices
         label_to_index = {code: idx for idx, code in enumerate(self.PATTERN_CODES)}
@@ -113,45 +420,51 @@ class RosterProcessor:
             return
         
         # Train the model - removed minimum sample requirement
-        self.pattern_model.fit(
-            X_padded, 
-            np.array(y_indices),
-            epochs=30,
-            batch_size=min(32, len(X_train)),  # Dynamic batch size
-            validation_split=min(0.2, 1 - 1/len(X_train)) if len(X_train) > 1 else 0
-        )
+        predictor.fit(X_padded, np.array(y_indices), progress=progress, sample_weight=sample_weight)
+        self.model_version += 1
         self.save_trained_model()
         
     def predict_pattern(self, pattern_str):
         """Use AI model to predict pattern code"""
-        sequence = self.pattern_to_sequence(pattern_str)
-        padded_seq = pad_sequences([sequence], maxlen=42, padding='post')
-        predictions = self.pattern_model.predict(padded_seq, verbose=0)[0]
-        top_idx = np.argmax(predictions)
-        return self.PATTERN_CODES[top_idx], predictions[top_idx]
+        return self.predict_patterns([pattern_str])[0]
+
+    def predict_patterns(self, patterns, batch_size=256):
+        """Use AI model to predict pattern codes for many patterns in a single call"""
+        predictor = self.predictor
+        sequences = [self.pattern_to_sequence(pattern) for pattern in patterns]
+        padded_seqs = pad_sequences(sequences, maxlen=42)
+        predictions = predictor.predict_proba(padded_seqs, batch_size=batch_size)
+        top_idxs = np.argmax(predictions, axis=1)
+        return [(self.PATTERN_CODES[top_idx], predictions[row, top_idx])
+                for row, top_idx in enumerate(top_idxs)]
         
     def load_patterns(self):
-        """Load learned patterns from JSON file"""
-        pattern_file = Path("learned_patterns.json")
-        if pattern_file.exists():
-            try:
-                with open(pattern_file, 'r') as f:
-                    self.pattern_mapping = json.load(f)
-            except Exception as e:
-                print(f"Error loading patterns: {e}")
-                self.pattern_mapping = {}
+        """Load learned patterns from the JSON snapshot and its journal"""
+        try:
+            self.pattern_mapping = self.pattern_store.load()
+        except Exception as e:
+            print(f"Error loading patterns: {e}")
+            self.pattern_mapping = self.pattern_store.mapping
+        self.stats_store.load()
                 
     def save_patterns(self):
-        """Save learned patterns to JSON file"""
-        pattern_file = Path("learned_patterns.json")
+        """Write all learned patterns to a fresh JSON snapshot, and any pending statistics"""
         try:
-            with open(pattern_file, 'w') as f:
-                json.dump(self.pattern_mapping, f)
+            self.pattern_store.compact()
         except Exception as e:
             print(f"Error saving patterns: {e}")
+        self.stats_store.flush()
             
     def get_shift_type(self, shift_str):
-        """Determine shift type based on actual timing"""
+        """Determine shift type based on actual timing (memoized per shift string)"""
+        shift_type = self._lookup_shift_type(shift_str)
+        if shift_type is None:
+            shift_type = self._classify_shift(shift_str)
+            self._remember_shift_type(shift_str, shift_type)
+        return shift_type
+
+    def _classify_shift(self, shift_str):
+        """Classify a single shift string without consulting the cache"""
         shift_str = shift_str.upper().strip()
         
         # Check for OFF days first
@@ -193,7 +506,61 @@ class RosterProcessor:
                 pass
         
         return "?"  # Unknown shift type
-        
+
+    def classify_shift_block(self, block, skip_empty=False):
+        """Classify a whole DataFrame block of shift cells at once (same rules as get_shift_type)"""
+        cells = np.asarray(block.to_numpy(dtype=object), dtype=str)
+
+        # Classify each distinct cell value once, then broadcast back
+        codes, uniques = pd.factorize(cells.ravel().astype(object))
+        types = np.array([self._lookup_shift_type(value) for value in uniques], dtype=object)
+        missing = np.flatnonzero(pd.isna(types))
+        if len(missing):
+            types[missing] = self._classify_shift_values(uniques[missing])
+            for value, shift_type in zip(uniques[missing], types[missing]):
+                self._remember_shift_type(value, shift_type)
+
+        if skip_empty:
+            types = types.copy()
+            types[(pd.Series(uniques, dtype=object).str.strip().str.len() == 0).to_numpy()] = ""
+
+        return pd.DataFrame(types[codes].reshape(cells.shape),
+                            index=block.index, columns=block.columns)
+
+    def _classify_shift_values(self, values):
+        """Vectorized get_shift_type rules over an array of distinct shift strings"""
+        shifts = pd.Series(values, dtype=object).str.upper().str.strip()
+        types = np.full(len(shifts), "?", dtype=object)
+        unresolved = np.ones(len(shifts), dtype=bool)
+
+        # Check for OFF days first
+        is_off = np.zeros(len(shifts), dtype=bool)
+        for off in self.OFF_KEYWORDS:
+            is_off |= shifts.str.contains(off, regex=False).to_numpy(dtype=bool)
+        types[is_off] = "RD"
+        unresolved &= ~is_off
+
+        # Check for exact timing patterns
+        for shift_type, timings in self.SHIFT_TYPES.items():
+            for timing in timings:
+                hit = unresolved & shifts.str.contains(timing, regex=False).to_numpy(dtype=bool)
+                types[hit] = shift_type
+                unresolved &= ~hit
+
+        # Parse time ranges by start time
+        start = shifts.str.extract(r'(\d{1,4})\s*[-:]\s*(\d{1,4})')[0]
+        timed = unresolved & start.notna().to_numpy()
+        if timed.any():
+            start = start[timed].str.zfill(4)
+            start_minutes = (start.str.slice(0, 2).map(int) * 60 +
+                             start.str.slice(2, 4).map(int)).to_numpy()
+            types[timed] = np.select(
+                [(start_minutes >= 300) & (start_minutes < 720),
+                 (start_minutes >= 720) & (start_minutes < 1020)],
+                ["M", "A"], default="N").astype(object)
+
+        return types
+
     def get_shift_pattern(self, row):
         """Convert a row's shifts into a pattern string with features"""
         shift_columns = [col for col in row.index if any(char in str(col) for char in ["/", "-"])]
@@ -212,142 +579,191 @@ class RosterProcessor:
             shift_counts[shift_type] += 1
                 
         return "-".join(pattern), shift_counts, shift_sequence
+
+    def refresh_patterns(self, index=None):
+        """Recompute the cached pattern columns for all rows, or only the given row labels"""
+        if self.df_processed is None:
+            self.df_patterns = None
+            self.df_shift_tokens = None
+            return None
+
+        rows = self.df_processed if index is None else self.df_processed.loc[list(index)]
+        token_frame = self.shift_tokens(rows)
+        tokens = token_frame.to_numpy()
+        encoded = [ShiftPattern(row_tokens[row_tokens > 0].tobytes()) for row_tokens in tokens]
+        derived = pd.DataFrame({
+            'Pattern': [pattern.text for pattern in encoded],
+            'Encoded': encoded
+        }, index=rows.index)
+        for shift_type, token in SHIFT_TOKENS.items():
+            derived[shift_type] = (tokens == token).sum(axis=1)
+
+        if index is None or self.df_patterns is None:
+            self.df_patterns = derived
+            self.df_shift_tokens = token_frame
+            self.patterns_key = (self.df_processed, self.shift_generation)
+        else:
+            for label in derived.index:
+                for col in derived.columns:
+                    self.df_patterns.at[label, col] = derived.at[label, col]
+            self.df_shift_tokens.loc[token_frame.index] = token_frame
+        return derived
+
+    def shift_tokens(self, df):
+        """Shift token grid (SHIFT_TOKENS, 0 for empty cells) of the date columns of df"""
+        shift_columns = [col for col in df.columns if any(char in str(col) for char in ["/", "-"])]
+        types = self.classify_shift_block(df[shift_columns], skip_empty=True)
+        return types.apply(lambda col: col.map(SHIFT_TOKENS)).fillna(0).astype(np.uint8)
+
+    def get_shift_tokens(self, df=None):
+        """Cached shift token grid for df_processed, or a freshly classified one for another frame"""
+        if df is None or df is self.df_processed:
+            if self.df_processed is None:
+                return None
+            self.get_pattern_table()
+            return self.df_shift_tokens
+        return self.shift_tokens(df)
+
+    def patterns_current(self):
+        """True if df_patterns matches df_processed: same frame, no shift edits since it was computed"""
+        if self.df_patterns is None or self.patterns_key is None:
+            return False
+        frame, generation = self.patterns_key
+        return frame is self.df_processed and generation == self.shift_generation
+
+    def get_pattern_table(self):
+        """Cached pattern columns for df_processed, recomputed when the frame was replaced or edited"""
+        if not self.patterns_current():
+            self.refresh_patterns()
+        return self.df_patterns
+
+    def get_row_pattern(self, index):
+        """Cached (pattern string, shift counts, encoded pattern) for a df_processed row label"""
+        cached = self.get_pattern_table().loc[index]
+        shift_counts = defaultdict(int)
+        for shift_type in self.SHIFT_CODES:
+            if cached[shift_type]:
+                shift_counts[shift_type] = int(cached[shift_type])
+        return cached['Pattern'], shift_counts, cached['Encoded']
+
+    def set_cell(self, index, column, value):
+        """Edit one df_processed cell, recomputing cached patterns only for that row"""
+        current = self.patterns_current()
+        self.df_processed.at[index, column] = value
+        if any(char in str(column) for char in ["/", "-"]):
+            self.shift_generation += 1
+            if current:
+                # Only this row changed, so patching it keeps the table current
+                self.refresh_patterns([index])
+                self.patterns_key = (self.df_processed, self.shift_generation)
         
-    def learn_pattern(self, pattern_str, pattern_code):
-        """Store and reinforce learned pattern"""
+    def learn_pattern(self, pattern_str, pattern_code, count=1):
+        """Store and reinforce learned pattern, as if learned once from each of count rows"""
         if pattern_str in self.pattern_mapping:
             # Reinforce existing pattern
-            self.pattern_confidence[pattern_code] += 5
+            self.stats_store.add('confidence', pattern_code, 5 * count)
         else:
-            # New pattern learning
-            self.pattern_mapping[pattern_str] = pattern_code
-            self.pattern_confidence[pattern_code] = 10
-            
-        # Save after each learning
-        self.save_patterns()
+            # New pattern learning, journaled by the store in batches
+            self.pattern_store.set(pattern_str, pattern_code)
+            self.stats_store.set('confidence', pattern_code, 10 + 5 * (count - 1))
+        self.stats_store.add('learned', pattern_str, count)
         
-    def record_pattern_usage(self, pattern_code):
+    def record_pattern_usage(self, pattern_code, count=1):
         """Track pattern usage statistics"""
-        self.pattern_statistics[pattern_code] += 1
+        self.stats_store.add('usage', pattern_code, count)
+        
+    def group_patterns(self):
+        """Rows of df_processed grouped by encoded pattern, for once-per-pattern work"""
+        return PatternGroups(self.get_pattern_table())
+        
+    def pattern_row_counts(self, patterns):
+        """How many df_processed rows show each pattern string (at least 1)"""
+        if self.df_processed is None:
+            return [1] * len(patterns)
+        counts = self.get_pattern_table()['Pattern'].value_counts()
+        return [max(1, int(counts.get(pattern, 0))) for pattern in patterns]
         
     def get_unknown_patterns(self):
         """Get unrecognized patterns"""
         return list(self.unknown_patterns)
         
-    def _edit_distance(self, s1, s2):
-        """Calculate edit distance between two strings (Levenshtein distance)"""
-        if len(s1) < len(s2):
-            return self._edit_distance(s2, s1)
-        
-        # len(s1) >= len(s2)
-        if len(s2) == 0:
-            return len(s1)
-        
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
-        
-    def semantic_similarity(self, pattern1, pattern2):
-        """Calculate semantic similarity between patterns"""
-        # Sequence alignment similarity
-        self.sequence_matcher.set_seqs(pattern1, pattern2)
-        alignment_score = self.sequence_matcher.ratio()
-        
-        # Edit distance
-        edit_distance = self._edit_distance(pattern1, pattern2)
-        max_len = max(len(pattern1), len(pattern2))
-        normalized_edit = 1 - (edit_distance / max_len) if max_len > 0 else 0
-        
-        # Contextual similarity
-        context_sim = self.contextual_similarity(pattern1, pattern2)
-        
-        # Weighted combination
-        return 0.5 * alignment_score + 0.3 * normalized_edit + 0.2 * context_sim
-        
-    def contextual_similarity(self, pattern1, pattern2):
-        """Compare patterns based on contextual features"""
-        features1 = self.get_pattern_features(pattern1)
-        features2 = self.get_pattern_features(pattern2)
-        
-        if not features1 or not features2:
-            return 0
-            
-        # Calculate feature similarity
-        feature_sim = 0
-        for key in features1:
-            if key in features2:
-                if isinstance(features1[key], (int, float)):
-                    # Normalize numerical differences
-                    max_val = max(features1[key], features2[key]) or 1
-                    diff = abs(features1[key] - features2[key])
-                    feature_sim += 1 - (diff / max_val)
-                else:
-                    # For categorical features
-                    feature_sim += 1 if features1[key] == features2[key] else 0
-                    
-        return feature_sim / len(features1) if features1 else 0
-        
-    def get_pattern_features(self, pattern_str):
-        """Extract features from pattern string"""
-        parts = pattern_str.split('-')
-        return {
-            'length': len(parts),
-            'rd_count': parts.count("RD"),
-            'm_count': parts.count("M"),
-            'a_count': parts.count("A"),
-            'n_count': parts.count("N"),
-            'first': parts[0] if parts else "",
-            'last': parts[-1] if parts else "",
-            'transitions': self.count_transitions(parts)
-        }
-        
-    def count_transitions(self, pattern):
-        """Count shift type transitions in pattern"""
-        transitions = 0
-        for i in range(1, len(pattern)):
-            if pattern[i] != pattern[i-1]:
-                transitions += 1
-        return transitions
+    def is_rest_day(self, shift):
+        """A rest day is any non-empty shift classified as RD (RD, OFF, LEAVE, ...)"""
+        shift = str(shift).strip()
+        return bool(shift) and self.get_shift_type(shift) == "RD"
         
     def has_weekend_rd(self, row):
         """Detect if RD falls on weekend"""
-        date_cols = [col for col in row.index if any(char in str(col) for char in ["/", "-"])]
-        weekend_rd = False
-        
-        for i, col in enumerate(date_cols):
-            if "RD" in str(row[col]).upper():
-                try:
-                    # Extract day of week from column header
-                    if isinstance(col, str):
-                        dt = datetime.strptime(col, "%d-%m-%Y")
-                        if dt.weekday() >= 5:  # Saturday or Sunday
-                            weekend_rd = True
-                except:
-                    continue
-        return weekend_rd
-        
-    def cluster_patterns(self, patterns):
+        dates = self.date_headers.date_map(row.index)
+        return any(header.weekday >= 5 and self.is_rest_day(row[col])  # Saturday or Sunday
+                   for col, header in dates.items())
+        
+    def weekend_rd_analysis(self, df=None):
+        """Weekend rest days of every row of df (default df_processed) in one pass.
+
+        Returns a frame with, per row, the number of weekend days that are
+        rest days (as is_rest_day decides), whether there is any, and the
+        longest run of consecutive calendar weekends with at least one rest
+        day; a week missing from the date columns breaks the run.
+        """
+        tokens = self.get_shift_tokens(df)
+        if tokens is None:
+            return None
+        dates = self.date_headers.date_map(tokens.columns)
+        weekend_cols = [col for col in tokens.columns if col in dates and dates[col].weekday >= 5]
+        rd = tokens[weekend_cols].to_numpy() == SHIFT_TOKENS["RD"]
+        counts = rd.sum(axis=1)
+
+        # Saturday and Sunday of one week form one weekend; weekends in date order
+        week_starts = [dates[col].date.toordinal() - dates[col].weekday for col in weekend_cols]
+        weeks, week_ids = np.unique(np.asarray(week_starts, dtype=np.int64), return_inverse=True)
+        weekend_off = np.zeros((len(tokens), len(weeks)), dtype=bool)
+        for week in range(len(weeks)):
+            weekend_off[:, week] = rd[:, week_ids == week].any(axis=1)
+
+        run = np.zeros(len(tokens), dtype=np.int64)
+        streak = np.zeros(len(tokens), dtype=np.int64)
+        for week in range(len(weeks)):
+            if week and weeks[week] - weeks[week - 1] != 7:
+                run[:] = 0  # Not the following week, so not a consecutive weekend
+            run = np.where(weekend_off[:, week], run + 1, 0)
+            np.maximum(streak, run, out=streak)
+
+        return pd.DataFrame({
+            'weekend_rd': counts,
+            'has_weekend_rd': counts > 0,
+            'weekend_rd_streak': streak
+        }, index=tokens.index)
+
+    def pattern_weekend_features(self, patterns):
+        """Mean weekend RD count and streak of the df_processed rows showing each pattern"""
+        analysis = self.weekend_rd_analysis() if self.df_processed is not None else None
+        if analysis is None:
+            return {}
+        by_pattern = analysis.groupby(self.get_pattern_table()['Pattern'])[['weekend_rd', 'weekend_rd_streak']].mean()
+        by_pattern = by_pattern[by_pattern.index.isin(list(patterns))]
+        return {pattern: tuple(float(value) for value in values) for pattern, values in zip(by_pattern.index, by_pattern.to_numpy())}
+
+    def cluster_patterns(self, patterns, progress=None):
         """Cluster patterns using K-Means"""
-        # Convert patterns to feature vectors
+        # Convert patterns to feature vectors, including the weekend RD behaviour of the rows showing them
+        weekend = self.pattern_weekend_features(patterns)
         features = []
-        for pattern in patterns:
-            feat = self.get_pattern_features(pattern)
+        for done, pattern in enumerate(patterns, 1):
+            feat = self.get_pattern_features(self.encode_pattern(pattern))
+            weekend_rd, weekend_streak = weekend.get(pattern, (0, 0))
             features.append([
                 feat['length'],
                 feat['rd_count'],
                 feat['m_count'],
                 feat['a_count'],
                 feat['n_count'],
-                feat['transitions']
+                feat['transitions'],
+                weekend_rd,
+                weekend_streak
             ])
+            if progress:
+                progress(done, len(patterns) + 1)  # The last step is the K-Means fit
             
         if not features:
             return {}
@@ -357,53 +773,56 @@ class RosterProcessor:
         if n_clusters < 2:
             return {}
             
+        from sklearn.cluster import KMeans
+
+        # Each pattern counts as many times as there are rows showing it
         kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        clusters = kmeans.fit_predict(features)
+        clusters = kmeans.fit_predict(features, sample_weight=self.pattern_row_counts(patterns))
         
         # Group patterns by cluster
         clustered = defaultdict(list)
         for i, pattern in enumerate(patterns):
             clustered[clusters[i]].append(pattern)
+        if progress:
+            progress(len(patterns) + 1, len(patterns) + 1)
             
         return clustered
         
+    def get_code_index(self):
+        """Return the nearest-code search index, rebuilding it if PATTERN_CODES changed"""
+        codes_key = tuple(self.PATTERN_CODES)
+        if self.code_index is None or self.code_index_key != codes_key:
+            # Scored by a stateless PatternScorer so the index can be shipped to worker processes
+            self.code_index = PatternCodeIndex(codes_key, PatternScorer())
+            self.code_index_key = codes_key
+        return self.code_index
+
+    def set_match_workers(self, workers):
+        """Number of processes used to match unknown patterns (1 matches in-process)"""
+        self.parallel_matcher.set_workers(workers)
+
+    def match_similar_codes(self, sequences, progress=None):
+        """Semantic similarity stage for many sequences: [(code, similarity)] in order"""
+        sequences = [self.encode_pattern(sequence) for sequence in sequences]
+        return self.parallel_matcher.match(self.get_code_index(), sequences, self.pattern_confidence,
+                                           progress=progress)
+
     def detect_repeating_pattern(self, sequence):
         """Detect repeating patterns in a sequence"""
-        max_pattern_length = min(14, len(sequence))  # Look for patterns up to 14 days
-        best_pattern = None
-        best_score = 0
-        
-        # Try different pattern lengths
-        for pattern_length in range(3, max_pattern_length + 1):
-            # Check if sequence is multiple of pattern length
-            if len(sequence) % pattern_length != 0:
-                continue
-                
-            pattern = sequence[:pattern_length]
-            repetitions = len(sequence) // pattern_length
-            match = True
-            
-            # Verify pattern repeats throughout
-            for i in range(1, repetitions):
-                start = i * pattern_length
-                end = start + pattern_length
-                if sequence[start:end] != pattern:
-                    match = False
-                    break
-                    
-            if match:
-                # Calculate confidence based on pattern length and repetitions
-                score = pattern_length * repetitions
-                if score > best_score:
-                    best_score = score
-                    best_pattern = pattern
-                    
-        return best_pattern
+        cycle = self.cycle_detector.detect(self.encode_pattern(sequence))
+        return ShiftPattern(cycle) if cycle else None
+
+    def detect_repeating_patterns(self, sequences):
+        """detect_repeating_pattern for many sequences at once"""
+        cycles = self.cycle_detector.detect_many([self.encode_pattern(sequence) for sequence in sequences])
+        return [ShiftPattern(cycle) if cycle else None for cycle in cycles]
         
     def match_predefined_patterns(self, sequence):
         """Match sequence against predefined common patterns"""
+        sequence = self.encode_pattern(sequence)
+        
         # First try exact matches
-        for pattern_name, pattern_seq in self.predefined_patterns.items():
+        for pattern_name, pattern_seq in self.predefined_sequences.items():
             if self.sequence_matches(sequence, pattern_seq):
                 return pattern_name, 1.0
                 
@@ -411,7 +830,7 @@ class RosterProcessor:
         best_match = None
         best_score = 0
         
-        for pattern_name, pattern_seq in self.predefined_patterns.items():
+        for pattern_name, pattern_seq in self.predefined_sequences.items():
             score = self.sequence_similarity(sequence, pattern_seq)
             if score > best_score and score > 0.7:
                 best_score = score
@@ -455,83 +874,200 @@ class RosterProcessor:
 
     def detect_best_match(self, pattern_str, sequence):
         """AI-enhanced pattern matching with sequence analysis"""
-        # 1. Check learned patterns first (exact match)
-        if pattern_str in self.pattern_mapping:
-            code = self.pattern_mapping[pattern_str]
-            return code, 1.0  # 100% confidence
-            
-        # 2. Match against predefined patterns
-        predefined_match, confidence = self.match_predefined_patterns(sequence)
-        if predefined_match and confidence > 0.9:
-            return predefined_match, confidence
-            
-        # 3. Try neural network prediction
+        return self.detect_best_matches([pattern_str], [sequence])[0]
+
+    def detect_best_matches(self, pattern_strs, sequences, progress=None):
+        """Batch pattern matching: cheap stages for every row, then one model call for the rest.
+
+        Each distinct encoded sequence is evaluated once (or taken from the
+        match cache) and the result fanned out to every row sharing it. The
+        similarity stage for sequences nothing else resolved runs through
+        parallel_matcher, across processes when there are many of them.
+        progress, if given, is called as progress(done, total) while rows are resolved.
+        """
+        total = len(pattern_strs)
+        sequences = [self.encode_pattern(sequence) for sequence in sequences]
+        results = [None] * len(pattern_strs)
+        cache = self.get_match_cache()
+        confidence_version = self.stats_store.versions['confidence']
+
+        # Rows sharing a sequence share a result
+        groups = OrderedDict()
+        for i, (pattern_str, sequence) in enumerate(zip(pattern_strs, sequences)):
+            # 1. Check learned patterns first (exact match)
+            if pattern_str in self.pattern_mapping:
+                results[i] = (self.pattern_mapping[pattern_str], 1.0)  # 100% confidence
+            else:
+                groups.setdefault(bytes(sequence), []).append(i)
+
+        def resolve(key, result):
+            result = (result[0], float(result[1]))  # Plain floats, as the cache returns them
+            for i in groups[key]:
+                results[i] = result
+
+        unresolved = []
+        for key, rows in groups.items():
+            cached = cache.get(key, confidence_version)
+            if cached is not None:
+                resolve(key, cached)
+                continue
+
+            # 2. Match against predefined patterns
+            predefined_match, confidence = self.match_predefined_patterns(sequences[rows[0]])
+            if predefined_match and confidence > 0.9:
+                cache.put(key, predefined_match, confidence)
+                resolve(key, (predefined_match, confidence))
+                continue
+
+            unresolved.append(key)
+
+        done = total - sum(len(groups[key]) for key in unresolved)
+        if progress:
+            progress(done, total)
+        if not unresolved:
+            return results
+
+        # 3. Try neural network prediction, batched over all unresolved sequences
         try:
-            nn_pred, nn_confidence = self.predict_pattern(pattern_str)
-            if nn_confidence > 0.8:
-                return nn_pred, nn_confidence
+            predictions = self.predict_patterns([sequences[groups[key][0]] for key in unresolved])
+            model_ok = True
         except Exception as e:
             print(f"AI prediction failed: {e}")
-            
-        # 4. Semantic similarity matching with your pattern codes
-        best_match = None
-        best_score = 0
-        best_similarity = 0.0
+            predictions = [(None, 0.0)] * len(unresolved)
+            model_ok = False
+
+        fallback = []
+        for key, (nn_pred, nn_confidence) in zip(unresolved, predictions):
+            if nn_confidence > 0.8:
+                cache.put(key, nn_pred, nn_confidence)
+                resolve(key, (nn_pred, nn_confidence))
+                done += len(groups[key])
+            else:
+                fallback.append(key)
+        if progress:
+            progress(done, total)
+        if not fallback:
+            return results
+
+        # 4./5. Similarity search (possibly across worker processes) and cycle detection, batched
+        fallback_sequences = [sequences[groups[key][0]] for key in fallback]
+        fallback_rows = np.cumsum([len(groups[key]) for key in fallback])
+
+        def similarity_progress(matched, _):
+            if progress:
+                progress(done + int(fallback_rows[matched - 1]), total)
+
+        similar = self.match_similar_codes(fallback_sequences, progress=similarity_progress)
+        cycles = self.detect_repeating_patterns(fallback_sequences)
+
+        for key, similar_match, cycle in zip(fallback, similar, cycles):
+            first = groups[key][0]
+            result = self.match_unknown_pattern(pattern_strs[first], sequences[first], cycle or b"", similar_match)
+            if model_ok:  # Without the model this is not the answer a later run would give
+                cache.put(key, result[0], result[1], confidence_version)
+            resolve(key, result)
+        return results
+
+    def get_match_cache(self):
+        """The match cache, emptied if the pattern codes or model changed and seeded from disk on first use"""
+        self.match_cache.check_generation((tuple(self.PATTERN_CODES), self.predictor_backend, self.model_version))
+        if not self.match_cache_loaded:
+            self.match_cache_loaded = True
+            signature = self.match_cache_signature()
+            if signature is not None:
+                self.match_cache.load(signature)
+        return self.match_cache
+
+    def match_cache_signature(self):
+        """What saved match results depend on: pattern codes and the saved weights (None if untrained)"""
+        weights = Path(PREDICTOR_BACKENDS[self.predictor_backend].weights_file)
+        if not weights.exists():
+            return None
+        stat = weights.stat()
+        return (tuple(self.PATTERN_CODES), self.predictor_backend, stat.st_size, stat.st_mtime_ns)
+
+    def save_match_cache(self):
+        """Persist cached match results for the next session"""
+        # Drop results of an earlier model first, or they would be saved under the current weights
+        cache = self.get_match_cache()
+        signature = self.match_cache_signature()
+        if signature is None or not cache.entries:
+            return
+        cache.save(signature)
+
+    def match_unknown_pattern(self, pattern_str, sequence, repeating_pattern=None, similar_match=None):
+        """Fallback stages for patterns the mapping, predefined patterns and model could not resolve.
+
+        repeating_pattern is the already detected cycle, if any (b"" for none),
+        and similar_match the already computed (code, similarity) of stage 4.
+        """
+        sequence = self.encode_pattern(sequence)
         
-        for code in self.PATTERN_CODES:
-            similarity = self.semantic_similarity(pattern_str, code)
-                
-            # Weight by confidence and length match
-            score = similarity * 100 + self.pattern_confidence.get(code, 0)
-            if len(pattern_str) == len(code):
-                score += 20  # Bonus for exact length match
-                
-            if score > best_score:
-                best_score = score
-                best_match = code
-                best_similarity = similarity
+        # 4. Semantic similarity matching with your pattern codes
+        # (weighted by confidence, with a bonus for exact length match)
+        if similar_match is None:
+            similar_match = self.get_code_index().best_match(sequence, self.pattern_confidence)
+        best_match, best_similarity = similar_match
         
         if best_match and best_similarity > 0.7:
             return best_match, best_similarity
             
         # 5. Check for repeating patterns (last resort)
-        repeating_pattern = self.detect_repeating_pattern(sequence)
+        if repeating_pattern is None:
+            repeating_pattern = self.detect_repeating_pattern(sequence)
         if repeating_pattern:
-            pattern_name = "Rep-" + "-".join(repeating_pattern)
+            pattern_name = "Rep-" + str(ShiftPattern(repeating_pattern))
             return pattern_name, 1.0
             
         return None, 0.0
 
     def format_date_headers(self, df):
-        new_columns = []
-        date_formats = [
-            "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%b-%y", "%d %B %Y",
-            "%d-%m-%y", "%m-%d-%y", "%y-%m-%d", "%d/%m/%y", "%m/%d/%y"
-        ]
-        
-        for col in df.columns:
-            if isinstance(col, str):
-                col = col.strip()
-                converted = False
-                for fmt in date_formats:
-                    try:
-                        dt = datetime.strptime(col, fmt)
-                        new_columns.append(dt.strftime("%d-%m-%Y"))
-                        converted = True
-                        break
-                    except ValueError:
-                        continue
-                if not converted:
-                    if isinstance(col, datetime):
-                        new_columns.append(col.strftime("%d-%m-%Y"))
-                    else:
-                        new_columns.append(col)
-            elif isinstance(col, datetime):
-                new_columns.append(col.strftime("%d-%m-%Y"))
-            else:
-                new_columns.append(col)
-        df.columns = new_columns
-        return df
+        """Rename date headers to dd-mm-YYYY, parsing each header row once"""
+        return self.date_headers.normalize(df)
+
+    def off_day_matrix(self, block):
+        """Boolean matrices (off, missing) of a block of shift cells.
+
+        A cell is off if str(cell) contains an OFF keyword, matched once per
+        distinct value. Missing cells are judged by their text ("NAN", "NONE")
+        like any other, which only matters for custom keywords.
+        """
+        cells = block.to_numpy(dtype=object)
+        codes, uniques = pd.factorize(cells.ravel())
+        missing = codes < 0
+        shifts = pd.Series(uniques, dtype=object).astype(str).str.upper().str.strip()
+        is_off = self._contains_off_keyword(shifts)
+        off = np.append(is_off, False)[codes]  # Code -1 (missing) picks the trailing False
+
+        missing_text = {str(value).upper().strip() for value in (np.nan, None, pd.NaT, pd.NA)}
+        if missing.any() and self._contains_off_keyword(pd.Series(sorted(missing_text))).any():
+            flat = cells.ravel()
+            positions = np.flatnonzero(missing)
+            off[positions] = self._contains_off_keyword(
+                pd.Series([str(value) for value in flat[positions]]).str.upper().str.strip())
+        return off.reshape(cells.shape), missing.reshape(cells.shape)
+
+    def _contains_off_keyword(self, shifts):
+        is_off = np.zeros(len(shifts), dtype=bool)
+        for off in self.OFF_KEYWORDS:
+            is_off |= shifts.str.contains(off, regex=False).to_numpy(dtype=bool)
+        return is_off
+
+    def detect_roster_begins(self, df, date_cols):
+        """detect_roster_begin for every row at once, as array operations over the OFF matrix"""
+        date_cols = list(date_cols)
+        block = df[date_cols]
+        # Missing cells never start an OFF run, but count as "NAN" (a working day) after one
+        off, missing = self.off_day_matrix(block)
+        starts_off = off & ~missing
+
+        has_off = starts_off.any(axis=1)
+        first_off = starts_off.argmax(axis=1)
+        after = np.arange(len(date_cols)) > first_off[:, np.newaxis]
+        working = after & ~off
+        has_begin = has_off & working.any(axis=1)
+        begin = np.where(has_begin, working.argmax(axis=1), 0)
+        return pd.Series(np.asarray(date_cols, dtype=object)[begin], index=df.index)
 
     def detect_roster_begin(self, row, date_cols):
         for i, val in enumerate(row[date_cols]):
@@ -559,14 +1095,16 @@ class RosterProcessor:
         self.df_processed = self.format_date_headers(self.df_processed)
         date_cols = [col for col in self.df_processed.columns if any(char in str(col) for char in ["/", "-"])]
         
-        self.df_processed['Roster Begin Date'] = self.df_processed.apply(
-            lambda row: self.detect_roster_begin(row, date_cols), axis=1)
+        if not date_cols:
+            raise ValueError("No date columns found in the roster")
+        self.df_processed['Roster Begin Date'] = self.detect_roster_begins(self.df_processed, date_cols)
         self.df_processed['Pattern Code'] = ""
         
         new_order = [col for col in self.df_processed.columns 
                      if col not in ['Roster Begin Date', 'Pattern Code']] + \
                    ['Roster Begin Date', 'Pattern Code']
         self.df_processed = self.df_processed[new_order]
+        self.refresh_patterns()
         return self.df_processed
 
     def validate_data(self):
@@ -0,0 +1,123 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+class RosterSearchIndex:
+    """Case-insensitive substring search over the cells of a roster frame.
+
+    Each column is factorized into its distinct lowercased values (roster
+    columns repeat the same shift codes over and over), and a trigram index
+    maps each trigram to the values containing it. A query narrows the
+    candidate values through the trigrams of its literal parts, verifies
+    them with a regular expression and maps the surviving values back to
+    row positions. Rows are updated in place after edits.
+
+    Query terms match anywhere in a cell. A term containing * is a glob
+    matched against the whole cell instead, so "EY-*" means "starts with
+    EY-". "Column:term" limits the search to one column.
+    """
+
+    GRAM = 3
+
+    def __init__(self, df):
+        self.frame = df
+        self.labels = list(df.index)
+        self.positions = {label: pos for pos, label in enumerate(self.labels)}
+        self.columns = {}
+        self.column_names = {str(col).lower(): col for col in df.columns}
+        for col in df.columns:
+            self.columns[col] = self._index_column(df[col])
+
+    def _index_column(self, series):
+        codes, uniques = pd.factorize(series.astype(str).str.lower())
+        column = {
+            'codes': np.asarray(codes, dtype=np.int64),
+            'values': list(uniques),
+            'ids': {value: i for i, value in enumerate(uniques)},
+            'grams': {},
+        }
+        for value_id, value in enumerate(column['values']):
+            self._add_grams(column, value_id, value)
+        return column
+
+    def _add_grams(self, column, value_id, value):
+        grams = column['grams']
+        for start in range(len(value) - self.GRAM + 1):
+            grams.setdefault(value[start:start + self.GRAM], set()).add(value_id)
+
+    def update_rows(self, df, labels):
+        """Re-index the given rows after their cells changed"""
+        labels = [label for label in labels if label in self.positions and label in df.index]
+        if not labels:
+            return
+        rows = [self.positions[label] for label in labels]
+        for col, column in self.columns.items():
+            if col not in df.columns:
+                continue
+            for pos, value in zip(rows, df.loc[labels, col].astype(str).str.lower()):
+                if not isinstance(value, str):
+                    column['codes'][pos] = -1  # Missing, as pd.factorize codes it
+                    continue
+                value_id = column['ids'].get(value)
+                if value_id is None:
+                    value_id = len(column['values'])
+                    column['values'].append(value)
+                    column['ids'][value] = value_id
+                    self._add_grams(column, value_id, value)
+                column['codes'][pos] = value_id
+
+    def parse(self, query):
+        """Split "Column:term" into (column or None, lowercased term)"""
+        head, sep, tail = query.partition(":")
+        if sep and head.strip().lower() in self.column_names:
+            return self.column_names[head.strip().lower()], tail.strip().lower()
+        return None, query.strip().lower()
+
+    def _matching_values(self, column, term):
+        """Ids of the distinct column values matching term"""
+        parts = [part for part in term.split("*") if part]
+        if "*" in term:
+            regex = re.compile(".*".join(re.escape(part) for part in term.split("*")), re.S)
+            matches = regex.fullmatch
+        else:
+            matches = lambda value: term in value
+
+        candidates = None
+        for part in parts:
+            for start in range(len(part) - self.GRAM + 1):
+                ids = column['grams'].get(part[start:start + self.GRAM], set())
+                candidates = set(ids) if candidates is None else candidates & ids
+                if not candidates:
+                    return []
+        if candidates is None:  # Too short for trigrams: check every distinct value
+            candidates = range(len(column['values']))
+        values = column['values']
+        return [value_id for value_id in candidates if matches(values[value_id])]
+
+    def search(self, query, within=None):
+        """Row positions matching query, optionally only among the positions in within"""
+        column_name, term = self.parse(query)
+        if not term:
+            return np.arange(len(self.labels)) if within is None else within
+
+        columns = [column_name] if column_name is not None else list(self.columns)
+        rows = np.arange(len(self.labels)) if within is None else np.asarray(within)
+        found = np.zeros(len(rows), dtype=bool)
+        for col in columns:
+            column = self.columns[col]
+            value_ids = self._matching_values(column, term)
+            if value_ids:
+                found |= np.isin(column['codes'][rows], value_ids)
+        return rows[found]
+
+    def narrows(self, previous, query):
+        """True if every match of query is also a match of the previous query"""
+        if previous is None:
+            return False
+        previous_column, previous_term = self.parse(previous)
+        column, term = self.parse(query)
+        if column != previous_column or not term.startswith(previous_term):
+            return False
+        return "*" not in previous_term or previous_term.endswith("*")
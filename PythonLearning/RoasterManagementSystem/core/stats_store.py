@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+
+class PatternStatsStore:
+    """Persistent pattern counters (confidence and usage by code, learning by pattern string).
+
+    The whole store is one small JSON file, read once at startup. Changes
+    are counted and the file is rewritten atomically once flush_every of
+    them have accumulated or flush_interval seconds after the first one.
+    Counters decay with a half-life: at load, every value is scaled by
+    0.5 ** (days since last save / half_life_days), so old heavy usage
+    fades instead of dominating the rankings forever.
+    """
+
+    COUNTERS = ('confidence', 'usage', 'learned')
+
+    def __init__(self, path="pattern_stats.json", half_life_days=30, flush_every=200, flush_interval=5.0):
+        self.path = Path(path)
+        self.half_life_days = half_life_days
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.counters = {name: defaultdict(float) for name in self.COUNTERS}
+        self.versions = {name: 0 for name in self.COUNTERS}  # Bumped on every change, for caches
+        self.dirty = 0
+        self.timer = None
+        self.lock = threading.RLock()
+
+    def counter(self, name):
+        """The live mapping behind a counter, for reading"""
+        return self.counters[name]
+
+    def load(self, now=None):
+        """Read the stats file once and age its counters to now"""
+        with self.lock:
+            if not self.path.exists():
+                return
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+            except Exception as e:
+                print(f"Error loading pattern statistics: {e}")
+                return
+
+            elapsed_days = max(0.0, ((now or time.time()) - saved.get('saved_at', 0)) / 86400)
+            factor = 0.5 ** (elapsed_days / self.half_life_days) if self.half_life_days else 1.0
+            for name in self.COUNTERS:
+                counter = self.counters[name]
+                counter.clear()
+                for key, value in saved.get('counters', {}).get(name, {}).items():
+                    value *= factor
+                    if value >= 0.01:  # Forget what has decayed to nothing
+                        counter[key] = value
+                self.versions[name] += 1
+
+    def add(self, name, key, amount=1):
+        with self.lock:
+            self.counters[name][key] += amount
+            self._changed(name)
+
+    def set(self, name, key, value):
+        with self.lock:
+            self.counters[name][key] = value
+            self._changed(name)
+
+    def flush(self):
+        """Write the counters now if anything changed"""
+        with self.lock:
+            self._cancel_timer()
+            if not self.dirty:
+                return
+            data = {
+                'saved_at': time.time(),
+                'counters': {name: dict(counter) for name, counter in self.counters.items()}
+            }
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Error saving pattern statistics: {e}")
+                return
+            self.dirty = 0
+
+    def _changed(self, name):
+        self.versions[name] += 1
+        self.dirty += 1
+        if self.dirty >= self.flush_every:
+            self.flush()
+        elif self.timer is None:
+            self.timer = threading.Timer(self.flush_interval, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _cancel_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
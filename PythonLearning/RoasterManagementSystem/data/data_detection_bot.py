@@ -1,5 +1,7 @@
 import pandas as pd
 
+from core.date_headers import date_headers
+
 class DataDetectionBot:
     def __init__(self):
         self.column_identifiers = {
@@ -10,14 +12,14 @@ class DataDetectionBot:
             'department': ['dept', 'department', 'team'],
             'position': ['position', 'role', 'designation']
         }
-        self.date_formats = [
-            "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%b-%y", 
-            "%d %B %Y", "%d-%m-%y", "%m-%d-%y", "%y-%m-%d"
-        ]
+        self.date_headers = date_headers
 
     def detect_columns(self, df):
         detected = {}
+        date_map = self.date_headers.date_map(df.columns)
         for col in df.columns:
+            if col in date_map:
+                continue  # Roster day columns are dates, never one of the fields below
             col_lower = str(col).lower()
             for field, identifiers in self.column_identifiers.items():
                 if any(id in col_lower for id in identifiers):
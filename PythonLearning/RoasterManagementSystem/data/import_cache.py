@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from core.date_headers import DateHeaderService
+
+# Bump the first part when the import pipeline changes what a snapshot contains;
+# snapshots also go stale when date header normalization changes
+CACHE_VERSION = f"2/headers-{DateHeaderService.NORMALIZE_VERSION}"
+
+
+class ImportCache:
+    """On-disk snapshots of imported rosters, so re-opening a file skips parsing it.
+
+    A snapshot holds the frame as it came out of the importer (date headers
+    already normalized) in Feather format when pyarrow is installed, read
+    back memory-mapped, or as a pickle otherwise. Snapshots are stored by
+    content hash; index.json maps each file's (path, size, mtime) to that
+    hash so an unchanged file is found without reading it, and keeps the
+    column names, dtypes and last use of every snapshot. The least recently
+    used snapshots are evicted past max_entries or max_bytes.
+    """
+
+    def __init__(self, cache_dir="import_cache", max_entries=10, max_bytes=1024 ** 3):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.index = None
+
+    def _load_index(self):
+        if self.index is not None:
+            return self.index
+        index_file = self.cache_dir / "index.json"
+        self.index = {'version': CACHE_VERSION, 'files': {}, 'snapshots': {}}
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    saved = json.load(f)
+                if not (isinstance(saved, dict) and isinstance(saved.get('files'), dict)
+                        and isinstance(saved.get('snapshots'), dict)):
+                    print("Ignoring malformed import cache index")
+                elif saved.get('version') == CACHE_VERSION:
+                    self.index = saved
+                else:
+                    # Snapshots of an older pipeline are never read again
+                    for entry in saved['snapshots'].values():
+                        try:
+                            (self.cache_dir / entry['file']).unlink()
+                        except (OSError, KeyError, TypeError):
+                            pass
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable import cache index: {e}")
+        return self.index
+
+    def _save_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index_file = self.cache_dir / "index.json"
+        tmp_file = index_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_file, index_file)
+
+    @staticmethod
+    def file_key(file_path):
+        stat = os.stat(file_path)
+        return f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    @staticmethod
+    def content_hash(file_path, block_size=1024 * 1024):
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def load(self, file_path):
+        """(cached frame or None, content digest) for file_path; pass the digest on to store()"""
+        with self.lock:
+            index = self._load_index()
+            key = self.file_key(file_path)
+            digest = index['files'].get(key)
+            if digest is None:
+                # Touched, copied or renamed files still hit if their content is unchanged
+                digest = self.content_hash(file_path)
+                if digest not in index['snapshots']:
+                    return None, digest
+                index['files'][key] = digest
+
+            entry = index['snapshots'].get(digest)
+            if entry is None:
+                return None, digest
+            try:
+                df = self._read_snapshot(entry)
+            except Exception as e:
+                print(f"Dropping unreadable import cache entry: {e}")
+                self._evict(digest)
+                self._save_index()
+                return None, digest
+            entry['last_used'] = time.time()
+            self._save_index()
+            return df, digest
+
+    def store(self, file_path, df, digest=None):
+        """Snapshot an imported frame for file_path, then evict old snapshots.
+
+        digest is the content digest load() returned, so the file is not hashed twice.
+        """
+        with self.lock:
+            index = self._load_index()
+            key = self.file_key(file_path)
+            digest = digest or self.content_hash(file_path)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            entry = self._write_snapshot(digest, df)
+            entry.update({
+                'source': os.path.abspath(file_path),
+                'last_used': time.time(),
+                'columns': [str(col) for col in df.columns],
+                'dtypes': [str(dtype) for dtype in df.dtypes],
+            })
+            index['snapshots'][digest] = entry
+            index['files'][key] = digest
+            self._enforce_limits(keep=digest)
+            self._save_index()
+
+    def clear(self):
+        with self.lock:
+            index = self._load_index()
+            for digest in list(index['snapshots']):
+                self._evict(digest)
+            self._save_index()
+
+    def _write_snapshot(self, digest, df):
+        """Write df as Feather if pyarrow can take it as-is, otherwise as a pickle"""
+        frame = df.reset_index(drop=True)
+        if all(isinstance(col, str) for col in frame.columns) and frame.columns.is_unique:
+            try:
+                import pyarrow.feather as feather
+                path = self.cache_dir / f"{digest}.feather"
+                feather.write_feather(frame, str(path), compression="uncompressed")
+                return {'file': path.name, 'format': "feather", 'bytes': path.stat().st_size}
+            except ImportError:
+                pass
+            except Exception as e:  # Mixed-type object columns and the like
+                print(f"Import cache falling back to pickle: {e}")
+
+        path = self.cache_dir / f"{digest}.pkl"
+        frame.to_pickle(path)
+        return {'file': path.name, 'format': "pickle", 'bytes': path.stat().st_size}
+
+    def _read_snapshot(self, entry):
+        path = self.cache_dir / entry['file']
+        if entry['format'] == "feather":
+            import pyarrow.feather as feather
+            df = feather.read_table(str(path), memory_map=True).to_pandas()
+        else:
+            df = pd.read_pickle(path)
+
+        # Restore the dtypes the import produced where the round trip changed them
+        for col, dtype in zip(df.columns, entry['dtypes']):
+            if str(df[col].dtype) != dtype:
+                df[col] = df[col].astype(dtype)
+        return df
+
+    def _enforce_limits(self, keep=None):
+        snapshots = self.index['snapshots']
+        by_age = sorted(snapshots, key=lambda digest: snapshots[digest]['last_used'])
+        total = sum(entry['bytes'] for entry in snapshots.values())
+        for digest in by_age:
+            if len(snapshots) <= self.max_entries and total <= self.max_bytes:
+                break
+            if digest == keep:
+                continue
+            total -= snapshots[digest]['bytes']
+            self._evict(digest)
+
+    def _evict(self, digest):
+        entry = self.index['snapshots'].pop(digest, None)
+        if entry is not None:
+            try:
+                (self.cache_dir / entry['file']).unlink()
+            except FileNotFoundError:
+                pass
+        self.index['files'] = {key: value for key, value in self.index['files'].items() if value != digest}
@@ -0,0 +1,128 @@
+import os
+
+import pandas as pd
+
+XLSX_MAGIC = b"PK\x03\x04"
+XLS_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+def sniff_format(file_path):
+    """'xlsx', 'xls' or 'csv', decided once from the file's leading bytes rather than its extension"""
+    with open(file_path, 'rb') as f:
+        head = f.read(8)
+    if head.startswith(XLSX_MAGIC):
+        return 'xlsx'
+    if head.startswith(XLS_MAGIC):
+        return 'xls'
+    return 'csv'
+
+
+class StreamingImporter:
+    """Reads a roster file as a sequence of DataFrame chunks.
+
+    CSV files are read with pandas in chunks and XLSX files row by row in
+    openpyxl read-only mode, so the first rows are available long before
+    the whole file is parsed. Legacy XLS files have no streaming reader and
+    come back as one chunk. Every chunk gets the same normalized headers
+    and a continuous row index, and text columns (EMP ID by default) are
+    kept as strings.
+    """
+
+    def __init__(self, file_path, chunk_size=2000, header_formatter=None, text_columns=('EMP ID',)):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.header_formatter = header_formatter
+        self.text_columns = text_columns
+        self.format = sniff_format(file_path)
+        self.columns = None
+
+    def iter_chunks(self, progress=None):
+        """Yield DataFrame chunks, calling progress(done, total) after each one"""
+        readers = {'csv': self._csv_chunks, 'xlsx': self._xlsx_chunks, 'xls': self._xls_chunks}
+        start = 0
+        for chunk, done, total in readers[self.format]():
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            if progress and total:
+                progress(done, total)
+            elif progress:
+                progress(0)  # Size unknown, but still a cancellation point
+            yield chunk
+
+    def read(self, progress=None):
+        """The whole file as one DataFrame"""
+        chunks = list(self.iter_chunks(progress))
+        if not chunks:
+            return pd.DataFrame(columns=self.columns or [])
+        return pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+
+    def _normalize_headers(self, header):
+        columns = [f"Unnamed: {i}" if col is None else col for i, col in enumerate(header)]
+        if self.header_formatter:
+            columns = list(self.header_formatter(pd.DataFrame(columns=columns)).columns)
+        self.columns = columns
+        return columns
+
+    def _normalize_chunk(self, chunk):
+        for col in self.text_columns:
+            if col in chunk.columns:
+                values = chunk[col]
+                chunk[col] = values.where(values.isna(), values.astype(str))
+        return chunk
+
+    def _csv_chunks(self):
+        total = os.path.getsize(self.file_path)
+        dtype = {col: str for col in self.text_columns}
+        with open(self.file_path, 'rb') as f:
+            for chunk in pd.read_csv(f, dtype=dtype, chunksize=self.chunk_size):
+                if self.columns is None:
+                    self._normalize_headers(list(chunk.columns))
+                chunk.columns = self.columns
+                yield self._normalize_chunk(chunk), f.tell(), total
+
+    def _xlsx_chunks(self):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            total = sheet.max_row
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = self._normalize_headers(header)
+
+            width = len(columns)
+            done = 1
+            batch = []
+            for row in rows:
+                done += 1
+                if all(value is None for value in row):
+                    continue
+                batch.append(row[:width] + (None,) * (width - len(row)))
+                if len(batch) >= self.chunk_size:
+                    yield self._xlsx_frame(batch), done, total
+                    batch = []
+            if batch:
+                yield self._xlsx_frame(batch), done, total
+        finally:
+            workbook.close()
+
+    def _xlsx_frame(self, rows):
+        # Text columns become strings on the raw cell values (None stays missing), so a
+        # blank cell cannot turn an ID column into floats; only the rest is inferred
+        series = []
+        for col, values in zip(self.columns, zip(*rows)):
+            if col in self.text_columns:
+                series.append(pd.Series([value if value is None else str(value) for value in values], dtype=object))
+            else:
+                series.append(pd.Series(values, dtype=object).infer_objects())
+        chunk = pd.concat(series, axis=1)
+        chunk.columns = self.columns
+        return self._normalize_chunk(chunk)
+
+    def _xls_chunks(self):
+        chunk = pd.read_excel(self.file_path, engine='xlrd', dtype={col: str for col in self.text_columns})
+        chunk.columns = self._normalize_headers(list(chunk.columns))
+        yield self._normalize_chunk(chunk), 1, 1
@@ -1,9 +1,20 @@
-from ui.nsk_roster_app import NSKRosterApp
-import tkinter as tk
-from ttkbootstrap import Style
+import time
+start_time = time.perf_counter()
+
+
+def main():
+    # Imported here rather than at module level: worker processes spawned for
+    # pattern matching re-import this module and must not load the UI
+    from ui.nsk_roster_app import NSKRosterApp
+    import tkinter as tk
+    from ttkbootstrap import Style
 
-if __name__ == "__main__":
     root = tk.Tk()
     style = Style(theme="darkly")
     app = NSKRosterApp(root)
+    app.report_cold_start(start_time)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeTree:
+    """Just enough of a Treeview for VirtualGrid without a display"""
+
+    def __init__(self, height=0):
+        self.height = height
+        self.tag_order = []  # Tag names in order of first configuration
+        self.items = {}
+        self.next_id = 0
+
+    def tag_configure(self, tag, **options):
+        if tag not in self.tag_order:
+            self.tag_order.append(tag)
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def winfo_height(self):
+        return 1
+
+    def cget(self, option):
+        return self.height
+
+    def insert(self, parent, index, **options):
+        self.next_id += 1
+        item = f"I{self.next_id}"
+        self.items[item] = {}
+        return item
+
+    def delete(self, item):
+        self.items.pop(item, None)
+
+    def item(self, item, **options):
+        self.items[item].update(options)
+        return self.items[item]
+
+    def set(self, item, column, value):
+        pass
+
+    def get_children(self):
+        return tuple(self.items)
+
+    def selection_set(self, items):
+        pass
+
+
+class FakeScrollbar:
+    def configure(self, **kwargs):
+        pass
+
+    def set(self, *args):
+        pass
+
+
+@pytest.fixture
+def make_grid():
+    from ui.virtual_grid import VirtualGrid
+
+    def make(df, height=0):
+        grid = VirtualGrid(FakeTree(height), FakeScrollbar())
+        grid.set_frame(df)
+        return grid
+    return make
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """A RosterProcessor whose pattern, stats and model files live in a temporary directory"""
+    from core.roster_processor import RosterProcessor
+
+    monkeypatch.chdir(tmp_path)
+    return RosterProcessor()
@@ -0,0 +1,58 @@
+import types
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("ttkbootstrap")
+
+from ui.nsk_roster_app import NSKRosterApp
+
+
+class Var:
+    def __init__(self):
+        self.value = None
+
+    def set(self, value):
+        self.value = value
+
+
+def make_app(processor):
+    df = pd.DataFrame({
+        'EMP ID': ['1', '2', '3', '4'],
+        '01-03-2025': ['0600-1400', '0600-1400', '0600-1400', '1400-2200'],
+        '02-03-2025': ['RD', 'RD', 'RD', 'RD'],
+        'Pattern Code': ['', '', '', ''],
+    })
+    processor.df_processed = df
+    app = types.SimpleNamespace(
+        processor=processor,
+        status_var=Var(),
+        learning_status=types.SimpleNamespace(config=lambda **options: None),
+        learning_status_var=Var(),
+        refreshed=[],
+    )
+    app.refresh_rows = lambda labels: app.refreshed.extend(labels)
+    app.run_task = lambda work, done, failed, text: setattr(app, 'done', done)
+    return app
+
+
+def test_rows_edited_during_auto_detect_keep_the_edit(processor):
+    app = make_app(processor)
+    NSKRosterApp.auto_detect_all(app)
+
+    # While the task runs: a code typed into row 1, a shift changed in row 2
+    processor.set_cell(1, 'Pattern Code', 'PAX-TYPED')
+    processor.set_cell(2, '01-03-2025', '2200-0600')
+
+    app.done([("PAX-M", 0.9), ("PAX-A", 0.9)])
+    assert list(processor.df_processed['Pattern Code']) == ['PAX-M', 'PAX-TYPED', '', 'PAX-A']
+    assert sorted(app.refreshed) == [0, 3]
+    assert "2 rows edited" in app.status_var.value
+
+
+def test_untouched_rows_all_get_results(processor):
+    app = make_app(processor)
+    NSKRosterApp.auto_detect_all(app)
+    app.done([("PAX-M", 0.9), ("PAX-A", 0.3)])
+    assert list(processor.df_processed['Pattern Code']) == ['PAX-M', 'PAX-M', 'PAX-M', '']
+    assert processor.stats_store.counter('usage')['PAX-M'] == 3
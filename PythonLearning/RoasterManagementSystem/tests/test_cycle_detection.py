@@ -0,0 +1,52 @@
+import random
+from collections import Counter
+
+from core.cycle_detection import CycleDetector, periods
+
+
+def brute_force_cycle(sequence, min_period, max_period, max_mismatches):
+    """Try every period in turn, counting tokens phase by phase"""
+    n = len(sequence)
+    for p in range(min_period, min(max_period, n) + 1):
+        if not (n % p == 0 or n >= 2 * p):
+            continue
+        cycle, mismatches = [], 0
+        for phase in range(p):
+            counts = Counter(sequence[phase::p])
+            token = min(counts, key=lambda t: (-counts[t], t))  # Ties go to the lowest token
+            cycle.append(token)
+            mismatches += len(sequence[phase::p]) - counts[token]
+        if mismatches <= max_mismatches:
+            return bytes(cycle)
+    return None
+
+
+def random_sequences(rng, count):
+    """Mostly noisy repetitions of a random cycle, so that many sequences have one"""
+    sequences = []
+    for _ in range(count):
+        cycle = [rng.randint(1, 5) for _ in range(rng.randint(1, 9))]
+        n = rng.randint(1, 30)
+        sequence = [cycle[i % len(cycle)] for i in range(n)]
+        for _ in range(rng.choice([0, 0, 1, 2, 4])):
+            sequence[rng.randrange(n)] = rng.randint(1, 5)
+        sequences.append(bytes(sequence))
+    return sequences
+
+
+def test_periods_equal_brute_force():
+    rng = random.Random(20)
+    for sequence in random_sequences(rng, 500):
+        n = len(sequence)
+        expected = [p for p in range(1, n + 1) if all(sequence[i] == sequence[i + p] for i in range(n - p))]
+        assert periods(sequence) == expected
+
+
+def test_detect_equals_brute_force():
+    rng = random.Random(21)
+    sequences = random_sequences(rng, 1000)
+    for min_period, max_period, max_mismatches in [(3, 14, 0), (1, 7, 0), (3, 14, 1), (2, 10, 3)]:
+        detector = CycleDetector(min_period, max_period, max_mismatches)
+        expected = [brute_force_cycle(s, min_period, max_period, max_mismatches) for s in sequences]
+        assert [detector.detect(s) for s in sequences] == expected
+        assert detector.detect_many(sequences) == expected
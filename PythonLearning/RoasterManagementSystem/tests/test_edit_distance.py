@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+
+from core.edit_distance import EditDistanceEngine
+
+
+def reference_distance(s1, s2):
+    """Textbook dynamic programming Levenshtein distance"""
+    previous = list(range(len(s2) + 1))
+    for i, a in enumerate(s1, 1):
+        current = [i]
+        for j, b in enumerate(s2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a != b)))
+        previous = current
+    return previous[-1]
+
+
+def random_pattern(rng, max_len=40):
+    return "-".join(rng.choice(["M", "A", "N", "RD"]) for _ in range(rng.randint(0, max_len)))
+
+
+def test_distance_matches_dynamic_programming():
+    rng = random.Random(6)
+    engine = EditDistanceEngine()
+    for _ in range(500):
+        s1, s2 = random_pattern(rng), random_pattern(rng)
+        assert engine.distance(s1, s2) == reference_distance(s1, s2)
+
+
+def test_long_sequences_and_token_types():
+    rng = random.Random(7)
+    engine = EditDistanceEngine()
+    for _ in range(20):
+        # Longer than a machine word, as bytes, lists and NumPy arrays
+        s1 = bytes(rng.randint(1, 5) for _ in range(rng.randint(60, 150)))
+        s2 = bytes(rng.randint(1, 5) for _ in range(rng.randint(60, 150)))
+        expected = reference_distance(s1, s2)
+        assert engine.distance(s1, s2) == expected
+        assert engine.distance(list(s1), list(s2)) == expected
+        assert engine.distance(np.frombuffer(s1, dtype=np.uint8), np.frombuffer(s2, dtype=np.uint8)) == expected
+
+
+def test_threshold_mode_caps_at_max_distance_plus_one():
+    rng = random.Random(8)
+    engine = EditDistanceEngine()
+    for _ in range(500):
+        s1, s2 = random_pattern(rng, 20), random_pattern(rng, 20)
+        max_distance = rng.randint(0, 15)
+        expected = reference_distance(s1, s2)
+        assert engine.distance(s1, s2, max_distance) == min(expected, max_distance + 1)
+
+
+def test_distance_many_matches_pairwise():
+    rng = random.Random(9)
+    engine = EditDistanceEngine(cache_size=4)
+    for _ in range(50):
+        pattern = random_pattern(rng, 30)
+        candidates = [random_pattern(rng, 30) for _ in range(10)]
+        for max_distance in (None, 5):
+            expected = [reference_distance(pattern, candidate) for candidate in candidates]
+            if max_distance is not None:
+                expected = [min(value, max_distance + 1) for value in expected]
+            assert engine.distance_many(pattern, candidates, max_distance) == expected
@@ -0,0 +1,49 @@
+import types
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("ttkbootstrap")
+
+from core.roster_processor import RosterProcessor
+from core.search_index import RosterSearchIndex
+from ui.nsk_roster_app import NSKRosterApp
+
+
+def make_app(df, make_grid):
+    processor = RosterProcessor()
+    processor.df_processed = df
+    grid = make_grid(df)
+    app = types.SimpleNamespace(
+        processor=processor,
+        table_view=grid,
+        search_index=RosterSearchIndex(df),
+        last_search=None,
+        highlighted=[],
+    )
+    app.update_row_highlights = lambda labels: app.highlighted.extend(labels)
+    return app
+
+
+def test_edited_cell_is_searchable_by_new_value(make_grid):
+    df = pd.DataFrame({'EMP ID': ['1', '2'], '01-03-2025': ['0600-1400', '1400-2200']})
+    app = make_app(df, make_grid)
+
+    # As save_cell does: write the frame and the grid, then refresh the row
+    app.processor.set_cell(0, '01-03-2025', 'OFF')
+    app.table_view.set_value(0, '01-03-2025', 'OFF')
+    NSKRosterApp.refresh_rows(app, [0])
+
+    assert list(app.search_index.search('off')) == [0]
+    assert list(app.search_index.search('0600')) == []
+
+
+def test_edited_row_is_retagged(make_grid):
+    df = pd.DataFrame({'EMP ID': ['1', '2'], '01-03-2025': ['0600-1400', '1400-2200']})
+    app = make_app(df, make_grid)
+
+    app.processor.set_cell(1, '01-03-2025', 'RD')
+    app.table_view.set_value(1, '01-03-2025', 'RD')
+    NSKRosterApp.refresh_rows(app, [1])
+
+    assert app.highlighted == [1]
@@ -0,0 +1,90 @@
+import json
+import random
+import shutil
+
+import pandas as pd
+
+import data.import_cache as import_cache
+from data.import_cache import ImportCache
+
+
+def random_roster(rng, rows=30):
+    return pd.DataFrame({
+        'EMP ID': [str(rng.randint(1, 9999)) for _ in range(rows)],
+        'Name': [rng.choice(["Ana", "Bo", None]) for _ in range(rows)],
+        '01/Mon': [rng.choice(["M", "A", "RD"]) for _ in range(rows)],
+        'Hours': [rng.randint(0, 9) for _ in range(rows)],
+    })
+
+
+def write_source(path, rng):
+    df = random_roster(rng)
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_round_trip_equals_the_stored_frame(tmp_path):
+    rng = random.Random(16)
+    cache = ImportCache(tmp_path / "cache")
+    for i in range(5):
+        source = tmp_path / f"roster{i}.csv"
+        df = write_source(source, rng)
+        assert cache.load(source)[0] is None
+        cache.store(source, df)
+        cached, _ = ImportCache(tmp_path / "cache").load(source)  # Fresh instance reads index.json
+        pd.testing.assert_frame_equal(cached, df)
+
+
+def test_copies_hit_and_edits_miss(tmp_path):
+    rng = random.Random(17)
+    cache = ImportCache(tmp_path / "cache")
+    source = tmp_path / "roster.csv"
+    df = write_source(source, rng)
+    cache.store(source, df, cache.load(source)[1])
+
+    copy = tmp_path / "copy.csv"
+    shutil.copy(source, copy)
+    pd.testing.assert_frame_equal(cache.load(copy)[0], df)
+
+    write_source(source, rng)
+    assert cache.load(source)[0] is None
+
+
+def test_version_change_drops_old_snapshots(tmp_path, monkeypatch):
+    rng = random.Random(18)
+    source = tmp_path / "roster.csv"
+    cache = ImportCache(tmp_path / "cache")
+    cache.store(source, write_source(source, rng))
+    snapshots = [path for path in (tmp_path / "cache").iterdir() if path.name != "index.json"]
+    assert snapshots
+
+    monkeypatch.setattr(import_cache, "CACHE_VERSION", "new")
+    assert ImportCache(tmp_path / "cache").load(source)[0] is None
+    assert not any(path.exists() for path in snapshots)
+
+
+def test_malformed_index_is_ignored(tmp_path):
+    rng = random.Random(19)
+    source = tmp_path / "roster.csv"
+    df = write_source(source, rng)
+    (tmp_path / "cache").mkdir()
+    for content in ["[]", "{not json", json.dumps({'version': import_cache.CACHE_VERSION})]:
+        (tmp_path / "cache" / "index.json").write_text(content)
+        cache = ImportCache(tmp_path / "cache")
+        assert cache.load(source)[0] is None
+        cache.store(source, df)
+        pd.testing.assert_frame_equal(ImportCache(tmp_path / "cache").load(source)[0], df)
+
+
+def test_least_recently_used_snapshots_are_evicted(tmp_path):
+    rng = random.Random(20)
+    cache = ImportCache(tmp_path / "cache", max_entries=2)
+    sources = [tmp_path / f"roster{i}.csv" for i in range(3)]
+    frames = [write_source(source, rng) for source in sources]
+    cache.store(sources[0], frames[0])
+    cache.store(sources[1], frames[1])
+    cache.load(sources[0])  # Now more recent than roster1
+    cache.store(sources[2], frames[2])
+    assert cache.load(sources[1])[0] is None
+    assert cache.load(sources[0])[0] is not None
+    assert cache.load(sources[2])[0] is not None
@@ -0,0 +1,91 @@
+import pickle
+import random
+
+from core.match_cache import MatchCache
+
+
+class ReferenceCache:
+    """The same contract as a plain list of (key, entry) in least-recently-used order"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.items = []
+
+    def find(self, key):
+        return next((i for i, (k, _) in enumerate(self.items) if k == key), None)
+
+    def get(self, key, confidence_version):
+        i = self.find(key)
+        if i is None or self.items[i][1][2] not in (None, confidence_version):
+            return None
+        self.items.append(self.items.pop(i))
+        return self.items[-1][1][:2]
+
+    def put(self, key, entry):
+        i = self.find(key)
+        if i is not None:
+            self.items.pop(i)
+        self.items.append((key, entry))
+        if len(self.items) > self.max_size:
+            self.items.pop(0)
+
+
+def test_get_and_put_equal_the_reference():
+    rng = random.Random(23)
+    cache, reference = MatchCache(max_size=12), ReferenceCache(12)
+    generation = 0
+    cache.check_generation(generation)
+    for _ in range(3000):
+        key = bytes([rng.randint(1, 5) for _ in range(2)])
+        version = rng.randint(0, 2)
+        action = rng.random()
+        if action < 0.5:
+            assert cache.get(key, version) == reference.get(key, version)
+        elif action < 0.98:
+            code, confidence = f"PAX-{rng.randint(0, 9)}", rng.random()
+            entry_version = rng.choice([None, version])
+            cache.put(key, code, confidence, entry_version)
+            reference.put(key, (code, confidence, entry_version))
+        else:
+            step = rng.randint(0, 1)
+            generation += step
+            cache.check_generation(generation)
+            if step:
+                reference.items = []
+        assert list(cache.entries) == [key for key, _ in reference.items]
+
+
+def test_check_generation_drops_entries_only_on_change():
+    cache = MatchCache()
+    cache.check_generation(("PAX-1",))
+    cache.put(b"\x01", "PAX-1", 0.9)
+    cache.check_generation(("PAX-1",))
+    assert cache.get(b"\x01") == ("PAX-1", 0.9)
+    cache.check_generation(("PAX-1", "PAX-2"))
+    assert cache.get(b"\x01") is None
+
+
+def test_save_keeps_confidence_independent_entries_under_their_signature(tmp_path):
+    path = tmp_path / "match_cache.pkl"
+    cache = MatchCache(path)
+    cache.put(b"\x01", "PAX-1", 0.9)
+    cache.put(b"\x02", "PAX-2", 0.5, confidence_version=3)
+    cache.save("sig")
+
+    reloaded = MatchCache(path)
+    assert reloaded.load("other") == 0 and not reloaded.entries
+    assert reloaded.load("sig") == 1
+    assert reloaded.get(b"\x01") == ("PAX-1", 0.9)
+    assert reloaded.get(b"\x02", 3) is None
+
+
+def test_unreadable_file_loads_nothing(tmp_path):
+    path = tmp_path / "match_cache.pkl"
+    for content in [b"", b"\x80\x05truncated", b"not a pickle", pickle.dumps(["wrong", "shape"]),
+                    pickle.dumps({'signature': "sig", 'entries': {b"\x01": "PAX-1"}})]:
+        path.write_bytes(content)
+        cache = MatchCache(path)
+        assert cache.load("sig") == 0 and not cache.entries
+        cache.put(b"\x01", "PAX-1", 0.9)
+        cache.save("sig")
+        assert MatchCache(path).load("sig") == 1
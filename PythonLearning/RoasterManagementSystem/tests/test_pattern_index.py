@@ -0,0 +1,43 @@
+import random
+
+from core.pattern_index import PatternCodeIndex
+from core.roster_processor import PatternScorer, ShiftPattern
+
+
+def linear_scan(scorer, codes, pattern_str, confidence):
+    """The full scan the index replaces: score every code, ties to the earlier code"""
+    best_match, best_score, best_similarity = None, 0, 0.0
+    for code in codes:
+        similarity = scorer.semantic_similarity(pattern_str, code)
+        score = similarity * 100 + confidence.get(code, 0)
+        if len(pattern_str) == len(code):
+            score += 20
+        if score > best_score:
+            best_match, best_score, best_similarity = code, score, similarity
+    return best_match, best_similarity
+
+
+def random_code(rng):
+    prefix = rng.choice(["PAX", "EY", "APR", "SEC", "CX", "MHB"])
+    body = "".join(f"{rng.randint(1, 4)}{rng.choice('MAENG')}" for _ in range(rng.randint(1, 4)))
+    return f"{prefix}-{body}{rng.randint(1, 2)}RD"
+
+
+def test_best_match_equals_linear_scan(processor):
+    rng = random.Random(5)
+    codes = processor.PATTERN_CODES + [random_code(rng) for _ in range(100)]
+    scorer = PatternScorer()
+    index = PatternCodeIndex(codes, scorer)
+    for _ in range(150):
+        shifts = [rng.choice(["M", "A", "N", "RD"]) for _ in range(rng.randint(1, 14))]
+        pattern = ShiftPattern.from_shifts(shifts)
+        confidence = {code: rng.choice([0, 0, 5, 12.5, 40]) for code in rng.sample(codes, 20)}
+        code, similarity = index.best_match(pattern, confidence)
+        expected_code, expected_similarity = linear_scan(scorer, codes, str(pattern), confidence)
+        assert code == expected_code
+        assert abs(similarity - expected_similarity) < 1e-9
+
+
+def test_empty_index_finds_nothing():
+    index = PatternCodeIndex([], PatternScorer())
+    assert index.best_match(ShiftPattern.from_string("M-A-RD"), {}) == (None, 0.0)
@@ -0,0 +1,51 @@
+import random
+
+from core.pattern_store import PatternJournalStore
+
+
+def open_store(tmp_path, **options):
+    options.setdefault('flush_interval', 3600)  # Only explicit and batch flushes in tests
+    store = PatternJournalStore(tmp_path / "learned_patterns.json", **options)
+    store.load()
+    return store
+
+
+def test_reload_equals_the_durable_dict(tmp_path):
+    rng = random.Random(21)
+    store = open_store(tmp_path, batch_size=7, compact_after=40)
+    live, durable = {}, {}
+    for _ in range(500):
+        action = rng.random()
+        if action < 0.85:
+            pattern, code = f"M-A-{rng.randint(0, 60)}RD", f"PAX-{rng.randint(0, 9)}"
+            store.set(pattern, code)
+            live[pattern] = code
+            if not store.pending:  # A full batch was written
+                durable = dict(live)
+        elif action < 0.95:
+            store.flush()
+            durable = dict(live)
+        else:
+            # Crash: queued changes are lost, everything written survives
+            store._cancel_timer()
+            store = open_store(tmp_path, batch_size=7, compact_after=40)
+            live = dict(durable)
+        assert store.mapping == live
+        assert open_store(tmp_path).mapping == durable
+    store.close()
+    assert open_store(tmp_path).mapping == live
+    assert not store.journal_path.exists()
+
+
+def test_torn_line_is_dropped_and_later_writes_survive(tmp_path):
+    store = open_store(tmp_path)
+    store.set("M-A-RD", "PAX-1")
+    store.flush()
+    with open(store.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"pattern": "N-N-RD", "co')
+
+    store = open_store(tmp_path)
+    assert store.mapping == {"M-A-RD": "PAX-1"}
+    store.set("A-A-RD", "PAX-2")
+    store.flush()
+    assert open_store(tmp_path).mapping == {"M-A-RD": "PAX-1", "A-A-RD": "PAX-2"}
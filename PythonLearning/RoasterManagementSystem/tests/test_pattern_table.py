@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+SHIFTS = ['0600-1400', '1400-2200', '2200-0600', 'RD', 'OFF', '']
+
+
+def random_roster(rng, rows=40, days=7):
+    columns = [f"{day:02d}-03-2025" for day in range(1, days + 1)]
+    df = pd.DataFrame(rng.choice(SHIFTS, (rows, days)), columns=columns)
+    df.insert(0, 'EMP ID', [str(i) for i in range(rows)])
+    return df
+
+
+def test_table_follows_set_cell_edits(processor):
+    rng = np.random.default_rng(3)
+    processor.df_processed = random_roster(rng)
+    columns = ['Pattern', 'M', 'A', 'N', 'RD']
+    for _ in range(50):
+        table = processor.get_pattern_table()
+        index = int(rng.integers(len(processor.df_processed)))
+        column = processor.df_processed.columns[int(rng.integers(1, 8))]
+        processor.set_cell(index, column, rng.choice(SHIFTS))
+
+        patched = processor.get_pattern_table()
+        assert patched is table  # The edited row was patched in place, not the whole table rebuilt
+        patched = patched[columns].copy()
+        pd.testing.assert_frame_equal(patched, processor.refresh_patterns()[columns])
+
+
+def test_replaced_frame_of_the_same_length_is_recomputed(processor):
+    rng = np.random.default_rng(4)
+    processor.df_processed = random_roster(rng)
+    before = processor.get_pattern_table()
+    processor.df_processed = random_roster(rng)
+    after = processor.get_pattern_table()
+    assert after is not before
+    assert processor.patterns_current()
+    pd.testing.assert_frame_equal(after, processor.refresh_patterns())
+
+
+def test_edits_before_first_use_are_seen(processor):
+    rng = np.random.default_rng(5)
+    processor.df_processed = random_roster(rng)
+    processor.set_cell(0, '01-03-2025', 'RD')
+    assert processor.get_row_pattern(0)[0].startswith('RD')
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from core.predictors import NgramPatternPredictor, PatternPredictor, pad_sequences
+
+
+def reference_features(row, vocab=NgramPatternPredictor.VOCAB):
+    """N-gram counts by direct enumeration, skipping n-grams that touch padding"""
+    n_features = vocab + vocab ** 2 + vocab ** 3
+    counts = np.zeros(n_features)
+    tokens = list(row)
+    for n, offset in ((1, 0), (2, vocab), (3, vocab + vocab ** 2)):
+        for start in range(len(tokens) - n + 1):
+            gram = tokens[start:start + n]
+            if all(gram):
+                gram_id = 0
+                for token in gram:
+                    gram_id = gram_id * vocab + token
+                counts[offset + gram_id] += 1
+    return counts
+
+
+def random_sequences(rng, n_rows):
+    return [rng.integers(1, 6, rng.integers(1, 42)).tolist() for _ in range(n_rows)]
+
+
+def test_pad_sequences_keeps_the_last_tokens():
+    padded = pad_sequences([[1, 2, 3], list(range(1, 50))], maxlen=5)
+    assert padded.tolist() == [[1, 2, 3, 0, 0], [45, 46, 47, 48, 49]]
+
+
+def test_features_match_direct_counting():
+    rng = np.random.default_rng(9)
+    X = pad_sequences(random_sequences(rng, 50))
+    predictor = NgramPatternPredictor(4)
+    for row, features in zip(X, predictor.features(X)):
+        assert np.array_equal(features, reference_features(row))
+
+
+def test_weighted_fit_equals_fitting_duplicated_rows():
+    rng = np.random.default_rng(10)
+    X = pad_sequences(random_sequences(rng, 40))
+    y = rng.integers(0, 4, len(X))
+    weights = rng.integers(1, 6, len(X))
+
+    weighted = NgramPatternPredictor(4)
+    weighted.fit(X, y, sample_weight=weights)
+    duplicated = NgramPatternPredictor(4)
+    duplicated.fit(np.repeat(X, weights, axis=0), np.repeat(y, weights))
+
+    assert np.allclose(weighted.predict_proba(X), duplicated.predict_proba(X))
+    assert np.allclose(weighted.predict_proba(X).sum(axis=1), 1)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    rng = np.random.default_rng(11)
+    X = pad_sequences(random_sequences(rng, 30))
+    y = rng.integers(0, 3, len(X))
+    trained = NgramPatternPredictor(3)
+    trained.fit(X, y)
+    path = tmp_path / NgramPatternPredictor.weights_file
+    trained.save(path)
+
+    loaded = NgramPatternPredictor(3)
+    loaded.load(path)
+    assert np.allclose(loaded.predict_proba(X), trained.predict_proba(X))
+    with pytest.raises(ValueError):
+        NgramPatternPredictor(5).load(path)
+
+
+def test_incomplete_backend_fails_at_construction():
+    class FitOnly(PatternPredictor):
+        def fit(self, X, y, progress=None, sample_weight=None):
+            pass
+
+    with pytest.raises(TypeError):
+        FitOnly(3)
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+SHIFTS = ['0600-1400', '1400-2200', 'RD', 'OFF', 'LEAVE', 'W/OFF', 'rdo', ' Rest ', '', None, np.nan, 7]
+
+
+def random_block(rng, rows, days):
+    columns = [f"{day:02d}-03-2025" for day in range(1, days + 1)]
+    cells = [[SHIFTS[i] for i in rng.integers(len(SHIFTS), size=days)] for _ in range(rows)]
+    return pd.DataFrame(cells, columns=columns, index=[f"r{i}" for i in range(rows)]), columns
+
+
+def assert_matches_per_row(processor, df, date_cols):
+    expected = [processor.detect_roster_begin(row, date_cols) for _, row in df.iterrows()]
+    result = processor.detect_roster_begins(df, date_cols)
+    assert list(result.index) == list(df.index)
+    assert list(result) == expected
+
+
+def test_vectorized_begins_equal_the_row_loop(processor):
+    rng = np.random.default_rng(18)
+    for days in [1, 2, 7, 31]:
+        df, date_cols = random_block(rng, 200, days)
+        assert_matches_per_row(processor, df, date_cols)
+
+
+def test_custom_keywords_that_match_missing_text(processor):
+    # "NA" is contained in the text of a missing cell ("NAN"), which the row loop reads after an OFF
+    processor.OFF_KEYWORDS = ['RD', 'NA', 'ONE']
+    rng = np.random.default_rng(19)
+    df, date_cols = random_block(rng, 200, 10)
+    assert_matches_per_row(processor, df, date_cols)
@@ -0,0 +1,79 @@
+import random
+import re
+
+import numpy as np
+import pandas as pd
+
+from core.search_index import RosterSearchIndex
+
+SHIFTS = ["M", "A", "N", "RD", "AL", "OFF", "M/A", "EY-M"]
+
+
+def random_frame(rng, rows=60):
+    return pd.DataFrame({
+        'EMP ID': [str(rng.randint(1000, 1200)) for _ in range(rows)],
+        'Name': [rng.choice(["Ana Lee", "Bo Tan", "ANNA Ng", "Raj Kumar"]) for _ in range(rows)],
+        '01/Mon': [rng.choice(SHIFTS) for _ in range(rows)],
+        '02/Tue': [rng.choice(SHIFTS) for _ in range(rows)],
+    }, index=[f"r{i}" for i in range(rows)])
+
+
+def contains_scan(df, term, columns=None):
+    """Row positions whose cells contain term, the scan the index replaces"""
+    found = np.zeros(len(df), dtype=bool)
+    for col in columns or df.columns:
+        cells = df[col].astype(str).str.lower()
+        if "*" in term:
+            pattern = ".*".join(re.escape(part) for part in term.lower().split("*"))
+            found |= cells.str.fullmatch(pattern).to_numpy()
+        else:
+            found |= cells.str.contains(term.lower(), regex=False).to_numpy()
+    return np.flatnonzero(found)
+
+
+def random_term(rng, df):
+    cell = str(df.iat[rng.randrange(len(df)), rng.randrange(len(df.columns))])
+    start = rng.randrange(len(cell))
+    term = cell[start:start + rng.randint(1, 4)].strip() or cell  # Queries are trimmed
+    return term.upper() if rng.random() < 0.3 else term
+
+
+def test_search_equals_str_contains():
+    rng = random.Random(13)
+    df = random_frame(rng)
+    index = RosterSearchIndex(df)
+    for _ in range(200):
+        term = random_term(rng, df)
+        assert list(index.search(term)) == list(contains_scan(df, term))
+
+
+def test_column_scope_and_glob():
+    rng = random.Random(14)
+    df = random_frame(rng)
+    index = RosterSearchIndex(df)
+    for query, term, columns in [("name:an", "an", ["Name"]), ("01/Mon:rd", "rd", ["01/Mon"]),
+                                 ("EY-*", "EY-*", None), ("*d", "*d", None), ("m*a", "m*a", None),
+                                 ("02/tue:*/*", "*/*", ["02/Tue"])]:
+        assert list(index.search(query)) == list(contains_scan(df, term, columns))
+
+
+def test_within_restricts_to_given_rows():
+    rng = random.Random(15)
+    df = random_frame(rng)
+    index = RosterSearchIndex(df)
+    within = np.array(sorted(rng.sample(range(len(df)), 20)))
+    expected = [pos for pos in contains_scan(df, "m") if pos in set(within)]
+    assert list(index.search("m", within=within)) == expected
+
+
+def test_update_rows_matches_a_fresh_scan():
+    rng = random.Random(16)
+    df = random_frame(rng)
+    index = RosterSearchIndex(df)
+    for _ in range(30):
+        labels = rng.sample(list(df.index), 3)
+        for label in labels:
+            df.loc[label, rng.choice(['01/Mon', '02/Tue', 'Name'])] = rng.choice(SHIFTS + ["Zed Quinn"])
+        index.update_rows(df, labels)
+        term = random_term(rng, df)
+        assert list(index.search(term)) == list(contains_scan(df, term))
@@ -0,0 +1,62 @@
+import json
+import random
+from collections import defaultdict
+
+from core.stats_store import PatternStatsStore
+
+
+def saved_at(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['saved_at']
+
+
+def test_reload_equals_decayed_reference(tmp_path):
+    rng = random.Random(22)
+    path = tmp_path / "pattern_stats.json"
+    store = PatternStatsStore(path, half_life_days=30, flush_every=10 ** 6, flush_interval=3600)
+    expected = {name: defaultdict(float) for name in PatternStatsStore.COUNTERS}
+    for _ in range(300):
+        name, key = rng.choice(PatternStatsStore.COUNTERS), f"PAX-{rng.randint(0, 30)}"
+        before = store.versions[name]
+        if rng.random() < 0.8:
+            amount = rng.choice([1, 1, 0.5, 0.001])
+            store.add(name, key, amount)
+            expected[name][key] += amount
+        else:
+            value = rng.choice([0, 0.005, 3, 42.5])
+            store.set(name, key, value)
+            expected[name][key] = value
+        assert store.versions[name] == before + 1
+    store.flush()
+
+    for days in [0, 1, 30, 90, 400]:
+        reloaded = PatternStatsStore(path, half_life_days=30)
+        reloaded.load(now=saved_at(path) + days * 86400)
+        factor = 0.5 ** (days / 30)
+        for name in PatternStatsStore.COUNTERS:
+            decayed = {key: value * factor for key, value in expected[name].items() if value * factor >= 0.01}
+            assert reloaded.counter(name).keys() == decayed.keys()
+            for key, value in decayed.items():
+                assert abs(reloaded.counter(name)[key] - value) < 1e-9
+
+
+def test_flushes_after_flush_every_changes(tmp_path):
+    path = tmp_path / "pattern_stats.json"
+    store = PatternStatsStore(path, flush_every=5, flush_interval=3600)
+    for _ in range(4):
+        store.add('usage', "PAX-1")
+    assert not path.exists()
+    store.add('usage', "PAX-1")
+    assert path.exists() and store.dirty == 0
+
+    reloaded = PatternStatsStore(path)
+    reloaded.load(now=saved_at(path))
+    assert reloaded.counter('usage') == {"PAX-1": 5}
+
+
+def test_unreadable_file_leaves_counters_empty(tmp_path):
+    path = tmp_path / "pattern_stats.json"
+    path.write_text("{torn")
+    store = PatternStatsStore(path)
+    store.load()
+    assert all(not store.counter(name) for name in PatternStatsStore.COUNTERS)
@@ -0,0 +1,57 @@
+import random
+
+import pandas as pd
+
+from data.streaming_importer import StreamingImporter
+
+
+def random_rows(rng, count):
+    rows = []
+    for i in range(count):
+        emp_id = rng.choice([str(rng.randint(1, 9999)), f"00{rng.randint(1, 99)}", None])
+        rows.append((emp_id, rng.choice(["Ana", "Bo", None]), rng.choice(["M", "A", "RD", None]),
+                     rng.choice([rng.randint(0, 9), None])))
+    return rows
+
+
+def write_csv(path, rows):
+    frame = pd.DataFrame(rows, columns=['EMP ID', 'Name', '01/Mon', 'Hours'])
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_csv_chunks_equal_read_csv(tmp_path):
+    rng = random.Random(15)
+    for count in [0, 1, 7, 50, 123]:
+        path = write_csv(tmp_path / f"roster{count}.csv", random_rows(rng, count))
+        expected = pd.read_csv(path, dtype={'EMP ID': str})
+        chunk_size = rng.randint(1, 20)
+        chunks = list(StreamingImporter(path, chunk_size=chunk_size).iter_chunks())
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        pd.testing.assert_frame_equal(StreamingImporter(path, chunk_size=chunk_size).read(), expected,
+                                      check_index_type=False, check_dtype=False)
+
+
+def test_header_formatter_applies_to_every_chunk(tmp_path):
+    rng = random.Random(16)
+    path = write_csv(tmp_path / "roster.csv", random_rows(rng, 40))
+    importer = StreamingImporter(path, chunk_size=9, header_formatter=lambda df: df.rename(columns=str.upper))
+    for chunk in importer.iter_chunks():
+        assert list(chunk.columns) == ['EMP ID', 'NAME', '01/MON', 'HOURS']
+
+
+def test_xlsx_rows_keep_text_columns_as_strings(tmp_path):
+    rng = random.Random(17)
+    importer = StreamingImporter(write_csv(tmp_path / "roster.csv", []))
+    importer.columns = ['EMP ID', 'Name', '01/Mon', 'Hours']
+    rows = [(rng.choice([rng.randint(1, 9999), None]),) + row[1:] for row in random_rows(rng, 60)]
+    chunk = importer._xlsx_frame(rows)
+    expected = pd.DataFrame(rows, columns=importer.columns)
+    for col in importer.columns:
+        for value, raw in zip(chunk[col], expected[col]):
+            if pd.isna(raw):
+                assert pd.isna(value)
+            elif col == 'EMP ID':
+                assert value == str(int(raw))  # Never "12.0"
+            else:
+                assert value == raw
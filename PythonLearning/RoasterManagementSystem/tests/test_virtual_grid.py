@@ -0,0 +1,31 @@
+import pandas as pd
+
+
+def test_highlighted_rows_are_not_striped(make_grid):
+    grid = make_grid(pd.DataFrame({'EMP ID': ['1', '2', '3']}), height=5)
+    grid.set_row_tags({0: ('shift_M', 'shift_RD'), 2: ('shift_N',)})
+
+    tags = {grid.item_rows[item]: grid.tree.items[item]['tags'] for item in grid.pool}
+    assert tags == {0: ('shift_M', 'shift_RD'), 1: ('oddrow',), 2: ('shift_N',)}
+
+
+def test_stripe_tags_never_share_a_row_with_shift_tags(make_grid):
+    grid = make_grid(pd.DataFrame({'EMP ID': [str(i) for i in range(6)]}), height=10)
+    # The stripe tags are configured first, so on a shared row they would hide the shift colour
+    assert grid.tree.tag_order[:2] == ["evenrow", "oddrow"]
+    grid.set_row_tags({label: ('shift_A',) for label in range(0, 6, 2)})
+    for item in grid.pool:
+        tags = grid.tree.items[item]['tags']
+        assert not ({'evenrow', 'oddrow'} & set(tags) and any(tag.startswith('shift_') for tag in tags))
+
+
+def test_reset_forgets_state_of_the_previous_file(make_grid):
+    grid = make_grid(pd.DataFrame({'EMP ID': ['1', '2', '3']}), height=5)
+    grid.checked.update([0, 2])
+    grid.selected.add(1)
+    grid.set_row_tags({0: ('shift_M',)})
+    grid.top = 1
+
+    grid.reset()
+    grid.set_frame(pd.DataFrame({'EMP ID': ['7', '8']}))
+    assert grid.checked == set() and grid.selected_labels() == [] and grid.row_tags == {} and grid.top == 0
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from core.roster_processor import RosterProcessor
+
+
+def roster(columns, rows):
+    df = pd.DataFrame(rows, columns=columns)
+    df.insert(0, 'EMP ID', [str(i) for i in range(len(df))])
+    return df
+
+
+def test_weekend_count_agrees_with_has_weekend_rd():
+    processor = RosterProcessor()
+    rng = np.random.default_rng(4)
+    columns = [f"{day:02d}-03-2025" for day in range(1, 32)]
+    shifts = ['0600-1400', '1400-2200', 'RD', 'OFF', 'LEAVE', 'W/OFF', '2200-0600', '']
+    df = roster(columns, rng.choice(shifts, (300, len(columns))))
+    processor.df_processed = df
+
+    analysis = processor.weekend_rd_analysis()
+    expected = [processor.has_weekend_rd(row) for _, row in df.iterrows()]
+    assert list(analysis['has_weekend_rd']) == expected
+
+
+def test_streak_breaks_at_missing_weeks():
+    processor = RosterProcessor()
+    # Weekends of 1-2 March, 8-9 March and (after a missing week) 22-23 March 2025
+    columns = ["01-03-2025", "02-03-2025", "08-03-2025", "09-03-2025", "22-03-2025", "23-03-2025"]
+    df = roster(columns, [
+        ['RD', '0600-1400', 'OFF', '0600-1400', 'RD', 'RD'],
+        ['0600-1400', '0600-1400', 'RD', '0600-1400', 'LEAVE', '0600-1400'],
+    ])
+    processor.df_processed = df
+
+    analysis = processor.weekend_rd_analysis()
+    assert list(analysis['weekend_rd_streak']) == [2, 1]
+    assert list(analysis['weekend_rd']) == [4, 2]
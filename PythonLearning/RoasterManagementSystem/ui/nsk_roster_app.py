@@ -1,9 +1,23 @@
+import os
+import colorsys
+import pickle
+import time as tm
+import pandas as pd
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
-from core.roster_processor import RosterProcessor
+from tkinter import filedialog, messagebox, simpledialog
+import ttkbootstrap as ttk
+import numpy as np
+from core.roster_processor import RosterProcessor, SHIFT_TOKENS, TOKEN_SHIFTS
+from core.predictors import PREDICTOR_BACKENDS
+from core.search_index import RosterSearchIndex
 from data.data_detection_bot import DataDetectionBot
-from data.shift_pattern_bot import ShiftPatternBot
+from data.shift_pattern_bot import ShiftPatternBot, MixedDataImporter
 from data.data_cleanup_bot import DataCleanupBot
+from data.streaming_importer import StreamingImporter
+from data.import_cache import ImportCache
+from ui.starry_background import StarryBackground
+from ui.task_executor import TaskExecutor
+from ui.virtual_grid import VirtualGrid
 
 class NSKRosterApp:
     def __init__(self, root):
@@ -24,15 +38,21 @@ class NSKRosterApp:
         
         self.processor = RosterProcessor()
         self.importer = MixedDataImporter()
-        self.selected_rows = set()
+        self.import_cache = ImportCache()
+        self.use_import_cache = tk.BooleanVar(value=True)
+        self.tasks = TaskExecutor(root)
+        self.current_task = None
         self.checkbox_vars = {}
+        self.search_index = None
+        self.search_job = None
+        self.last_search = None  # (query, matching row positions) for incremental narrowing
         
         self.setup_ui()
         self.setup_pattern_learning_ui()
         self.setup_ai_tools()
         self.setup_autocomplete()
         self.shift_colors = {}
-        self.configured_tags = set()
+        self.highlighting = False
         self.column_widths = {}
         
         # Create starry background animation
@@ -49,11 +69,50 @@ class NSKRosterApp:
         # Handle window closing
         root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        # Build the AI model off the UI thread so the window comes up immediately
+        self.processor.warm_up_model()
+        self.check_ai_warm_up()
+        
+    def change_predictor_backend(self, backend):
+        """Switch the pattern prediction model and warm it up in the background"""
+        self.processor.set_predictor_backend(backend)
+        self.processor.warm_up_model()
+        self.check_ai_warm_up()
+        
+    def change_match_workers(self):
+        """Apply the worker count used to match unknown patterns"""
+        try:
+            self.processor.set_match_workers(self.workers_var.get())
+        except (tk.TclError, ValueError):
+            self.workers_var.set(self.processor.parallel_matcher.workers)
+            
+    def check_ai_warm_up(self):
+        """Poll the background model warm-up and update the AI status"""
+        state = self.processor.ai_state
+        if state in ("cold", "warming"):
+            self.ai_status.config(text="AI: warming")
+            self.root.after(250, self.check_ai_warm_up)
+        elif state == "ready":
+            self.ai_status.config(text=f"AI: Ready (model loaded in {self.processor.model_load_seconds:.1f}s)")
+        else:
+            self.ai_status.config(text=f"AI: Unavailable - {self.processor.ai_error}")
+            
+    def report_cold_start(self, start_time):
+        """Report time from process start until the window is idle and responsive"""
+        def report():
+            self.cold_start_seconds = tm.perf_counter() - start_time
+            print(f"Cold start: {self.cold_start_seconds:.2f}s")
+            self.status_var.set(f"Ready - NSK's Roster Analyzer Pro (started in {self.cold_start_seconds:.2f}s)")
+        self.root.after_idle(report)
+        
     def on_closing(self):
         """Save patterns and close the application"""
         self.processor.save_patterns()
         self.processor.save_trained_model()
+        self.processor.save_match_cache()
         if messagebox.askokcancel("Quit", "Do you want to quit NSK's Roster Analyzer?"):
+            self.tasks.shutdown()
+            self.processor.parallel_matcher.close()
             self.root.destroy()
             
     def on_resize(self, event):
@@ -74,6 +133,11 @@ class NSKRosterApp:
             self.update_treeview_style()
             self.status_var.set(f"Theme changed to: {theme_name}")
             
+            # Generated shift colours depend on the theme; recolour the existing tags
+            self.shift_colors.clear()
+            if self.highlighting:
+                self.configure_shift_tags()
+            
             # Special styling for Matrix theme
             if theme_name == "matrix":
                 self.style.configure("Treeview", 
@@ -203,6 +267,15 @@ class NSKRosterApp:
             )
             btn.pack(side="left", padx=5)
             self.create_tooltip(btn, tooltip)
+            
+        cache_toggle = ttk.Checkbutton(
+            primary_frame,
+            text="Cache imports",
+            variable=self.use_import_cache,
+            bootstyle="primary-round-toggle"
+        )
+        cache_toggle.pack(side="left", padx=5)
+        self.create_tooltip(cache_toggle, "Re-open unchanged files from a local snapshot; untick to bypass the cache")
         
         secondary_frame = ttk.Frame(btn_frame, style='Black.TFrame')
         secondary_frame.pack(side="right")
@@ -279,7 +352,9 @@ class NSKRosterApp:
             bootstyle="primary-round"
         )
         
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        # Rows are virtualized: the grid drives the vertical scrollbar itself
+        self.tree.configure(xscrollcommand=hsb.set)
+        self.table_view = VirtualGrid(self.tree, vsb)
         
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -311,6 +386,13 @@ class NSKRosterApp:
             bootstyle="primary-striped"
         )
         
+        self.cancel_button = ttk.Button(
+            status_frame,
+            text="Cancel",
+            command=self.cancel_current_task,
+            bootstyle="danger-link"
+        )
+        
         self.record_count_var = tk.StringVar()
         self.record_count_var.set("Records: 0")
         
@@ -346,7 +428,6 @@ class NSKRosterApp:
         self.tree.bind("<Button-1>", self.on_treeview_click)
         self.tree.bind("<Return>", self.on_enter_key)
         self.tree.bind("<ButtonRelease-1>", self.on_column_resize)
-        self.tree.bind("<<TreeviewSelect>>", self.highlight_selected_row)
         
         self.last_clicked_column = None
         self.last_clicked_row = None
@@ -362,25 +443,43 @@ class NSKRosterApp:
             messagebox.showwarning("No Data", "Please generate roster data first")
             return
             
-        self.progress.pack(side="right", padx=10)
-        self.progress.start()
-        self.status_var.set("Auto-detecting patterns...")
+        groups = self.processor.group_patterns()
+        frame = self.processor.df_processed
+        # Editing stays possible meanwhile; these tell done() which rows the user changed
+        codes_before = frame['Pattern Code'].copy()
+        patterns_before = self.processor.get_pattern_table()['Pattern'].copy()
         
-        try:
-            # Process each row
-            for idx, row in self.processor.df_processed.iterrows():
-                pattern_str, _, sequence = self.processor.get_shift_pattern(row)
-                
-                # Enhanced pattern detection
-                best_match, confidence = self.processor.detect_best_match(pattern_str, sequence)
-                
+        def work(task):
+            # Enhanced pattern detection, once per distinct pattern
+            return self.processor.detect_best_matches(groups.patterns, groups.sequences,
+                                                      progress=task.progress)
+        
+        def done(matches):
+            df = self.processor.df_processed
+            if df is not frame:
+                # The roster was regenerated meanwhile; the group row labels belong to the old one
+                self.status_var.set("Roster changed during auto-detect - results discarded")
+                return
+            # Rows whose code or shifts were edited during the task keep the user's version
+            unchanged = (df['Pattern Code'].eq(codes_before)
+                         & self.processor.get_pattern_table()['Pattern'].eq(patterns_before))
+            updated = []
+            skipped = 0
+            for rows, pattern_str, (best_match, confidence) in zip(
+                    groups.row_labels(), groups.patterns, matches):
                 if best_match and confidence > 0.5:
-                    self.processor.df_processed.at[idx, 'Pattern Code'] = best_match
-                    self.processor.record_pattern_usage(best_match)
+                    total = len(rows)
+                    rows = rows[unchanged.reindex(rows, fill_value=False).to_numpy()]
+                    skipped += total - len(rows)
+                    if not len(rows):
+                        continue
+                    df.loc[rows, 'Pattern Code'] = best_match
+                    updated.extend(rows)
+                    self.processor.record_pattern_usage(best_match, len(rows))
                     
                     # Learn with confidence based on similarity
                     if confidence > 0.8:
-                        self.processor.learn_pattern(pattern_str, best_match)
+                        self.processor.learn_pattern(pattern_str, best_match, len(rows))
                 else:
                     # Track unknown patterns
                     self.processor.unknown_patterns.add(pattern_str)
@@ -393,64 +492,115 @@ class NSKRosterApp:
             )
             self.learning_status_var.set(f"Learned: {learned} patterns | Unknown: {unknown} patterns")
             
-            self.update_table(self.processor.df_processed)
-            self.status_var.set(f"Auto-detected patterns. {learned} patterns learned")
+            self.refresh_rows(updated)
+            status = f"Auto-detected patterns. {learned} patterns learned"
+            if skipped:
+                status += f" ({skipped} rows edited meanwhile were left as they are)"
+            self.status_var.set(status)
             
-        except Exception as e:
+        def failed(e):
             messagebox.showerror("Error", f"Failed to auto-detect patterns: {str(e)}")
             self.status_var.set("Auto-detect failed")
-        finally:
-            self.progress.stop()
-            self.progress.pack_forget()
+            
+        self.run_task(work, done, failed, "Auto-detecting patterns...")
+        
+    def run_task(self, work, on_done, on_error, status_text, on_cancel=None):
+        """Run work(task) on the task executor, showing progress and a cancel button meanwhile"""
+        if self.busy():
+            return None
+            
+        self.status_var.set(status_text)
+        self.progress.configure(mode="indeterminate", value=0)
+        self.progress.pack(side="right", padx=10)
+        self.cancel_button.pack(side="right")
+        self.progress.start()
         
+        def finished(callback):
+            def handler(*args):
+                self.current_task = None
+                self.progress.stop()
+                self.progress.pack_forget()
+                self.cancel_button.pack_forget()
+                callback(*args)
+            return handler
+            
+        self.current_task = self.tasks.submit(
+            work,
+            on_done=finished(on_done),
+            on_error=finished(on_error),
+            on_cancel=finished(on_cancel or (lambda: self.status_var.set("Operation cancelled"))),
+            on_progress=self.show_task_progress,
+            name=status_text
+        )
+        return self.current_task
+        
+    def busy(self):
+        """True (after telling the user) while a background task is using the processor"""
+        if self.current_task is None:
+            return False
+        messagebox.showinfo("Busy", "Please wait for the current operation to finish, or cancel it")
+        return True
+        
+    def show_task_progress(self, percent, message=None):
+        """Switch the progress bar to real percentages once a task reports them"""
+        if str(self.progress.cget("mode")) != "determinate":
+            self.progress.stop()
+            self.progress.configure(mode="determinate", maximum=100)
+        self.progress.configure(value=percent)
+        if message:
+            self.status_var.set(message)
+            
+    def cancel_current_task(self):
+        if self.current_task is not None:
+            self.current_task.cancel()
+            self.status_var.set("Cancelling...")
+            
     def select_all_rows(self):
         """Select all rows in the table"""
-        for item in self.tree.get_children():
-            self.tree.set(item, "Select", "☑")
-            self.selected_rows.add(item)
+        self.table_view.set_all_checked(True)
         
     def deselect_all_rows(self):
         """Deselect all rows in the table"""
-        for item in self.tree.get_children():
-            self.tree.set(item, "Select", "☐")
-            self.selected_rows.discard(item)
+        self.table_view.set_all_checked(False)
         
     def update_table(self, df):
         if df is None:
             return
             
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
         # Remove any existing serial number column to prevent duplication
         if '#' in df.columns:
             df = df.drop(columns=['#'])
             
-        # Add fresh serial numbers
-        df = df.copy()
-        df.insert(0, "#", range(1, len(df)+1))
-        
-        # Add checkbox column
-        df.insert(0, "Select", "☐")
-        
-        # Configure treeview columns
-        self.tree["columns"] = list(df.columns)
-        
-        # Configure checkbox column
-        self.tree.column("Select", width=50, anchor="center")
-        self.tree.heading("Select", text="✓")
-        
-        # Configure other columns
-        for col in df.columns[1:]:  # Skip checkbox column
-            self.tree.heading(col, text=col, anchor="center")
-            self.tree.column(col, width=100, anchor='center')
+        # Checkbox and fresh serial numbers come first; the grid fills them in per row
+        columns = ["Select", "#"] + list(df.columns)
+        if list(self.tree["columns"]) != columns:
+            self.tree["columns"] = columns
+            
+            # Configure checkbox column
+            self.tree.column("Select", width=50, anchor="center")
+            self.tree.heading("Select", text="✓")
+            
+            # Configure other columns
+            for col in columns[1:]:  # Skip checkbox column
+                self.tree.heading(col, text=col, anchor="center")
+                self.tree.column(col, width=100, anchor='center')
         
-        # Add data with checkboxes
-        for idx, (_, row) in enumerate(df.iterrows()):
-            values = [row[col] for col in df.columns]
-            self.tree.insert("", "end", values=values, tags=(f"row{idx}",))
-            self.tree.tag_configure(f"row{idx}", background='black' if idx % 2 else '#111111')
+        # Only the rows in view are materialized
+        self.table_view.set_frame(df)
+
+    def refresh_rows(self, labels):
+        """Apply edits to just these rows of the table instead of rebuilding it"""
+        df = self.processor.df_processed
+        if df is None:
+            return []
+        changed = self.table_view.refresh_rows(df, labels)
+        # Edit handlers write cells into the grid before calling this, so the grid's
+        # diff can miss them; re-tag and re-index every row passed in
+        self.update_row_highlights(labels)
+        if self.search_index is not None and self.search_index.frame is df:
+            self.search_index.update_rows(df, labels)
+            self.last_search = None  # Edited rows may now match differently
+        return changed
 
     def on_column_resize(self, event):
         region = self.tree.identify("region", event.x, event.y)
@@ -459,10 +609,6 @@ class NSKRosterApp:
                 width = self.tree.column(col, width=True)
                 self.column_widths[col] = width
                 
-    def highlight_selected_row(self, event):
-        for item in self.tree.selection():
-            self.tree.item(item, tags=("selected_row",))
-            
     def setup_pattern_learning_ui(self):
         """Create pattern learning panel"""
         self.learning_frame = ttk.LabelFrame(
@@ -536,6 +682,35 @@ class NSKRosterApp:
             width=15
         ).pack(side="left", padx=5)
         
+        ttk.Label(ai_frame, text="Model:", font=("Segoe UI", 9)).pack(side="left", padx=(10, 5))
+        self.backend_var = tk.StringVar(value=self.processor.predictor_backend)
+        backend_combo = ttk.Combobox(
+            ai_frame,
+            textvariable=self.backend_var,
+            values=list(PREDICTOR_BACKENDS),
+            state="readonly",
+            width=8,
+            bootstyle="success"
+        )
+        backend_combo.pack(side="left")
+        backend_combo.bind("<<ComboboxSelected>>", lambda e: self.change_predictor_backend(self.backend_var.get()))
+        
+        ttk.Label(ai_frame, text="Workers:", font=("Segoe UI", 9)).pack(side="left", padx=(10, 5))
+        self.workers_var = tk.IntVar(value=self.processor.parallel_matcher.workers)
+        workers_spin = ttk.Spinbox(
+            ai_frame,
+            from_=1,
+            to=os.cpu_count() or 1,
+            textvariable=self.workers_var,
+            command=self.change_match_workers,
+            width=3,
+            bootstyle="success"
+        )
+        workers_spin.pack(side="left")
+        workers_spin.bind("<FocusOut>", lambda e: self.change_match_workers())
+        workers_spin.bind("<Return>", lambda e: self.change_match_workers())
+        self.create_tooltip(workers_spin, "Processes used to match unknown patterns during Auto Detect")
+        
         self.ai_status = ttk.Label(
             ai_frame, 
             text="AI: Ready",
@@ -545,43 +720,36 @@ class NSKRosterApp:
         self.ai_status.pack(side="left", padx=10, fill="x", expand=True)
         
     def train_ai_model(self):
-        """Train the neural network model"""
+        """Train the pattern prediction model"""
         if self.processor.df_processed is None:
             messagebox.showwarning("No Data", "Please generate roster data first")
             return
             
-        self.progress.pack(side="right", padx=10)
-        self.progress.start()
-        self.ai_status.config(text="AI: Training model...")
+        # One sample per distinct (pattern, code) pair, weighted by how many rows share it
+        X_train, y_train, weights = self.processor.build_training_set()
+        n_samples = int(weights.sum())
         
-        try:
-            X_train = []
-            y_train = []
+        if not X_train:
+            messagebox.showwarning("Insufficient Data", 
+                                  "Labeled patterns are required for training")
+            self.ai_status.config(text="AI: Training failed - insufficient data")
+            return
             
-            for _, row in self.processor.df_processed.iterrows():
-                pattern_str, _, _ = self.processor.get_shift_pattern(row)
-                pattern_code = row.get("Pattern Code", "")
-                
-                if pattern_code and pattern_code in self.processor.PATTERN_CODES:
-                    X_train.append(self.processor.pattern_to_sequence(pattern_str))
-                    y_train.append(pattern_code)
-            
-            if len(X_train) > 0:
-                self.processor.train_model(X_train, y_train)
-                self.ai_status.config(text="AI: Model trained successfully")
-                messagebox.showinfo("Training Complete", 
-                                   f"Model trained with {len(X_train)} samples")
-            else:
-                messagebox.showwarning("Insufficient Data", 
-                                      "Labeled patterns are required for training")
-                self.ai_status.config(text="AI: Training failed - insufficient data")
+        def work(task):
+            self.processor.train_model(X_train, y_train, progress=task.progress, sample_weight=weights)
             
-        except Exception as e:
+        def done(result):
+            self.ai_status.config(text="AI: Model trained successfully")
+            self.status_var.set(f"Model trained with {n_samples} samples ({len(X_train)} distinct)")
+            messagebox.showinfo("Training Complete", 
+                               f"Model trained with {n_samples} samples ({len(X_train)} distinct)")
+            
+        def failed(e):
             messagebox.showerror("Training Error", f"Failed to train model: {str(e)}")
             self.ai_status.config(text=f"AI: Error - {str(e)}")
-        finally:
-            self.progress.stop()
-            self.progress.pack_forget()
+            
+        self.ai_status.config(text="AI: Training model...")
+        self.run_task(work, done, failed, "Training pattern model...")
     
     def cluster_unknown_patterns(self):
         """Cluster unknown patterns for analysis"""
@@ -589,13 +757,12 @@ class NSKRosterApp:
             messagebox.showinfo("No Unknowns", "No unknown patterns to cluster")
             return
             
-        self.progress.pack(side="right", padx=10)
-        self.progress.start()
-        self.ai_status.config(text="AI: Clustering patterns...")
+        unknown = list(self.processor.unknown_patterns)
         
-        try:
-            clusters = self.processor.cluster_patterns(list(self.processor.unknown_patterns))
+        def work(task):
+            return self.processor.cluster_patterns(unknown, progress=task.progress)
             
+        def done(clusters):
             if clusters:
                 cluster_text = "Pattern Clusters:\n\n"
                 for cluster_id, patterns in clusters.items():
@@ -627,13 +794,14 @@ class NSKRosterApp:
             else:
                 messagebox.showinfo("Clustering Result", "No significant clusters found")
                 self.ai_status.config(text="AI: No clusters found")
+            self.status_var.set("Clustering complete")
                 
-        except Exception as e:
+        def failed(e):
             messagebox.showerror("Clustering Error", f"Failed to cluster patterns: {str(e)}")
             self.ai_status.config(text=f"AI: Error - {str(e)}")
-        finally:
-            self.progress.stop()
-            self.progress.pack_forget()
+            
+        self.ai_status.config(text="AI: Clustering patterns...")
+        self.run_task(work, done, failed, "Clustering unknown patterns...")
     
     def generate_insights(self):
         """Generate insights about shift patterns"""
@@ -641,24 +809,23 @@ class NSKRosterApp:
             messagebox.showwarning("No Data", "Please generate roster data with pattern codes first")
             return
             
-        self.progress.pack(side="right", padx=10)
-        self.progress.start()
-        self.ai_status.config(text="AI: Analyzing patterns...")
+        df = self.processor.df_processed
         
-        try:
-            pattern_counts = self.processor.df_processed["Pattern Code"].value_counts()
+        def work(task):
+            pattern_counts = df["Pattern Code"].value_counts()
             
             top_patterns = pattern_counts.head(5)
+            task.progress(30)
             
-            shift_dist = {"M": 0, "A": 0, "N": 0, "RD": 0}
-            for _, row in self.processor.df_processed.iterrows():
-                pattern_str, shift_counts, _ = self.processor.get_shift_pattern(row)
-                for shift, count in shift_counts.items():
-                    if shift in shift_dist:
-                        shift_dist[shift] += count
+            shift_totals = self.processor.get_pattern_table()[["M", "A", "N", "RD"]].sum()
+            shift_dist = {shift: int(count) for shift, count in shift_totals.items()}
+            task.progress(60)
+            
+            weekend = self.processor.weekend_rd_analysis()
+            task.progress(80)
             
             insights = "Shift Pattern Insights:\n\n"
-            insights += f"Total Employees: {len(self.processor.df_processed)}\n"
+            insights += f"Total Employees: {len(df)}\n"
             insights += f"Unique Patterns: {len(pattern_counts)}\n\n"
             
             insights += "Top 5 Patterns:\n"
@@ -670,7 +837,16 @@ class NSKRosterApp:
             for shift, count in shift_dist.items():
                 percentage = (count / total_shifts) * 100 if total_shifts else 0
                 insights += f" - {shift}: {count} shifts ({percentage:.1f}%)\n"
-            
+                
+            if weekend is not None and len(weekend):
+                with_rd = int(weekend['has_weekend_rd'].sum())
+                insights += "\nWeekend Rest Days:\n"
+                insights += f" - Employees with a weekend RD: {with_rd} ({with_rd / len(weekend) * 100:.1f}%)\n"
+                insights += f" - Average weekend RD days: {weekend['weekend_rd'].mean():.1f}\n"
+                insights += f" - Longest run of weekends off: {int(weekend['weekend_rd_streak'].max())}\n"
+            return insights
+            
+        def done(insights):
             insights_window = tk.Toplevel(self.root)
             insights_window.title("Pattern Insights")
             insights_window.geometry("500x400")
@@ -690,13 +866,14 @@ class NSKRosterApp:
             text_area.config(state="disabled")
             
             self.ai_status.config(text="AI: Insights generated")
+            self.status_var.set("Insights generated")
             
-        except Exception as e:
+        def failed(e):
             messagebox.showerror("Analysis Error", f"Failed to generate insights: {str(e)}")
             self.ai_status.config(text=f"AI: Error - {str(e)}")
-        finally:
-            self.progress.stop()
-            self.progress.pack_forget()
+            
+        self.ai_status.config(text="AI: Analyzing patterns...")
+        self.run_task(work, done, failed, "Generating insights...")
     
     def create_tooltip(self, widget, text):
         def show_tooltip(event):
@@ -732,28 +909,59 @@ class NSKRosterApp:
         self.autocomplete_window = None
         self.autocomplete_listbox = None
         self.current_edit = None
+        self.autocomplete_job = None
         self.selected_index = 0
         
-    def search_data(self, event=None):
-        search_term = self.search_var.get().lower()
+    def current_frame(self):
+        """The frame the table shows when no search filter is active"""
+        if self.processor.df_processed is not None:
+            return self.processor.df_processed
+        return self.processor.df_original
+        
+    def get_search_index(self):
+        """Search index over the current frame, built once per loaded frame"""
+        df = self.current_frame()
+        if df is None:
+            return None
+        if self.search_index is None or self.search_index.frame is not df:
+            self.search_index = RosterSearchIndex(df)
+            self.last_search = None
+        return self.search_index
         
-        if not search_term:
-            self.update_table(self.processor.df_processed if self.processor.df_processed is not None else self.processor.df_original)
+    def search_data(self, event=None):
+        # Debounce: search once typing pauses
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(150, self.run_search)
+        
+    def run_search(self):
+        self.search_job = None
+        query = self.search_var.get()
+        index = self.get_search_index()
+        if index is None:
             return
             
-        if self.processor.df_processed is not None:
-            df = self.processor.df_processed
-        elif self.processor.df_original is not None:
-            df = self.processor.df_original
-        else:
+        if not query.strip():
+            self.last_search = None
+            self.update_table(index.frame)
             return
             
-        filtered_df = df[df.astype(str).apply(lambda x: x.str.lower().str.contains(search_term, na=False)).any(axis=1)]
-        self.update_table(filtered_df)
+        # Typing more characters only narrows the previous result set
+        within = None
+        if self.last_search and index.narrows(self.last_search[0], query):
+            within = self.last_search[1]
+        rows = index.search(query, within)
+        self.last_search = (query, rows)
+        self.update_table(index.frame.iloc[rows])
+        self.status_var.set(f"Search: {len(rows)} matching rows")
         
     def clear_search(self):
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
         self.search_var.set("")
-        self.update_table(self.processor.df_processed if self.processor.df_processed is not None else self.processor.df_original)
+        self.last_search = None
+        self.update_table(self.current_frame())
         
     def show_context_menu(self, event):
         context_menu = tk.Menu(self.root, tearoff=0, bg='black', fg='white')
@@ -809,53 +1017,108 @@ class NSKRosterApp:
             return
             
         pattern_col = len(self.tree["columns"]) - 1  # Last column is pattern code
+        col_name = self.tree["columns"][pattern_col]
+        selected_rows = self.table_view.selected_labels()
         
-        for item in selected_items:
+        for index in selected_rows:
             # Update treeview
-            values = list(self.tree.item(item)['values'])
-            values[pattern_col] = self.copied_pattern
-            self.tree.item(item, values=values)
+            self.table_view.set_value(index, col_name, self.copied_pattern)
             
             # Update dataframe
             if self.processor.df_processed is not None:
-                index = int(self.tree.index(item))
-                col_name = self.tree["columns"][pattern_col]
-                self.processor.df_processed.at[index, col_name] = self.copied_pattern
+                self.processor.set_cell(index, col_name, self.copied_pattern)
                 
-        self.status_var.set(f"Pasted pattern code to {len(selected_items)} rows")
-        self.update_table(self.processor.df_processed)
+        self.status_var.set(f"Pasted pattern code to {len(selected_rows)} rows")
+        self.refresh_rows(selected_rows)
     
     def browse_file(self):
         file_path = filedialog.askopenfilename(
             title="Select Roster File",
             filetypes=[("Excel files", "*.xlsx *.xls"), ("CSV files", "*.csv"), ("All files", "*.*")]
         )
-        if file_path:
-            self.progress.pack(side="right", padx=10)
-            self.progress.start()
+        if not file_path:
+            return
             
-            try:
-                if file_path.endswith('.csv'):
-                    df = pd.read_csv(file_path, dtype={'EMP ID': str})
-                else:
-                    df = pd.read_excel(file_path, dtype={'EMP ID': str})
-                
-                df = self.processor.format_date_headers(df)
-                self.processor.df_original = df
-                self.update_table(df)
-                self.status_var.set(f"Loaded: {os.path.basename(file_path)} - {len(df)} records")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
-                self.status_var.set("Error loading file")
-            finally:
-                self.progress.stop()
-                self.progress.pack_forget()
+        file_name = os.path.basename(file_path)
+        
+        use_cache = self.use_import_cache.get()
+        shown = False  # Whether a chunk of the new file is on screen yet
+        
+        def work(task):
+            digest = None
+            if use_cache:
+                try:
+                    df, digest = self.import_cache.load(file_path)
+                    if df is not None:
+                        return df
+                except (OSError, KeyError, ValueError, EOFError, pickle.UnpicklingError) as e:
+                    # A corrupt or outdated cache must not stop the import; read the file instead
+                    print(f"Import cache unavailable: {e}")
+                    
+            # Chunks are shown as they arrive; the full frame is assembled once at the end
+            importer = StreamingImporter(file_path, header_formatter=self.processor.format_date_headers)
+            chunks = []
+            for chunk in importer.iter_chunks(task.progress):
+                chunks.append(chunk)
+                self.tasks.post(show_chunk, chunk, len(chunks) == 1)
+            if not chunks:
+                return pd.DataFrame(columns=importer.columns or [])
+            df = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+            
+            if use_cache:
+                task.check_cancelled()
+                try:
+                    self.import_cache.store(file_path, df, digest)
+                except Exception as e:
+                    print(f"Could not cache import: {e}")
+            return df
+            
+        def show_chunk(chunk, first):
+            if self.current_task is None:
+                return  # Cancelled or failed meanwhile
+            nonlocal shown
+            if first:
+                # Row labels restart at 0, so state kept by label would land on unrelated rows
+                self.table_view.reset()
+                shown = True
+                self.update_table(chunk)
+            else:
+                self.table_view.append_rows(chunk)
+            self.status_var.set(f"Loading {file_name}... {len(self.table_view.labels)} records")
+            
+        def done(df):
+            self.processor.df_original = df
+            self.highlighting = False
+            if shown:
+                self.table_view.set_row_tags({})
+            else:
+                self.table_view.reset()  # Served from the import cache without chunks
+            self.update_table(df)
+            self.status_var.set(f"Loaded: {file_name} - {len(df)} records")
+            
+        def restore_table():
+            df = self.current_frame()
+            self.update_table(df if df is not None else pd.DataFrame())
+            if self.highlighting:
+                self.highlight_shifts()
+            
+        def failed(e):
+            restore_table()
+            messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
+            self.status_var.set("Error loading file")
+            
+        def cancelled():
+            restore_table()
+            self.status_var.set("Loading cancelled")
+            
+        self.run_task(work, done, failed, f"Loading {file_name}...", on_cancel=cancelled)
     
     def generate_roster(self):
         if self.processor.df_original is None:
             messagebox.showwarning("No Data", "Please load a file first")
             return
+        if self.busy():
+            return
             
         self.progress.pack(side="right", padx=10)
         self.progress.start()
@@ -863,6 +1126,7 @@ class NSKRosterApp:
         try:
             df = self.processor.generate_roster_begin()
             self.update_table(df)
+            self.highlight_shifts()
             self.status_var.set("Roster dates generated with Pattern Code column")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -914,55 +1178,58 @@ class NSKRosterApp:
         
         self.status_var.set(f"Pattern validation: {valid_count} valid, {len(invalid_codes)} invalid")
     
-    def highlight_shifts(self, df):
-        if df is None:
+    def highlight_shifts(self, df=None):
+        """Colour rows by the shift types they contain, using the processor's cached shift grid"""
+        tokens = self.processor.get_shift_tokens(df)
+        if tokens is None:
             return
-            
-        for idx, item in enumerate(self.tree.get_children()):
-            tag = "evenrow" if idx % 2 == 0 else "oddrow"
-            self.tree.item(item, tags=(tag,))
-        
-        shift_columns = [col for col in df.columns if any(char in str(col) for char in ["/", "-"])]
-        
-        # Process each row
-        for idx, (_, row) in enumerate(df.iterrows()):
-            if idx >= len(self.tree.get_children()):
-                continue
-                
-            item = self.tree.get_children()[idx]
-            current_tags = list(self.tree.item(item, "tags"))
-            
-            # Process each shift column
-            for col in shift_columns:
-                if col not in df.columns:
-                    continue
-                    
-                shift = str(row[col]).strip()
-                if not shift:
-                    continue
-                
-                # Create a tag for this specific shift
-                shift_type = self.processor.get_shift_type(shift)
-                tag_name = f"shift_{shift_type}"
-                color = self.generate_color(shift_type, col)
-                
-                # Configure the tag if not already done
-                if tag_name not in self.configured_tags:
-                    self.tree.tag_configure(tag_name, background=color)
-                    self.configured_tags.add(tag_name)
-                
-                # Add the tag to the current tags
-                if tag_name not in current_tags:
-                    current_tags.append(tag_name)
-            
-            # Update item tags
-            self.tree.item(item, tags=current_tags)
+        self.configure_shift_tags()
+        # Tags are only applied as rows are drawn, so this costs the visible rows
+        self.table_view.set_row_tags(self.shift_row_tags(tokens))
+        self.highlighting = True
+        
+    def shift_row_tags(self, tokens):
+        """Row label -> shift tags in order of first appearance, computed per distinct colour class"""
+        values = tokens.to_numpy()
+        n_rows, n_cols = values.shape
+        shift_tokens = sorted(SHIFT_TOKENS.values())
+        
+        # Column of first appearance of each shift token in each row (n_cols if absent)
+        first = np.full((n_rows, len(shift_tokens)), n_cols)
+        for i, token in enumerate(shift_tokens):
+            present = values == token
+            first[:, i] = np.where(present.any(axis=1), present.argmax(axis=1), n_cols)
+            
+        # A row's colour class is its present tokens ordered by first appearance
+        order = np.argsort(first, axis=1, kind="stable")
+        ordered_first = np.take_along_axis(first, order, axis=1)
+        class_keys = np.where(ordered_first < n_cols, np.asarray(shift_tokens)[order], 0)
+        classes, class_ids = np.unique(class_keys, axis=0, return_inverse=True)
+        
+        class_tags = [tuple(self.shift_tag(token) for token in key if token) for key in classes]
+        return dict(zip(tokens.index, (class_tags[i] for i in class_ids.ravel())))
+        
+    def shift_tag(self, token):
+        return f"shift_{TOKEN_SHIFTS[token]}"
+        
+    def configure_shift_tags(self):
+        """(Re)configure the shift colour tags; rows keep their tags, so nothing is re-classified"""
+        for token in sorted(TOKEN_SHIFTS):
+            self.tree.tag_configure(self.shift_tag(token), background=self.generate_color(TOKEN_SHIFTS[token]))
+            
+    def update_row_highlights(self, labels):
+        """Recompute the colour class of edited rows only"""
+        if not self.highlighting or self.processor.df_processed is None:
+            return
+        tokens = self.processor.get_shift_tokens()
+        labels = [label for label in labels if label in tokens.index]
+        if labels:
+            self.table_view.row_tags.update(self.shift_row_tags(tokens.loc[labels]))
+            self.table_view.render_rows(labels)
     
-    def generate_color(self, shift_type, column_name):
-        key = f"{column_name}_{shift_type}"
-        
-        if key in self.shift_colors:
-            return self.shift_colors[key]
+    def generate_color(self, shift_type):
+        if shift_type in self.shift_colors:
+            return self.shift_colors[shift_type]
             
         # Special colors for common shift types
         color_map = {
@@ -974,7 +1241,7 @@ class NSKRosterApp:
         
         # Use predefined color if available
         if shift_type in color_map:
-            self.shift_colors[key] = color_map[shift_type]
+            self.shift_colors[shift_type] = color_map[shift_type]
             return color_map[shift_type]
                 
         # Generate random color for other shifts
@@ -986,7 +1253,7 @@ class NSKRosterApp:
         r, g, b = int(r * 255), int(g * 255), int(b * 255)
         
         color = f"#{r:02x}{g:02x}{b:02x}"
-        self.shift_colors[key] = color
+        self.shift_colors[shift_type] = color
         return color
         
     def on_double_click(self, event):
@@ -1001,7 +1268,7 @@ class NSKRosterApp:
                 
                 # Add pattern to learning if new
                 if self.processor.df_processed is not None:
-                    index = int(self.tree.index(item))
+                    index = self.table_view.row_label(item)
                     col_name = self.tree["columns"][int(column[1:])-1]
                     if col_name == "Pattern Code":
                         pattern_code = self.tree.set(item, column)
@@ -1010,8 +1277,7 @@ class NSKRosterApp:
     
     def ask_to_learn_pattern(self, index, pattern_code):
         """Prompt user to save a new pattern"""
-        row = self.processor.df_processed.iloc[index]
-        pattern_str, _, _ = self.processor.get_shift_pattern(row)
+        pattern_str, _, _ = self.processor.get_row_pattern(index)
         
         response = messagebox.askyesno(
             "New Pattern Detected",
@@ -1032,50 +1298,58 @@ class NSKRosterApp:
     def on_treeview_click(self, event):
         region = self.tree.identify("region", event.x, event.y)
         if region == "cell":
+            item = self.tree.identify_row(event.y)
+            if not item:
+                return
             self.last_clicked_column = self.tree.identify_column(event.x)
-            self.last_clicked_row = self.tree.identify_row(event.y)
+            self.last_clicked_row = self.table_view.row_label(item)  # Row label, items are recycled
             
             # Handle checkbox toggle
             if self.last_clicked_column == "#1":  # First column is checkbox
-                current_val = self.tree.set(self.last_clicked_row, "Select")
-                if current_val == "☐":
-                    self.tree.set(self.last_clicked_row, "Select", "☑")
-                    self.selected_rows.add(self.last_clicked_row)
-                else:
-                    self.tree.set(self.last_clicked_row, "Select", "☐")
-                    self.selected_rows.discard(self.last_clicked_row)
+                self.table_view.toggle_checked(self.last_clicked_row)
                     
     def on_enter_key(self, event):
-        if self.last_clicked_row and self.last_clicked_column:
+        if self.last_clicked_row is not None and self.last_clicked_column:
             if self.last_clicked_column != "#1":  # Skip checkbox column
-                next_item = self.tree.next(self.last_clicked_row)
-                if next_item:
+                next_row = self.table_view.next_label(self.last_clicked_row)
+                if next_row is not None:
+                    next_item = self.table_view.item_for_label(next_row)
                     self.tree.selection_set(next_item)
                     self.tree.focus(next_item)
-                    self.tree.see(next_item)
-                    self.last_clicked_row = next_item
+                    self.last_clicked_row = next_row
                     self.edit_cell(next_item, self.last_clicked_column)
                     
     def copy_from_above(self, event):
-        if self.last_clicked_row and self.last_clicked_column:
-            prev_item = self.tree.prev(self.last_clicked_row)
-            if prev_item:
-                value_above = self.tree.set(prev_item, self.last_clicked_column)
+        if self.last_clicked_row is not None and self.last_clicked_column:
+            prev_row = self.table_view.next_label(self.last_clicked_row, -1)
+            if prev_row is not None:
+                col_name = self.tree["columns"][int(self.last_clicked_column[1:])-1]
+                if col_name in ("Select", "#"):
+                    return
+                value_above = self.table_view.value(prev_row, col_name)
                 
-                selected_items = self.tree.selection()
-                for item in selected_items:
-                    self.tree.set(item, self.last_clicked_column, value_above)
+                selected_rows = self.table_view.selected_labels()
+                for index in selected_rows:
+                    self.table_view.set_value(index, col_name, value_above)
                     
                     if self.processor.df_processed is not None:
-                        index = int(self.tree.index(item))
-                        col_name = self.tree["columns"][int(self.last_clicked_column[1:])-1]
-                        self.processor.df_processed.at[index, col_name] = value_above
+                        self.processor.set_cell(index, col_name, value_above)
                         
                 self.status_var.set("Copied from above")
-                self.update_table(self.processor.df_processed)
+                self.refresh_rows(selected_rows)
                 
+    def edit_row_cell(self, index, column):
+        """Scroll a row into view and open the editor on it once the Treeview has redrawn"""
+        item = self.table_view.item_for_label(index)
+        if item:
+            self.root.after_idle(lambda: self.edit_cell(item, column))
+            
     def edit_cell(self, item, column):
-        x, y, width, height = self.tree.bbox(item, column)
+        index = self.table_view.row_label(item)  # The edit follows the row, not the recycled item
+        bbox = self.tree.bbox(item, column)
+        if not bbox:
+            return
+        x, y, width, height = bbox
         current_value = self.tree.set(item, column)
         
         entry = ttk.Entry(
@@ -1088,30 +1362,32 @@ class NSKRosterApp:
         entry.select_range(0, tk.END)
         entry.focus()
         
-        entry.bind("<Return>", lambda e: self.save_cell(item, column, entry))
-        entry.bind("<Tab>", lambda e: self.save_cell(item, column, entry))
+        entry.bind("<Return>", lambda e: self.save_cell(index, column, entry))
+        entry.bind("<Tab>", lambda e: self.save_cell(index, column, entry))
         entry.bind("<Escape>", lambda e: self.cancel_edit(entry))
         entry.bind("<KeyRelease>", lambda e: self.update_autocomplete(entry))
         entry.bind("<Up>", lambda e: self.handle_entry_up(e))
         entry.bind("<Down>", lambda e: self.handle_entry_down(e))
         
-        self.current_edit = (item, column, entry)
+        self.current_edit = (index, column, entry)
         self.selected_index = 0
         
         # Auto-detect only for pattern code column
         col_index = int(column[1:]) - 1
         if self.tree["columns"][col_index] == "Pattern Code":
-            self.auto_detect_pattern(item, column, entry)
+            self.auto_detect_pattern(index, column, entry)
     
-    def auto_detect_pattern(self, item, column, entry):
+    def auto_detect_pattern(self, index, column, entry):
         if self.processor.df_processed is None:
             return
-            
-        index = int(self.tree.index(item))
-        row = self.processor.df_processed.iloc[index]
-        
-        # Get the shift pattern string and sequence
-        pattern_str, _, sequence = self.processor.get_shift_pattern(row)
+        # Matching shares the scorer and match cache with any background detection, so
+        # only the suggestion waits for it; the editor itself stays open
+        if self.current_task is not None:
+            self.status_var.set("No auto-detect suggestion while another operation is running")
+            return
+
+        # Get the cached shift pattern string and sequence
+        pattern_str, _, sequence = self.processor.get_row_pattern(index)
         
         # Enhanced pattern detection
         best_match, confidence = self.processor.detect_best_match(pattern_str, sequence)
@@ -1147,9 +1423,13 @@ class NSKRosterApp:
         self.current_edit = None
     
     def update_autocomplete(self, entry):
-        self.root.after(100, self._delayed_autocomplete, entry)
+        # Debounce: only the last keystroke within 100ms triggers a lookup
+        if self.autocomplete_job:
+            self.root.after_cancel(self.autocomplete_job)
+        self.autocomplete_job = self.root.after(100, self._delayed_autocomplete, entry)
     
     def _delayed_autocomplete(self, entry):
+        self.autocomplete_job = None
         if not entry.winfo_exists():
             return
             
@@ -1258,7 +1538,7 @@ class NSKRosterApp:
             if selection:
                 selected_index = selection[0]
                 selection_text = self.autocomplete_listbox.get(selected_index)
-                item, column, entry = self.current_edit
+                index, column, entry = self.current_edit
                 
                 if not entry.winfo_exists():
                     self.hide_autocomplete()
@@ -1266,31 +1546,28 @@ class NSKRosterApp:
                 
                 entry.delete(0, tk.END)
                 entry.insert(0, selection_text)
-                self.tree.set(item, column, selection_text)
+                col_name = self.tree["columns"][int(column[1:])-1]
+                self.table_view.set_value(index, col_name, selection_text)
                 
                 if self.processor.df_processed is not None:
-                    index = int(self.tree.index(item))
-                    col_name = self.tree["columns"][int(column[1:])-1]
-                    self.processor.df_processed.at[index, col_name] = selection_text
+                    self.processor.set_cell(index, col_name, selection_text)
                     
                     # LEARN PATTERN: Map shift pattern to this code
                     if col_name == "Pattern Code":
-                        row = self.processor.df_processed.iloc[index]
-                        pattern_str, _, _ = self.processor.get_shift_pattern(row)
+                        pattern_str, _, _ = self.processor.get_row_pattern(index)
                         self.processor.learn_pattern(pattern_str, selection_text)
                         self.processor.record_pattern_usage(selection_text)
                 
                 self.hide_autocomplete()
                 entry.destroy()
                 self.current_edit = None
+                self.refresh_rows([index])
                 
-                next_item = self.tree.next(item)
-                if next_item:
-                    self.tree.see(next_item)
-                    self.root.after(100, lambda: self.edit_cell(next_item, column))
-                self.update_table(self.processor.df_processed)
+                next_row = self.table_view.next_label(index)
+                if next_row is not None:
+                    self.edit_row_cell(next_row, column)
 
-    def save_cell(self, item, column, entry):
+    def save_cell(self, index, column, entry):
         if not entry.winfo_exists():
             return
         
@@ -1299,37 +1576,32 @@ class NSKRosterApp:
             return
             
         new_value = entry.get()
-        self.tree.set(item, column, new_value)
+        col_name = self.tree["columns"][int(column[1:])-1]
+        self.table_view.set_value(index, col_name, new_value)
         
         if self.processor.df_processed is not None:
-            index = int(self.tree.index(item))
-            col_name = self.tree["columns"][int(column[1:])-1]
-            self.processor.df_processed.at[index, col_name] = new_value
+            self.processor.set_cell(index, col_name, new_value)
             
             # LEARN PATTERN if this is a pattern code column
             if col_name == "Pattern Code":
-                row = self.processor.df_processed.iloc[index]
-                pattern_str, _, _ = self.processor.get_shift_pattern(row)
+                pattern_str, _, _ = self.processor.get_row_pattern(index)
                 self.processor.learn_pattern(pattern_str, new_value)
                 self.processor.record_pattern_usage(new_value)
         
         self.hide_autocomplete()
         entry.destroy()
         self.current_edit = None
+        self.refresh_rows([index])
         
         # Move to next cell in same row
         col_index = int(column[1:])
         if col_index < len(self.tree["columns"]):
-            next_col = f"#{col_index + 1}"
-            self.root.after(100, lambda: self.edit_cell(item, next_col))
+            self.edit_row_cell(index, f"#{col_index + 1}")
         else:
             # Move to next row if at end of row
-            next_item = self.tree.next(item)
-            if next_item:
-                self.tree.see(next_item)
-                self.root.after(100, lambda: self.edit_cell(next_item, "#2"))
-                
-        self.update_table(self.processor.df_processed)
+            next_row = self.table_view.next_label(index)
+            if next_row is not None:
+                self.edit_row_cell(next_row, "#2")
     
     def export_to_excel(self):
         if self.processor.df_processed is None:
@@ -1341,33 +1613,37 @@ class NSKRosterApp:
             defaultextension=".xlsx",
             filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv")]
         )
+        if not file_path:
+            return
+            
+        # Snapshot on the UI thread so edits made during the export don't race with it
+        df = self.processor.df_processed.copy()
         
-        if file_path:
-            self.progress.pack(side="right", padx=10)
-            self.progress.start()
+        def work(task):
+            # Remove serial number column before exporting
+            export_df = df.drop(columns=["#"], errors="ignore")
+            export_df = self.processor.format_date_headers(export_df)
+            task.progress(20)
             
-            try:
-                # Remove serial number column before exporting
-                export_df = self.processor.df_processed.drop(columns=["#"], errors="ignore")
-                export_df = self.processor.format_date_headers(export_df)
-                
-                if file_path.endswith('.csv'):
-                    export_df.to_csv(file_path, index=False)
-                else:
-                    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                        export_df.to_excel(writer, index=False, sheet_name="Roster Data")
-                        effective_df = export_df[['EMP ID', 'Roster Begin Date', 'Pattern Code']].copy()
-                        effective_df.to_excel(writer, index=False, sheet_name="Effective Dates")
-                
-                self.status_var.set(f"Exported to {os.path.basename(file_path)}")
-                messagebox.showinfo("Export Success", f"File exported successfully to:\n{file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export file:\n{str(e)}")
-                self.status_var.set("Export failed")
-            finally:
-                self.progress.stop()
-                self.progress.pack_forget()
+            if file_path.endswith('.csv'):
+                export_df.to_csv(file_path, index=False)
+            else:
+                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+                    export_df.to_excel(writer, index=False, sheet_name="Roster Data")
+                    task.progress(70)
+                    effective_df = export_df[['EMP ID', 'Roster Begin Date', 'Pattern Code']].copy()
+                    effective_df.to_excel(writer, index=False, sheet_name="Effective Dates")
+            task.progress(100)
+            
+        def done(result):
+            self.status_var.set(f"Exported to {os.path.basename(file_path)}")
+            messagebox.showinfo("Export Success", f"File exported successfully to:\n{file_path}")
+            
+        def failed(e):
+            messagebox.showerror("Export Error", f"Failed to export file:\n{str(e)}")
+            self.status_var.set("Export failed")
+            
+        self.run_task(work, done, failed, "Exporting roster data...")
     
     def add_pattern_code(self):
         new_code = simpledialog.askstring(
@@ -1500,7 +1776,7 @@ class NSKRosterApp:
             
         for pattern, code in self.processor.pattern_mapping.items():
             confidence = self.processor.pattern_confidence.get(code, 0)
-            self.known_tree.insert("", "end", values=(pattern, code, confidence))
+            self.known_tree.insert("", "end", values=(pattern, code, round(confidence, 1)))
         
         # Update unknown patterns
         self.unknown_list.delete(0, tk.END)
@@ -1512,6 +1788,7 @@ class NSKRosterApp:
         manager.destroy()
 
 if __name__ == "__main__":
+    start_time = tm.perf_counter()
     try:
         root = ttk.Window(title="NSK's Roster Analyzer Pro", themename="darkly")
         root.resizable(True, True)
@@ -1520,6 +1797,7 @@ if __name__ == "__main__":
         root.configure(background='black')
         
         app = NSKRosterApp(root)
+        app.report_cold_start(start_time)
         root.mainloop()
         
     except Exception as e:
@@ -0,0 +1,60 @@
+import random
+
+class StarryBackground:
+    def __init__(self, canvas, width, height):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.stars = []
+        self.create_stars()
+        
+    def create_stars(self):
+        # Create stars with varying sizes and brightness
+        for _ in range(150):
+            x = random.randint(0, self.width)
+            y = random.randint(0, self.height)
+            size = random.uniform(0.5, 2)
+            brightness = random.uniform(0.3, 1.0)
+            twinkle_speed = random.uniform(0.005, 0.02)
+            
+            star = {
+                'x': x, 'y': y, 'size': size, 
+                'brightness': brightness, 'twinkle_speed': twinkle_speed,
+                'current_brightness': brightness, 'increasing': False
+            }
+            
+            # Create the star on canvas
+            star_id = self.canvas.create_oval(
+                x - size, y - size, x + size, y + size,
+                fill=self.get_star_color(brightness),
+                outline=""
+            )
+            star['id'] = star_id
+            self.stars.append(star)
+    
+    def get_star_color(self, brightness):
+        # Create star color based on brightness
+        r = g = b = int(255 * brightness)
+        return f"#{r:02x}{g:02x}{b:02x}"
+    
+    def update(self):
+        # Update stars (twinkle effect)
+        for star in self.stars:
+            # Update brightness
+            if star['increasing']:
+                star['current_brightness'] += star['twinkle_speed']
+                if star['current_brightness'] >= star['brightness']:
+                    star['current_brightness'] = star['brightness']
+                    star['increasing'] = False
+            else:
+                star['current_brightness'] -= star['twinkle_speed']
+                if star['current_brightness'] <= star['brightness'] * 0.5:
+                    star['current_brightness'] = star['brightness'] * 0.5
+                    star['increasing'] = True
+            
+            # Update star color
+            color = self.get_star_color(star['current_brightness'])
+            self.canvas.itemconfig(star['id'], fill=color)
+        
+        # Schedule next update
+        self.canvas.after(50, self.update)
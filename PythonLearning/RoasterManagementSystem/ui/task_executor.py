@@ -0,0 +1,135 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """Raised inside a running task once it has been cancelled"""
+
+
+class TaskHandle:
+    """Progress reporting and cancellation for one background task"""
+
+    def __init__(self, executor, name, on_progress=None):
+        self.name = name
+        self.executor = executor
+        self.on_progress = on_progress
+        self.future = None
+        self.on_cancel = None
+        self.last_percent = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Ask the task to stop at its next progress or cancellation check"""
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise TaskCancelled(self.name)
+
+    def progress(self, done, total=None, message=None):
+        """Report progress as done/total (or a 0-100 percentage when total is None).
+
+        Safe to call from the worker thread as often as a loop likes: only
+        whole-percent changes are forwarded to the UI. Raises TaskCancelled
+        if the task has been cancelled, so loops stop at their next report.
+        """
+        self.check_cancelled()
+        percent = done if total is None else (100 * done / total if total else 100)
+        percent = int(max(0, min(100, percent)))
+        if percent == self.last_percent and message is None:
+            return
+        self.last_percent = percent
+        if self.on_progress:
+            self.executor.post(self.on_progress, percent, message)
+
+
+class TaskExecutor:
+    """Runs long jobs on a worker thread pool and hands results back to Tk.
+
+    Worker threads never touch widgets: progress updates and completion
+    callbacks are queued and run on the Tk main thread by a root.after
+    poll loop that only runs while tasks are active.
+    """
+
+    def __init__(self, root, max_workers=2, poll_ms=50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roster-task")
+        self.callbacks = queue.Queue()
+        self.active = set()
+        self.polling = False
+
+    def submit(self, work, on_done=None, on_error=None, on_cancel=None, on_progress=None, name=None):
+        """Run work(task) on the pool, where task is the TaskHandle for progress/cancellation.
+
+        on_done(result), on_error(exception) and on_cancel() run on the Tk thread.
+        """
+        task = TaskHandle(self, name or getattr(work, "__name__", "task"), on_progress)
+        task.on_cancel = on_cancel
+
+        def run():
+            try:
+                task.check_cancelled()
+                result = work(task)
+                task.check_cancelled()
+            except TaskCancelled:
+                self.post(self._finish, task, on_cancel)
+            except Exception as e:
+                self.post(self._finish, task, on_error, e)
+            else:
+                self.post(self._finish, task, on_done, result)
+
+        self.active.add(task)
+        task.future = self.pool.submit(run)
+        self._start_polling()
+        return task
+
+    def post(self, callback, *args):
+        """Queue callback(*args) to run on the Tk thread"""
+        self.callbacks.put((callback, args))
+
+    def cancel_all(self):
+        for task in list(self.active):
+            task.cancel()
+
+    def shutdown(self):
+        self.cancel_all()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, task, callback, *args):
+        self.active.discard(task)
+        if callback:
+            callback(*args)
+
+    def _start_polling(self):
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                callback, args = self.callbacks.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Task callback failed: {e}")
+
+        # A task cancelled before it started never runs, so it has to be finished here
+        for task in list(self.active):
+            if task.future.cancelled():
+                self._finish(task, task.on_cancel)
+
+        if self.active or not self.callbacks.empty():
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self.polling = False
@@ -0,0 +1,257 @@
+class VirtualGrid:
+    """Virtualized rows for a ttk.Treeview showing a DataFrame.
+
+    Only as many Treeview items as fit in the widget are created. That pool
+    of items is re-bound to a new window of rows whenever the view scrolls,
+    so rendering costs the window height rather than the roster size. The
+    grid owns the vertical scrollbar, keeps an item -> row label mapping for
+    the items on screen and keeps checkbox and selection state by row label,
+    so it survives recycling.
+    """
+
+    CHECKED = "☑"
+    UNCHECKED = "☐"
+
+    def __init__(self, tree, scrollbar, row_height=28):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.columns = []          # Data columns, shown after the checkbox and serial number
+        self.column_positions = {}
+        self.labels = []           # Row labels in display order
+        self.positions = {}        # Row label -> display position
+        self.rows = []             # Row values in display order
+        self.row_tags = {}         # Row label -> extra item tags
+        self.checked = set()       # Row labels with a ticked checkbox
+        self.selected = set()      # Row labels selected in the tree
+        self.top = 0               # Display position of the first pooled item
+        self.pool = []             # Recycled Treeview item ids
+        self.item_rows = {}        # Item id -> row label
+
+        self.tree.tag_configure("evenrow", background='#111111')
+        self.tree.tag_configure("oddrow", background='black')
+
+        scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", lambda e: self.render(), add="+")
+        tree.bind("<MouseWheel>", self.on_mousewheel)
+        tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        tree.bind("<Button-5>", lambda e: self.scroll(3))
+        tree.bind("<Up>", lambda e: self.on_arrow_key(-1))
+        tree.bind("<Down>", lambda e: self.on_arrow_key(1))
+        tree.bind("<Prior>", lambda e: self.scroll(-self.visible_count()))
+        tree.bind("<Next>", lambda e: self.scroll(self.visible_count()))
+        tree.bind("<<TreeviewSelect>>", self.on_select, add="+")
+
+    def set_frame(self, df):
+        """Show a new version of the frame, keeping the scroll position, checkboxes and selection where possible"""
+        self.columns = list(df.columns)
+        self.column_positions = {col: i for i, col in enumerate(self.columns)}
+        self.labels = list(df.index)
+        self.positions = {label: pos for pos, label in enumerate(self.labels)}
+        self.rows = df.to_numpy(dtype=object).tolist()
+        self.render()
+
+    def reset(self):
+        """Forget checkboxes, selection, row tags and scroll position, e.g. before showing another file"""
+        self.checked.clear()
+        self.selected.clear()
+        self.row_tags = {}
+        self.top = 0
+
+    def append_rows(self, df):
+        """Add rows after the current ones (same columns), e.g. while a file is still loading"""
+        start = len(self.labels)
+        self.labels.extend(df.index)
+        self.positions.update((label, start + i) for i, label in enumerate(df.index))
+        self.rows.extend(df[self.columns].to_numpy(dtype=object).tolist())
+        self.render()
+
+    def visible_count(self):
+        """Number of rows that fit in the widget below the heading"""
+        height = self.tree.winfo_height()
+        if height <= 1:  # Not mapped yet
+            return int(self.tree.cget("height"))
+        return max(1, height // self.row_height - 1)
+
+    def _resize_pool(self, size):
+        while len(self.pool) < size:
+            item = self.tree.insert("", "end")
+            self.pool.append(item)
+        while len(self.pool) > size:
+            item = self.pool.pop()
+            self.item_rows.pop(item, None)
+            self.tree.delete(item)
+
+    def row_values(self, pos):
+        label = self.labels[pos]
+        check = self.CHECKED if label in self.checked else self.UNCHECKED
+        return [check, pos + 1] + self.rows[pos]
+
+    def row_tags_for(self, pos):
+        # Extra tags (shift colours) replace the stripe: when tags set the same option,
+        # Treeview lets the one created first win, and the stripe tags are created here
+        extra = tuple(self.row_tags.get(self.labels[pos], ()))
+        if extra:
+            return extra
+        return ("evenrow" if pos % 2 == 0 else "oddrow",)
+
+    def render(self):
+        """Bind the item pool to the rows at the current scroll position"""
+        total = len(self.labels)
+        size = min(self.visible_count(), total)
+        self._resize_pool(size)
+        self.top = max(0, min(self.top, total - size))
+
+        for offset, item in enumerate(self.pool):
+            pos = self.top + offset
+            self.tree.item(item, values=self.row_values(pos), tags=self.row_tags_for(pos))
+            self.item_rows[item] = self.labels[pos]
+
+        self.tree.selection_set([item for item in self.pool if self.item_rows[item] in self.selected])
+        if total:
+            self.scrollbar.set(self.top / total, (self.top + size) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def render_rows(self, labels):
+        """Re-draw just these rows, if they are on screen"""
+        for label in labels:
+            item = self.item_for_label(label, scroll=False)
+            if item:
+                pos = self.positions[label]
+                self.tree.item(item, values=self.row_values(pos), tags=self.row_tags_for(pos))
+
+    def scroll(self, delta):
+        self.top += delta
+        self.render()
+        return "break"
+
+    def yview(self, *args):
+        """Scrollbar command: moveto fraction, or scroll n units/pages"""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.labels))
+            self.render()
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.visible_count()
+            self.scroll(step)
+
+    def on_mousewheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def on_arrow_key(self, step):
+        """Scroll the window when keyboard navigation runs off the first or last pooled item"""
+        if not self.pool:
+            return None
+        edge = self.pool[0] if step < 0 else self.pool[-1]
+        if self.tree.focus() != edge:
+            return None  # Let the Treeview move within the pool
+        pos = self.positions[self.item_rows[edge]] + step
+        if not 0 <= pos < len(self.labels):
+            return "break"
+        self.selected = {self.labels[pos]}
+        self.scroll(step)
+        self.tree.focus(edge)
+        return "break"
+
+    def on_select(self, event=None):
+        on_screen = set(self.item_rows.values())
+        chosen = {self.item_rows[item] for item in self.tree.selection() if item in self.item_rows}
+        self.selected = (self.selected - on_screen) | chosen
+
+    def row_label(self, item):
+        """Row label of the frame row an item currently shows"""
+        return self.item_rows[item]
+
+    def item_for_label(self, label, scroll=True):
+        """Item showing a row, scrolling it into view first unless scroll is False"""
+        pos = self.positions.get(label)
+        if pos is None:
+            return None
+        if not self.top <= pos < self.top + len(self.pool):
+            if not scroll:
+                return None
+            if pos < self.top:
+                self.top = pos
+            else:
+                self.top = pos - len(self.pool) + 1
+            self.render()
+        return self.pool[pos - self.top]
+
+    def next_label(self, label, step=1):
+        """Label of the row step positions after (or before) label, or None"""
+        pos = self.positions.get(label)
+        if pos is None or not 0 <= pos + step < len(self.labels):
+            return None
+        return self.labels[pos + step]
+
+    def selected_labels(self):
+        """Selected row labels in display order"""
+        return sorted((label for label in self.selected if label in self.positions),
+                      key=self.positions.get)
+
+    def value(self, label, column):
+        return self.rows[self.positions[label]][self.column_positions[column]]
+
+    def set_value(self, label, column, value):
+        """Update one cell in place, touching the widget only if the row is on screen"""
+        pos = self.positions.get(label)
+        if pos is None or column not in self.column_positions:
+            return
+        self.rows[pos][self.column_positions[column]] = value
+        item = self.item_for_label(label, scroll=False)
+        if item:
+            self.tree.set(item, column, value)
+
+    @staticmethod
+    def _same(a, b):
+        try:
+            return bool(a is b or a == b or (a != a and b != b))  # NaN equals NaN here
+        except (TypeError, ValueError):
+            return False
+
+    def refresh_rows(self, df, labels):
+        """Re-read the given rows from df and apply only the cells that changed.
+
+        Costs the number of rows passed in, not the frame size. Returns the
+        changed cells as (row label, column) pairs.
+        """
+        labels = [label for label in dict.fromkeys(labels) if label in self.positions and label in df.index]
+        columns = [col for col in self.columns if col in df.columns]
+        if not labels or not columns:
+            return []
+
+        changed = []
+        fresh_rows = df.loc[labels, columns].to_numpy(dtype=object)
+        for label, fresh in zip(labels, fresh_rows):
+            row = self.rows[self.positions[label]]
+            item = self.item_for_label(label, scroll=False)
+            for col, value in zip(columns, fresh):
+                col_pos = self.column_positions[col]
+                if self._same(row[col_pos], value):
+                    continue
+                row[col_pos] = value
+                changed.append((label, col))
+                if item:
+                    self.tree.set(item, col, value)
+        return changed
+
+    def toggle_checked(self, label):
+        if label in self.checked:
+            self.checked.discard(label)
+        else:
+            self.checked.add(label)
+        self.render_rows([label])
+
+    def set_all_checked(self, checked):
+        if checked:
+            self.checked.update(self.labels)
+        else:
+            self.checked.difference_update(self.labels)
+        self.render()
+
+    def set_row_tags(self, row_tags):
+        """Replace the extra per-row tags (row label -> tag tuple) and re-draw"""
+        self.row_tags = row_tags
+        self.render()